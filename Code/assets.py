@@ -0,0 +1,315 @@
+"""
+Author: Agilan Hariharan
+Description: Shared asset cache for Graveyard Shift
+Creation Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+# Import and Initialize
+import threading
+import time
+import pygame
+from collections import OrderedDict
+from audio import load_sound
+
+
+class AssetCache:
+    """
+    Class representing a bounded cache of loaded images, fonts and sounds.
+    """
+    def __init__(self, max_entries=128):
+        """
+        Initialize the AssetCache object.
+        """
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        # Files decoded ahead of time by a Preloader, if one was attached
+        self.preloader = None
+        # Images baked offline by bake.py, if a bake was found
+        self.baked = None
+
+    def get(self, key, loader):
+        """
+        Return the cached value for key, calling loader() to create it on a miss.
+        """
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+
+        self.misses += 1
+        value = loader()
+        self.entries[key] = value
+        # Evict the least recently used entries once the cache is full
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return value
+
+    def image(self, path, size=None, alpha=False):
+        """
+        Return an image converted to the display format and optionally scaled.
+        Each size is a separate cached variant. Baked variants are used as they
+        are, variants the preloader already scaled are only converted, and
+        others are scaled from the single decoded copy of the source file.
+        """
+        def load():
+            if size is not None and not alpha and self.baked:
+                baked = self.baked.image(path, size)
+                if baked is not None:
+                    return baked
+            if size is not None:
+                variant = self.preloaded(("image", path, size))
+                if variant is not None:
+                    return variant.convert_alpha() if alpha else variant.convert()
+                return pygame.transform.scale(self.image(path, None, alpha), size)
+            image = self.preloaded(("image", path))
+            if image is None:
+                image = pygame.image.load(path)
+            return image.convert_alpha() if alpha else image.convert()
+
+        return self.get(("image", path, size, alpha), load)
+
+    def font(self, path, size):
+        """
+        Return a font object for the given file (or None for the default font) and size.
+        """
+        return self.get(("font", path, size), lambda: pygame.font.Font(path, size))
+
+    def sound(self, path):
+        """
+        Return a decoded sound shared by every caller.
+        """
+        def load():
+            sound = self.preloaded(("sound", path))
+            return sound if sound is not None else load_sound(path)
+
+        return self.get(("sound", path), load)
+
+    def preloaded(self, key):
+        """
+        Return the file decoded by the preloader for key, waiting for it if it is
+        still queued. Returns None if the preloader does not handle the file.
+        """
+        return self.preloader.wait(key) if self.preloader else None
+
+    def clear(self):
+        """
+        Drop every cached asset and reset the counters.
+        """
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """
+        Return a dictionary with the cache size and hit/miss counters.
+        """
+        total = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+class Preloader:
+    """
+    Class representing a background thread that decodes asset files before they are needed.
+
+    The thread only decodes and scales files. Converting images to the display
+    format and caching them still happens on the main thread, in AssetCache.
+    """
+    def __init__(self):
+        """
+        Initialize the Preloader object.
+        """
+        self.jobs = []
+        self.done = {}
+        self.results = {}
+        self.errors = {}
+        self.seconds = {}
+        self.thread = None
+        self.started = None
+        self.finished = None
+
+    def add_image(self, path, sizes=()):
+        """
+        Queue an image file to be decoded, or to be decoded once and scaled to
+        each of the given sizes.
+        """
+        if not sizes:
+            self.add(("image", path), lambda: pygame.image.load(path))
+            return
+
+        decoded = []
+
+        def scaled(size):
+            if not decoded:
+                decoded.append(pygame.image.load(path))
+            return pygame.transform.scale(decoded[0], size)
+
+        for size in sizes:
+            self.add(("image", path, size), lambda size=size: scaled(size))
+
+    def add_sound(self, path):
+        """
+        Queue a sound file to be decoded. The mixer must already be initialized.
+        """
+        self.add(("sound", path), lambda: load_sound(path))
+
+    def add(self, key, loader):
+        """
+        Queue loader() to be run for key. Jobs must be added before start().
+        """
+        if key not in self.done:
+            self.done[key] = threading.Event()
+            self.jobs.append((key, loader))
+
+    def start(self):
+        """
+        Start decoding the queued files on a daemon thread.
+        """
+        self.started = time.perf_counter()
+        self.thread = threading.Thread(target=self.run, name="asset-preloader", daemon=True)
+        self.thread.start()
+
+    def run(self):
+        """
+        Decode every queued file in order, recording how long each one took.
+        """
+        for key, loader in self.jobs:
+            start = time.perf_counter()
+            try:
+                self.results[key] = loader()
+            except (pygame.error, OSError) as error:
+                # The main thread loads the file itself and reports the error
+                self.errors[key] = error
+            self.seconds[key] = time.perf_counter() - start
+            self.done[key].set()
+        self.finished = time.perf_counter()
+
+    def ready(self, key=None):
+        """
+        Check if a file, or every queued file when key is None, has been decoded.
+        """
+        if key is None:
+            return self.finished is not None
+        event = self.done.get(key)
+        return event is None or event.is_set()
+
+    def wait(self, key, timeout=None):
+        """
+        Block until the file for key is decoded and hand it over. Returns None if
+        the file was never queued, failed to decode, or was already handed over.
+        """
+        event = self.done.get(key)
+        if event is None or self.thread is None:
+            return None
+        event.wait(timeout)
+        return self.results.pop(key, None)
+
+
+class TextCache:
+    """
+    Class representing a memory-capped cache of rendered text surfaces.
+    """
+    def __init__(self, max_bytes=4 * 1024 * 1024):
+        """
+        Initialize the TextCache object.
+        """
+        self.max_bytes = max_bytes
+        self.bytes_used = 0
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, key):
+        """
+        Return the cached surface for key, or None on a miss.
+        """
+        surface = self.entries.get(key)
+        if surface is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return surface
+
+    def store(self, key, surface):
+        """
+        Cache a surface, evicting the least recently used ones to stay under the cap.
+        """
+        self.entries[key] = surface
+        self.bytes_used += surface.get_width() * surface.get_height() * surface.get_bytesize()
+        while self.bytes_used > self.max_bytes and len(self.entries) > 1:
+            _, evicted = self.entries.popitem(last=False)
+            self.bytes_used -= evicted.get_width() * evicted.get_height() * evicted.get_bytesize()
+        return surface
+
+    def render(self, font_path, size, string, color, antialias=True):
+        """
+        Return the rendered surface for a string, rendering it only on a miss.
+        """
+        key = (font_path, size, string, tuple(color), antialias)
+        surface = self.lookup(key)
+        if surface is None:
+            surface = self.store(key, assets.font(font_path, size).render(string, antialias, color))
+        return surface
+
+    def prebuild_digits(self, font_path, size, color, antialias=True):
+        """
+        Render the digit glyphs ahead of time so counters never hit the font renderer.
+        """
+        for digit in "-0123456789":
+            self.render(font_path, size, digit, color, antialias)
+
+    def number(self, font_path, size, prefix, value, color, antialias=True):
+        """
+        Return a surface showing prefix followed by value, composed from the cached
+        prefix and digit glyphs instead of rendering the whole string.
+        """
+        key = ("number", font_path, size, prefix, value, tuple(color), antialias)
+        surface = self.lookup(key)
+        if surface is not None:
+            return surface
+
+        pieces = [self.render(font_path, size, prefix, color, antialias)] if prefix else []
+        pieces += [self.render(font_path, size, digit, color, antialias) for digit in str(value)]
+        width = sum(piece.get_width() for piece in pieces)
+        height = max(piece.get_height() for piece in pieces)
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        x = 0
+        for piece in pieces:
+            surface.blit(piece, (x, 0))
+            x += piece.get_width()
+        return self.store(key, surface)
+
+    def invalidate(self, font_path=None):
+        """
+        Drop cached text for one font file, or everything when font_path is None.
+        """
+        for key in list(self.entries):
+            font_key = key[1] if key[0] == "number" else key[0]
+            if font_path is None or font_key == font_path:
+                surface = self.entries.pop(key)
+                self.bytes_used -= surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def stats(self):
+        """
+        Return a dictionary with the cache size and hit/miss counters.
+        """
+        return {
+            "entries": len(self.entries),
+            "bytes_used": self.bytes_used,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# Shared caches used by every module of the game
+assets = AssetCache()
+text = TextCache()
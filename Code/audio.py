@@ -0,0 +1,172 @@
+"""
+Author: Agilan Hariharan
+Description: Sound effect playback with a decoded sample cache and voice limits for Graveyard Shift
+Creation Date: October 18, 2026
+Last Modified: October 18, 2026
+
+MP3 files are decoded once into WAV files under AUDIO_CACHE_DIR, in the
+mixer's own sample format, so later runs skip the MP3 decoder. Playback goes
+through a fixed pool of channels. Each sound has a voice limit and a
+priority; when the pool is full a new sound takes the channel of an older,
+less important one instead of stacking on top of it.
+"""
+# Import and Initialize
+import os
+import time
+import wave
+import pygame
+
+AUDIO_CACHE_DIR = os.environ.get("GS_AUDIO_CACHE", os.path.join("Sounds", "cache"))
+CHANNELS = 8
+
+
+def cached_path(path, cache_dir=AUDIO_CACHE_DIR):
+    """
+    Return where the decoded copy of a sound file lives for the current mixer format.
+    """
+    frequency, size, channels = pygame.mixer.get_init()
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(cache_dir, f"{name}-{frequency}-{abs(size)}-{channels}.wav")
+
+
+def load_sound(path, cache_dir=AUDIO_CACHE_DIR):
+    """
+    Return a Sound for path, decoding an MP3 only if no up-to-date WAV copy is cached.
+    """
+    if not path.lower().endswith(".mp3"):
+        return pygame.mixer.Sound(path)
+
+    frequency, size, channels = pygame.mixer.get_init()
+    cache = cached_path(path, cache_dir)
+    if os.path.exists(cache) and os.path.getmtime(cache) >= os.path.getmtime(path):
+        return pygame.mixer.Sound(cache)
+
+    sound = pygame.mixer.Sound(path)
+    # The wave module only writes integer PCM, so float mixers skip the cache
+    if size in (8, -16, -32):
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with wave.open(cache, "wb") as wav_file:
+                wav_file.setnchannels(channels)
+                wav_file.setsampwidth(abs(size) // 8)
+                wav_file.setframerate(frequency)
+                wav_file.writeframes(sound.get_raw())
+        except OSError:
+            # A read-only install still plays, it just decodes every time
+            pass
+    return sound
+
+
+class AudioEngine:
+    """
+    Class representing a bank of named sound effects played through a fixed channel pool.
+    """
+    def __init__(self, channels=CHANNELS, loader=load_sound):
+        """
+        Initialize the AudioEngine object. loader(path) returns a Sound; it can be
+        replaced to share sounds with another cache.
+        """
+        self.num_channels = channels
+        self.loader = loader
+        self.preloader = None
+        self.settings = {}
+        self.samples = {}
+        self.channels = []
+        self.voices = []
+        self.dropped = 0
+        self.stolen = 0
+
+    def register(self, name, path, max_voices=1, priority=0, volume=1.0):
+        """
+        Describe a sound effect. Nothing is loaded until it is first played.
+        """
+        self.settings[name] = {"path": path, "max_voices": max_voices, "priority": priority, "volume": volume}
+
+    def sample(self, name):
+        """
+        Return the Sound for a registered name, loading it on first use. Returns
+        None while the preloader is still decoding it, so callers never wait.
+        """
+        sound = self.samples.get(name)
+        if sound is None:
+            path = self.settings[name]["path"]
+            if self.preloader is not None and not self.preloader.ready(("sound", path)):
+                return None
+            sound = self.samples[name] = self.loader(path)
+            sound.set_volume(self.settings[name]["volume"])
+        return sound
+
+    def open_channels(self):
+        """
+        Reserve the channel pool the first time a sound is played.
+        """
+        if pygame.mixer.get_num_channels() < self.num_channels:
+            pygame.mixer.set_num_channels(self.num_channels)
+        self.channels = [pygame.mixer.Channel(i) for i in range(self.num_channels)]
+        self.voices = [None] * self.num_channels
+
+    def pick_channel(self, name, priority, max_voices):
+        """
+        Return the index of the channel a new voice should use, or None to drop it.
+        """
+        free = None
+        same = []
+        weakest = None
+        for index, channel in enumerate(self.channels):
+            voice = self.voices[index]
+            if voice is None or not channel.get_busy():
+                if free is None:
+                    free = index
+                continue
+            voice_name, voice_priority, started = voice
+            if voice_name == name:
+                same.append((started, index))
+            if voice_priority <= priority and (weakest is None or (voice_priority, started) < weakest[:2]):
+                weakest = (voice_priority, started, index)
+
+        # A sound at its voice limit restarts its oldest voice
+        if len(same) >= max_voices:
+            self.stolen += 1
+            return min(same)[1]
+        if free is not None:
+            return free
+        if weakest is not None:
+            self.stolen += 1
+            return weakest[2]
+        return None
+
+    def play(self, name):
+        """
+        Start a registered sound without blocking. Returns the Channel, or None if
+        the sound was dropped.
+        """
+        if not pygame.mixer.get_init():
+            return None
+        sound = self.sample(name)
+        if sound is None:
+            self.dropped += 1
+            return None
+        if not self.channels:
+            self.open_channels()
+
+        settings = self.settings[name]
+        index = self.pick_channel(name, settings["priority"], settings["max_voices"])
+        if index is None:
+            self.dropped += 1
+            return None
+        channel = self.channels[index]
+        channel.play(sound)
+        self.voices[index] = (name, settings["priority"], time.perf_counter())
+        return channel
+
+    def stop(self):
+        """
+        Silence every channel in the pool.
+        """
+        for channel in self.channels:
+            channel.stop()
+        self.voices = [None] * len(self.channels)
+
+
+# Shared engine used by every module of the game
+audio = AudioEngine()
@@ -0,0 +1,243 @@
+"""
+Author: Agilan Hariharan
+Description: Offline image baking and texture atlas for Graveyard Shift
+Creation Date: October 18, 2026
+Last Modified: October 18, 2026
+
+The bake step decodes every image the game draws, scales it to each size it
+is drawn at and converts it to the display's pixel format. Small images are
+packed into one atlas. The pixels are written raw into a single blob, with a
+JSON manifest of where each image and atlas region is.
+
+At startup BakedImages reads each image's pixels straight from the blob into
+the memory of a display-format surface, so no PNG or JPEG is decoded, scaled
+or converted. Tiles are subsurfaces of the one atlas surface. An image whose
+source file changed after the bake is left out and loaded the normal way, and
+a bake made for a display with another pixel format is not used at all.
+
+Set GS_BAKED to use another directory than Images/baked.
+
+Usage:
+    python Code/bake.py
+    python Code/bake.py --out build/baked
+"""
+# Import and Initialize
+import argparse
+import json
+import os
+import time
+import pygame
+
+BAKED_DIR = os.environ.get("GS_BAKED", os.path.join("Images", "baked"))
+MANIFEST = "manifest.json"
+BLOB = "pixels.raw"
+VERSION = 1
+
+# Images no larger than this on either side are packed into the atlas
+ATLAS_TILE_LIMIT = 64
+ATLAS_WIDTH = 256
+# Images start on cache-line boundaries in the blob
+ALIGN = 64
+
+# pygame.image.tobytes format strings for 32-bit layouts, by (red, green, blue) mask
+FORMATS = {
+    (0xFF0000, 0xFF00, 0xFF): "BGRA",
+    (0xFF, 0xFF00, 0xFF0000): "RGBA",
+}
+
+
+def variant_key(path, size):
+    """
+    Return the manifest name of an image scaled to size.
+    """
+    return f"{path}@{size[0]}x{size[1]}"
+
+
+def game_images():
+    """
+    Return the (path, size) of every image variant the game draws.
+    """
+    from sprites import BACKGROUND_IMAGE, LEVEL_IMAGES, screen_size
+    images = [(BACKGROUND_IMAGE, screen_size)]
+    images += [(path, size) for path, sizes in LEVEL_IMAGES.items() for size in sizes]
+    return images
+
+
+def pixel_format(surface):
+    """
+    Return the tobytes format string that matches a 32-bit surface's memory layout.
+    """
+    masks = tuple(surface.get_masks()[:3])
+    if surface.get_bitsize() != 32 or masks not in FORMATS:
+        raise ValueError(f"Cannot bake for a {surface.get_bitsize()}-bit display with masks {masks}")
+    return FORMATS[masks]
+
+
+def pack_shelves(sizes, width=ATLAS_WIDTH):
+    """
+    Place rectangles of the given sizes on shelves of a fixed-width atlas,
+    tallest first. Returns their (x, y) positions in input order and the atlas height.
+    """
+    positions = [None] * len(sizes)
+    x = y = shelf_height = 0
+    for index in sorted(range(len(sizes)), key=lambda i: -sizes[i][1]):
+        w, h = sizes[index]
+        if x + w > width:
+            x = 0
+            y += shelf_height
+            shelf_height = 0
+        positions[index] = (x, y)
+        x += w
+        shelf_height = max(shelf_height, h)
+    return positions, y + shelf_height
+
+
+def bake(images, out_dir=BAKED_DIR):
+    """
+    Bake (path, size) image variants into out_dir and return the manifest.
+    A display must be open so images can be converted to its format.
+    """
+    display = pygame.display.get_surface()
+    pixel_layout = pixel_format(display)
+    scaled = {}
+    for path, size in images:
+        size = tuple(size)
+        key = variant_key(path, size)
+        if key not in scaled:
+            scaled[key] = (path, pygame.transform.scale(pygame.image.load(path), size).convert())
+
+    tiles = [key for key, (_, surface) in scaled.items() if max(surface.get_size()) <= ATLAS_TILE_LIMIT]
+    positions, atlas_height = pack_shelves([scaled[key][1].get_size() for key in tiles])
+    regions = {}
+    atlas = None
+    if tiles:
+        atlas = pygame.Surface((ATLAS_WIDTH, atlas_height)).convert()
+        atlas.fill((0, 0, 0))
+        for key, position in zip(tiles, positions):
+            surface = scaled[key][1]
+            atlas.blit(surface, position)
+            regions[key] = list(position) + list(surface.get_size())
+
+    os.makedirs(out_dir, exist_ok=True)
+    entries = {}
+    sources = {}
+
+    def write(blob, surface):
+        blob.write(bytes(-blob.tell() % ALIGN))
+        entry = {"offset": blob.tell(), "size": list(surface.get_size())}
+        blob.write(pygame.image.tobytes(surface, pixel_layout))
+        return entry
+
+    with open(os.path.join(out_dir, BLOB), "wb") as blob:
+        for key, (path, surface) in scaled.items():
+            sources[path] = os.path.getmtime(path)
+            if key not in regions:
+                entries[key] = write(blob, surface)
+        atlas_entry = write(blob, atlas) if atlas else None
+    if atlas_entry:
+        atlas_entry["regions"] = regions
+
+    manifest = {"version": VERSION, "format": pixel_layout, "images": entries, "atlas": atlas_entry, "sources": sources}
+    with open(os.path.join(out_dir, MANIFEST), "w") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2)
+    return manifest
+
+
+class BakedImages:
+    """
+    Class representing baked images read straight from the raw pixel blob.
+    """
+    def __init__(self, directory=BAKED_DIR):
+        """
+        Initialize the BakedImages object. A display must be open. Raises
+        OSError or ValueError if the bake is missing, was made for another
+        version or does not match the display's pixel format.
+        """
+        with open(os.path.join(directory, MANIFEST)) as manifest_file:
+            manifest = json.load(manifest_file)
+        if manifest.get("version") != VERSION:
+            raise ValueError(f"Baked images in {directory} are from another version")
+        display = pygame.display.get_surface()
+        if display is None or pixel_format(display) != manifest["format"]:
+            raise ValueError(f"Baked images in {directory} were made for another pixel format")
+        self.manifest = manifest
+        self.blob_path = os.path.join(directory, BLOB)
+        self.surfaces = {}
+        self.atlas = None
+        # Sources edited since the bake are loaded from the original file instead
+        self.stale = {path for path, mtime in manifest["sources"].items()
+                      if not os.path.exists(path) or os.path.getmtime(path) > mtime}
+
+    def wrap(self, entry):
+        """
+        Return a display-format Surface holding the pixels of a blob entry.
+        """
+        surface = pygame.Surface(entry["size"], 0, pygame.display.get_surface())
+        # The bake wrote the pixels in the display's own byte layout, so they
+        # are read into the surface's memory as they are
+        with open(self.blob_path, "rb") as blob:
+            blob.seek(entry["offset"])
+            blob.readinto(surface.get_view("0"))
+        return surface
+
+    def has(self, path, size):
+        """
+        Check if an up-to-date baked copy of an image variant exists.
+        """
+        key = variant_key(path, size)
+        atlas = self.manifest["atlas"]
+        return path not in self.stale and (key in self.manifest["images"] or (atlas and key in atlas["regions"]))
+
+    def image(self, path, size):
+        """
+        Return the baked Surface for an image variant, or None if it was not baked.
+        Atlas tiles are subsurfaces of the shared atlas surface.
+        """
+        if size is None or not self.has(path, size):
+            return None
+        key = variant_key(path, tuple(size))
+        surface = self.surfaces.get(key)
+        if surface is None:
+            entry = self.manifest["images"].get(key)
+            if entry is not None:
+                surface = self.wrap(entry)
+            else:
+                if self.atlas is None:
+                    self.atlas = self.wrap(self.manifest["atlas"])
+                surface = self.atlas.subsurface(self.manifest["atlas"]["regions"][key])
+            self.surfaces[key] = surface
+        return surface
+
+
+def load_baked(directory=BAKED_DIR):
+    """
+    Return the BakedImages in directory, or None if nothing usable was baked there.
+    """
+    try:
+        return BakedImages(directory)
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def main(argv=None):
+    """
+    Bake the game's images from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Bake Graveyard Shift images into a raw blob and atlas.")
+    parser.add_argument("--out", default=BAKED_DIR, help="output directory")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    # Only the pixel format of the display is needed
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    start = time.perf_counter()
+    manifest = bake(game_images(), args.out)
+    elapsed = time.perf_counter() - start
+    atlas = manifest["atlas"]
+    print(f"{len(manifest['images'])} images and {len(atlas['regions']) if atlas else 0} atlas tiles "
+          f"baked as {manifest['format']} into {args.out} in {elapsed:.2f}s")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
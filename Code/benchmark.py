@@ -0,0 +1,267 @@
+"""
+Author: Agilan Hariharan
+Description: Benchmarks for the rendering, movement and spawning hot paths
+Creation Date: October 18, 2026
+Last Modified: October 18, 2026
+
+Runs under SDL's dummy video and audio drivers, so no window or sound card
+is needed. Every benchmark is repeated for each grid size and spike count
+and reports median, p95 and p99 times plus bytes allocated per call.
+
+Usage:
+    python Code/benchmark.py --output baseline.json
+    python Code/benchmark.py --compare baseline.json --threshold 0.15
+"""
+# Import and Initialize
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import platform
+import random
+import time
+import tracemalloc
+import pygame
+pygame.init()
+
+import levels
+from collision import CollisionGrid
+from core import DIRECTIONS, ManualClock
+from solver import DistanceField
+from sprites import Maze, screen_size
+
+GRID_SIZES = [(32, 22), (128, 128), (512, 512), (1024, 1024)]
+SPIKE_COUNTS = [5, 50, 500]
+ALLOCATION_RUNS = 3
+
+
+def percentile(sorted_samples, fraction):
+    """
+    Return the nearest-rank percentile of an already sorted list.
+    """
+    index = min(len(sorted_samples) - 1, max(0, int(round(fraction * len(sorted_samples))) - 1))
+    return sorted_samples[index]
+
+
+def measure(function, iterations, setup=None):
+    """
+    Time function() over the given number of iterations, calling setup() untimed
+    before each one, then measure its allocations in a few traced runs.
+    """
+    samples = []
+    for _ in range(iterations):
+        if setup:
+            setup()
+        start = time.perf_counter_ns()
+        function()
+        samples.append(time.perf_counter_ns() - start)
+    samples.sort()
+
+    allocated = 0
+    tracemalloc.start()
+    for _ in range(ALLOCATION_RUNS):
+        if setup:
+            setup()
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+        allocated += peak - before
+    tracemalloc.stop()
+
+    return {
+        "iterations": iterations,
+        "median_us": percentile(samples, 0.50) / 1000,
+        "p95_us": percentile(samples, 0.95) / 1000,
+        "p99_us": percentile(samples, 0.99) / 1000,
+        "alloc_bytes": allocated // ALLOCATION_RUNS,
+    }
+
+
+def make_maze(width, height, num_spikes):
+    """
+    Build a Maze on a generated level of the given size, driven by a manual clock.
+    """
+    level = f"bench-{width}x{height}-{num_spikes}"
+    levels.GENERATED_LEVELS[level] = {
+        "algorithm": "kruskal", "width": width, "height": height, "seed": 1,
+        "num_spikes": num_spikes,
+        # Spawning is triggered explicitly by the benchmarks
+        "spawn_interval": 10 ** 9,
+    }
+    clock = ManualClock()
+    return Maze(level, clock=clock, rng=random.Random(1)), clock
+
+
+def clear_spikes(maze):
+    """
+    Remove every spike from the maze.
+    """
+    for position in list(maze.spikes):
+        maze.remove_spike(position)
+    maze.spike_expiry.clear()
+
+
+def open_direction(maze):
+    """
+    Return a direction the player can step in and the one that steps back.
+    """
+    opposite = {"left": "right", "right": "left", "up": "down", "down": "up"}
+    x, y = maze.player_position
+    for direction, (dx, dy) in DIRECTIONS.items():
+        if maze.maze[y + dy][x + dx] == levels.EMPTY:
+            return direction, opposite[direction]
+    raise RuntimeError("The player has nowhere to move")
+
+
+def bench_case(width, height, num_spikes, iterations):
+    """
+    Run every benchmark for one grid size and spike count.
+    """
+    maze, clock = make_maze(width, height, num_spikes)
+    timer = maze.timer
+    results = {}
+
+    def spawn():
+        clear_spikes(maze)
+        maze.generate_spikes()
+
+    # Rendering: one full redraw of the static layer, then steady-state frames
+    results["render_full"] = measure(lambda: maze.render(timer), max(3, iterations // 20), setup=maze.invalidate)
+    spawn()
+    maze.render(timer)
+    results["render"] = measure(lambda: maze.render(timer), iterations)
+
+    # Updating: half the calls expire a wave of spikes and half do nothing
+    def expire_setup():
+        if not maze.spikes:
+            spawn()
+        clock.advance(maze.spikes_duration // 2)
+    results["update"] = measure(lambda: maze.update(timer), iterations, setup=expire_setup)
+
+    clear_spikes(maze)
+    forward, back = open_direction(maze)
+    moves = [forward, back]
+    results["move_player"] = measure(lambda: maze.move_player(moves[maze.moves % 2]), iterations)
+
+    results["generate_spikes"] = measure(maze.generate_spikes, iterations, setup=lambda: clear_spikes(maze))
+
+    # The frame on which a wave spawns: the new spikes are placed and checked
+    # against the player's route while the previous wave expires
+    wave_maze, wave_clock = make_maze(width, height, num_spikes)
+    wave_maze.spikes_spawn_interval = wave_maze.spikes_duration
+    results["spike_wave"] = measure(lambda: wave_maze.update(wave_maze.timer), iterations,
+                                    setup=lambda: wave_clock.advance(wave_maze.spikes_duration))
+
+    def fresh_grid():
+        maze.maze = maze.generate_maze(maze.level)
+        maze.paths = DistanceField(maze.maze)
+        maze.collision = CollisionGrid(maze.maze, maze.brick_size)
+    results["remove_walls_instantly"] = measure(maze.remove_walls_instantly, max(3, iterations // 20), setup=fresh_grid)
+
+    # A full frame of the game loop in main.py
+    frame_maze, frame_clock = make_maze(width, height, num_spikes)
+    frame_maze.spikes_spawn_interval = 500
+
+    def frame():
+        frame_clock.advance(16)
+        frame_maze.timer.update()
+        frame_maze.update(frame_maze.timer)
+        pygame.display.update(frame_maze.render(frame_maze.timer))
+    frame_maze.render(frame_maze.timer)
+    results["frame"] = measure(frame, iterations)
+    return results
+
+
+def run(sizes, spike_counts, iterations):
+    """
+    Run the whole suite and return the results as a dictionary.
+    """
+    pygame.display.set_mode(screen_size)
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "iterations": iterations,
+        },
+        "results": {},
+    }
+    for width, height in sizes:
+        # Bigger grids get fewer iterations so the suite stays quick
+        scaled = max(5, iterations * 704 // (width * height)) if width * height > 704 else iterations
+        for num_spikes in spike_counts:
+            # Skip spike counts that would not fit in the free cells of a small grid
+            if num_spikes > width * height // 4:
+                continue
+            case = f"{width}x{height}/{num_spikes}"
+            for name, result in bench_case(width, height, num_spikes, scaled).items():
+                report["results"][f"{name}@{case}"] = result
+    return report
+
+
+def compare(report, baseline, threshold):
+    """
+    Return the benchmarks whose median got slower than the baseline by more than threshold.
+    """
+    regressions = []
+    for key, result in report["results"].items():
+        old = baseline["results"].get(key)
+        if old and old["median_us"] > 0:
+            change = result["median_us"] / old["median_us"] - 1
+            if change > threshold:
+                regressions.append((key, old["median_us"], result["median_us"], change))
+    return regressions
+
+
+def print_report(report):
+    """
+    Print the results as a table.
+    """
+    print(f"{'benchmark':<44}{'median us':>12}{'p95 us':>12}{'p99 us':>12}{'alloc B':>12}")
+    for key, result in report["results"].items():
+        print(f"{key:<44}{result['median_us']:>12.1f}{result['p95_us']:>12.1f}{result['p99_us']:>12.1f}{result['alloc_bytes']:>12}")
+
+
+def parse_size(text):
+    """
+    Parse a WIDTHxHEIGHT grid size.
+    """
+    width, _, height = text.partition("x")
+    return int(width), int(height)
+
+
+def main(argv=None):
+    """
+    Run the benchmarks from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the Graveyard Shift hot paths.")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--sizes", nargs="+", type=parse_size, default=GRID_SIZES, help="grid sizes such as 32x22")
+    parser.add_argument("--spikes", nargs="+", type=int, default=SPIKE_COUNTS)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.15, help="allowed slowdown of the median, as a fraction")
+    args = parser.parse_args(argv)
+
+    report = run(args.sizes, args.spikes, args.iterations)
+    print_report(report)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare(report, baseline, args.threshold)
+        for key, old, new, change in regressions:
+            print(f"REGRESSION {key}: {old:.1f} us -> {new:.1f} us (+{change:.0%})")
+        if regressions:
+            raise SystemExit(1)
+        print("No regressions against", args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Author: Agilan Hariharan
+Description: Tile-grid collision queries for Graveyard Shift
+Creation Date: October 18, 2026
+Last Modified: October 18, 2026
+
+CollisionGrid answers every "what is here" question straight from the tile
+grid, so a query only looks at the few tiles it overlaps, however many walls
+the maze has. The tile stepper in GameCore uses the tile queries; pixel
+movement uses the rectangle queries and sweep(), which slides a box along
+walls one axis at a time. Anything outside the grid counts as a wall.
+
+Rectangles are any object with x, y, width and height in pixels, such as a
+pygame.Rect; nothing here needs a display.
+"""
+# Import and Initialize
+from levels import WALL, SPIKE
+
+# Tiles that stop movement
+SOLID = frozenset((WALL,))
+# Tiles that end the level when touched
+HAZARDS = frozenset((SPIKE,))
+
+
+class CollisionGrid:
+    """
+    Class representing collision queries over a maze grid, which it reads in place.
+    """
+    def __init__(self, grid, tile_size=1):
+        """
+        Initialize the CollisionGrid object. tile_size is the side of a tile in
+        pixels for the rectangle queries.
+        """
+        self.grid = grid
+        self.width = len(grid[0])
+        self.height = len(grid)
+        self.tile_size = tile_size
+
+    def tile_at(self, x, y):
+        """
+        Return the tile at grid position (x, y), or WALL outside the grid.
+        """
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.grid[y][x]
+        return WALL
+
+    def solid(self, x, y):
+        """
+        Check if the tile at (x, y) stops movement.
+        """
+        return self.tile_at(x, y) in SOLID
+
+    def hazard(self, x, y):
+        """
+        Check if the tile at (x, y) is a hazard such as a spike.
+        """
+        return self.tile_at(x, y) in HAZARDS
+
+    def step(self, x, y, dx, dy):
+        """
+        Return the position one step from (x, y) and the tile found there.
+        """
+        new_x, new_y = x + dx, y + dy
+        return new_x, new_y, self.tile_at(new_x, new_y)
+
+    def tile_of_point(self, px, py):
+        """
+        Return the grid position of the tile under the pixel (px, py).
+        """
+        return px // self.tile_size, py // self.tile_size
+
+    def point_solid(self, px, py):
+        """
+        Check if the pixel (px, py) lies inside a solid tile.
+        """
+        return self.solid(*self.tile_of_point(px, py))
+
+    def rect_tiles(self, rect):
+        """
+        Yield the grid position of every tile a rectangle overlaps.
+        """
+        size = self.tile_size
+        for y in range(rect.y // size, (rect.y + rect.height - 1) // size + 1):
+            for x in range(rect.x // size, (rect.x + rect.width - 1) // size + 1):
+                yield x, y
+
+    def rect_solid(self, rect):
+        """
+        Check if a rectangle overlaps any solid tile.
+        """
+        return any(self.tile_at(x, y) in SOLID for x, y in self.rect_tiles(rect))
+
+    def rect_hazards(self, rect):
+        """
+        Return the grid positions of the hazards a rectangle overlaps.
+        """
+        return [(x, y) for x, y in self.rect_tiles(rect) if self.tile_at(x, y) in HAZARDS]
+
+    def sweep_axis(self, start, length, across_start, across_length, delta, horizontal):
+        """
+        Move a box edge along one axis by delta pixels, stopping at the first
+        solid tile in the way. Returns the new start and whether it was stopped.
+        """
+        size = self.tile_size
+        first_across = across_start // size
+        last_across = (across_start + across_length - 1) // size
+
+        def blocked(line):
+            for across in range(first_across, last_across + 1):
+                tile = self.tile_at(line, across) if horizontal else self.tile_at(across, line)
+                if tile in SOLID:
+                    return True
+            return False
+
+        # Only the tile lines the leading edge enters are checked, nearest first
+        if delta > 0:
+            end = start + length
+            for line in range((end - 1) // size + 1, (end + delta - 1) // size + 1):
+                if blocked(line):
+                    return line * size - length, True
+        else:
+            for line in range(start // size - 1, (start + delta) // size - 1, -1):
+                if blocked(line):
+                    return (line + 1) * size, True
+        return start + delta, False
+
+    def sweep(self, rect, dx, dy):
+        """
+        Move a rectangle by (dx, dy) pixels, sliding along any wall it meets.
+        Moves horizontally first, then vertically. Returns the new (x, y) and
+        whether the horizontal and vertical moves were stopped.
+        """
+        x, y = rect.x, rect.y
+        hit_x = hit_y = False
+        if dx:
+            x, hit_x = self.sweep_axis(x, rect.width, y, rect.height, dx, True)
+        if dy:
+            y, hit_y = self.sweep_axis(y, rect.height, x, rect.width, dy, False)
+        return x, y, hit_x, hit_y
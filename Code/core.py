@@ -0,0 +1,356 @@
+"""
+Author: Agilan Hariharan
+Description: Display-free game rules for Graveyard Shift
+Creation Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+# Import and Initialize
+import random
+import time
+from functools import lru_cache
+from collision import CollisionGrid
+from grid import empty_cells, remove_walls
+from hazards import ExpiryQueue, FreeCells
+from levels import EMPTY, EXIT, PLAYER, SPIKE, load_level_data
+from solver import DistanceField
+
+# Grid offsets for each movement direction
+DIRECTIONS = {
+    "left": (-1, 0),
+    "right": (1, 0),
+    "up": (0, -1),
+    "down": (0, 1),
+}
+
+
+NS_PER_MS = 1000000
+# Fastest a game clock may run compared to real time
+MAX_TIME_SCALE = 100
+
+
+@lru_cache(maxsize=64)
+def starting_paths(level_data):
+    """
+    Return the DistanceField of a level's starting grid. Every game of the
+    level copies it instead of searching the same grid again.
+    """
+    return DistanceField(level_data.grid())
+
+
+class GameClock:
+    """
+    Class representing the game's monotonic clock, counted in nanoseconds.
+
+    Calling the clock returns whole milliseconds, which is what the rules read.
+    Game time follows a real-time source multiplied by a time scale, and stands
+    still while paused. A manual clock ignores the source and only moves when
+    advanced, so simulations and tests can step through a level at any speed.
+    """
+    def __init__(self, start=0, scale=1.0, manual=False, source=time.perf_counter_ns):
+        """
+        Initialize the GameClock object. start is in milliseconds and source
+        returns real time in nanoseconds.
+        """
+        self.source = source
+        self.manual = manual
+        self.paused = False
+        self.scale = 1.0
+        # Game time is measured from the last anchor, so changing the scale
+        # never adds rounding error to time that has already passed
+        self.anchor_time = start * NS_PER_MS
+        self.anchor_real = source()
+        self.set_scale(scale)
+
+    def now_ns(self):
+        """
+        Return the current game time in nanoseconds.
+        """
+        if self.manual or self.paused:
+            return self.anchor_time
+        return self.anchor_time + int((self.source() - self.anchor_real) * self.scale)
+
+    def __call__(self):
+        """
+        Return the current game time in milliseconds.
+        """
+        return self.now_ns() // NS_PER_MS
+
+    @property
+    def now(self):
+        """
+        Return the current game time in milliseconds.
+        """
+        return self.now_ns() // NS_PER_MS
+
+    @now.setter
+    def now(self, milliseconds):
+        """
+        Jump to a game time in milliseconds.
+        """
+        self.anchor_time = milliseconds * NS_PER_MS
+        self.anchor_real = self.source()
+
+    def rebase(self):
+        """
+        Fold the time passed since the last anchor into a new one.
+        """
+        self.anchor_time = self.now_ns()
+        self.anchor_real = self.source()
+
+    def advance(self, milliseconds):
+        """
+        Move the clock forward by the given number of milliseconds.
+        """
+        self.anchor_time += milliseconds * NS_PER_MS
+
+    def advance_ns(self, nanoseconds):
+        """
+        Move the clock forward by the given number of nanoseconds.
+        """
+        self.anchor_time += nanoseconds
+
+    def set_scale(self, scale):
+        """
+        Run game time at scale times real time, from 0 (frozen) to MAX_TIME_SCALE.
+        """
+        if not 0 <= scale <= MAX_TIME_SCALE:
+            raise ValueError(f"Time scale must be between 0 and {MAX_TIME_SCALE}, not {scale}")
+        self.rebase()
+        self.scale = scale
+
+    def pause(self):
+        """
+        Stop game time until resume() is called.
+        """
+        if not self.paused:
+            self.rebase()
+            self.paused = True
+
+    def resume(self):
+        """
+        Let game time run again after pause(), without counting the time spent paused.
+        """
+        if self.paused:
+            self.anchor_real = self.source()
+            self.paused = False
+
+
+class ManualClock(GameClock):
+    """
+    Class representing a game clock that only moves when advanced.
+    """
+    def __init__(self, start=0):
+        """
+        Initialize the ManualClock object at start milliseconds.
+        """
+        super().__init__(start, manual=True)
+
+    def __call__(self):
+        """
+        Return the current time in milliseconds.
+        """
+        return self.anchor_time // NS_PER_MS
+
+
+class Countdown:
+    """
+    Class representing the level timer, counting down whole seconds.
+    """
+    def __init__(self, clock, initial_time=45):
+        """
+        Initialize the Countdown object.
+        """
+        self.clock = clock
+        self.time_left = initial_time
+        self.last_time_update = clock()
+
+    def update(self):
+        """
+        Update the timer and decrement time left once for every whole second
+        that has passed. The leftover milliseconds carry over to the next second.
+        """
+        elapsed = self.clock() - self.last_time_update
+        if elapsed >= 1000:
+            seconds = elapsed // 1000
+            self.time_left -= seconds
+            self.last_time_update += seconds * 1000
+
+    def time_up(self):
+        """
+        Check if the time has run out.
+        """
+        return self.time_left <= 0
+
+    def reset(self, initial_time=45):
+        """
+        Restart the countdown from the given number of seconds.
+        """
+        self.time_left = initial_time
+        self.last_time_update = self.clock()
+
+
+class GameCore:
+    """
+    Class representing the rules of one level: grid, player, spikes and timer.
+    """
+    def __init__(self, current_level, clock, rng=None, timer=None, backend="list"):
+        """
+        Initialize the game state. clock is a callable returning milliseconds,
+        rng is a random.Random instance used for every spike placement and
+        backend selects how the grid is stored (see grid.py).
+        """
+        self.level = current_level
+        self.backend = backend
+        self.clock = clock
+        self.rng = rng if rng is not None else random.Random()
+
+        self.level_data = load_level_data(current_level)
+        settings = self.level_data.settings
+        # The countdown reads the same clock as the spikes, so pausing or
+        # scaling the clock affects both alike
+        self.timer = timer if timer is not None else Countdown(clock)
+        self.timer.clock = clock
+        self.timer.reset(settings["time_limit"])
+
+        self.maze = self.generate_maze(current_level)
+        self.paths = starting_paths(self.level_data).copy(self.maze)
+        self.collision = CollisionGrid(self.maze)
+        self.player_position = self.level_data.position_of(PLAYER) or (1, 1)
+        self.dest_reached = False
+        self.dest_unreached = False
+        # The spike the player ran into, if that is how the level ended
+        self.death_position = None
+        self.moves = 0
+
+        # Empty cells are indexed for O(1) random picks and spikes are expired
+        # from a heap ordered by due time
+        self.free_cells = FreeCells(empty_cells(self.maze))
+        self.spikes = {}
+        self.spike_expiry = ExpiryQueue()
+        self.num_spikes = settings["num_spikes"]
+        self.spawn_spikes_timer = clock()
+        self.spikes_spawn_interval = settings["spawn_interval"]  # milliseconds
+        self.spikes_duration = settings["spike_duration"]  # milliseconds
+
+    def generate_maze(self, current_level):
+        """
+        Generate the maze layout based on the current level.
+        """
+        return self.level_data.grid(self.backend)
+
+    @property
+    def outcome(self):
+        """
+        Return "win", "spike" or "timeout" once the level is over, otherwise None.
+        """
+        if self.dest_reached:
+            return "win"
+        if self.dest_unreached:
+            return "spike"
+        if self.timer.time_up():
+            return "timeout"
+        return None
+
+    def generate_spikes(self):
+        """
+        Generate spikes in empty positions of the maze based on the current level.
+        A spike that would cut the player off from the exit is taken back and
+        another position is drawn instead.
+        """
+        # Only spikes on one open path from the player need checking
+        route = self.paths.route(*self.player_position)
+        rejected = []
+        placed = 0
+        while placed < self.num_spikes and self.free_cells:
+            x, y = self.free_cells.pop_random(self.rng)
+            if self.place_spike(x, y, route):
+                placed += 1
+            else:
+                rejected.append((x, y))
+        for position in rejected:
+            self.free_cells.add(position)
+
+    def place_spike(self, x, y, route=None):
+        """
+        Put a spike at (x, y). Returns False, leaving the grid unchanged, if the
+        spike sits on route and no way around it is found.
+        """
+        self.maze[y][x] = SPIKE
+        self.paths.cell_changed(x, y)
+        if route is not None and not route.avoid(x, y):
+            self.maze[y][x] = EMPTY
+            self.paths.cell_changed(x, y)
+            return False
+        self.add_spike(x, y)
+        return True
+
+    def add_spike(self, x, y):
+        """
+        Record a spike spawned at grid position (x, y) and schedule its expiry.
+        """
+        spawn_time = self.clock()
+        self.spikes[(x, y)] = spawn_time
+        self.spike_expiry.push(spawn_time + self.spikes_duration, (x, y))
+
+    def remove_spike(self, position):
+        """
+        Remove an expired spike and give its cell back to the free-cell index.
+        """
+        del self.spikes[position]
+        x, y = position
+        if self.maze[y][x] == SPIKE:
+            self.maze[y][x] = EMPTY
+            self.paths.cell_changed(x, y)
+            self.free_cells.add(position)
+
+    def update(self):
+        """
+        Advance the timer, spawn new spikes and expire old ones.
+        """
+        current_time = self.clock()
+        self.timer.update()
+
+        # Spawn a wave of spikes every spawn interval
+        if current_time - self.spawn_spikes_timer >= self.spikes_spawn_interval:
+            self.generate_spikes()
+            self.spawn_spikes_timer = current_time
+
+        # Only spikes that are due are touched
+        for position in self.spike_expiry.pop_due(current_time):
+            if position in self.spikes:
+                self.remove_spike(position)
+
+    def move_player(self, direction):
+        """
+        Move the player in the specified direction within the maze.
+        """
+        if direction not in DIRECTIONS:
+            return
+        if not self.dest_reached or self.dest_unreached:
+            x, y = self.player_position
+            new_x, new_y, block = self.collision.step(x, y, *DIRECTIONS[direction])
+            self.moves += 1
+
+            # Tiles outside the grid read as walls, so the player stays put
+            if block == EMPTY:
+                self.maze[new_y][new_x] = PLAYER
+                self.maze[y][x] = EMPTY
+                self.player_position = (new_x, new_y)
+                self.free_cells.discard((new_x, new_y))
+                self.free_cells.add((x, y))
+            elif block == EXIT:
+                # Player reached block "2", remove all walls instantly
+                self.remove_walls_instantly()
+                self.dest_reached = True
+            elif block == SPIKE:
+                self.death_position = (new_x, new_y)
+                self.remove_walls_instantly()
+                self.dest_unreached = True
+
+    def remove_walls_instantly(self):
+        """
+        Remove all walls in the maze instantly.
+        """
+        remove_walls(self.maze)
+        self.paths.invalidate()
+        self.free_cells = FreeCells(empty_cells(self.maze))
@@ -0,0 +1,340 @@
+"""
+Author: Agilan Hariharan
+Description: Monte Carlo difficulty analysis of Graveyard Shift levels
+Creation Date: October 18, 2026
+Last Modified: October 18, 2026
+
+Plays many seeded spike schedules of each level with a player that follows
+the shortest path to the exit (re-planning around spikes every move), and
+with a noisy player that makes a random move some of the time. Games are
+split into chunks and spread over a process pool. For every level, spike
+setting and policy it reports the win probability, the distribution of the
+time taken to reach the exit and the cells where players die most, and can
+write those cells as a heatmap PNG.
+
+Game i of every level, setting and policy uses spike seed seed + i, so the
+rows of the report are compared on the same spike schedules.
+
+Usage:
+    python Code/difficulty.py
+    python Code/difficulty.py 1 3 --games 5000 --noise 0.2 --heatmaps heatmaps
+    python Code/difficulty.py 2 --spikes 5 10 20 --time-limit 30 45
+    python Code/difficulty.py --generate 200 --games 200 --policies noisy
+"""
+# Import and Initialize
+import argparse
+import math
+import multiprocessing
+import os
+import random
+import re
+import struct
+import time
+import zlib
+from collections import Counter
+import levels
+from core import DIRECTIONS, GameCore, ManualClock
+from levels import WALL, EXIT, PLAYER, load_level_data
+from mazegen import ALGORITHMS
+
+DIRECTION_NAMES = list(DIRECTIONS)
+POLICIES = ("optimal", "noisy")
+LEVEL_FILE = re.compile(r"level(.+)\.lv[bl]$")
+
+# Games handed to a worker at a time
+CHUNK_SIZE = 250
+# Pixels per tile in heatmap images
+HEATMAP_SCALE = 12
+HEATMAP_COLOURS = {WALL: (48, 48, 48), EXIT: (0, 160, 60), PLAYER: (40, 90, 220)}
+
+
+def optimal_policy(game, rng, noise):
+    """
+    Take the next step of a shortest path to the exit, or wait while spikes block every path.
+    """
+    return game.paths.next_step(*game.player_position)
+
+
+def noisy_policy(game, rng, noise):
+    """
+    Follow the shortest path, but move in a random direction with probability noise.
+    """
+    if rng.random() < noise:
+        return rng.choice(DIRECTION_NAMES)
+    return game.paths.next_step(*game.player_position)
+
+
+POLICY_FUNCTIONS = {"optimal": optimal_policy, "noisy": noisy_policy}
+
+
+def play_game(level, seed, policy, noise, overrides, move_ms):
+    """
+    Play one game to the end and return the finished GameCore.
+    """
+    clock = ManualClock()
+    rng = random.Random(f"policy-{seed}")
+    game = GameCore(level, clock, rng=random.Random(seed))
+    if "num_spikes" in overrides:
+        game.num_spikes = overrides["num_spikes"]
+    if "time_limit" in overrides:
+        game.timer.reset(overrides["time_limit"])
+
+    while game.outcome is None:
+        direction = policy(game, rng, noise)
+        if direction is not None:
+            game.move_player(direction)
+            if game.outcome is not None:
+                break
+        clock.advance(move_ms)
+        game.update()
+    return game
+
+
+def run_chunk(task):
+    """
+    Play one chunk of games in a worker and return its counts.
+    """
+    key, level, policy_name, noise, overrides, first_seed, games, move_ms = task
+    policy = POLICY_FUNCTIONS[policy_name]
+    outcomes = Counter()
+    exit_times = []
+    deaths = Counter()
+    for seed in range(first_seed, first_seed + games):
+        game = play_game(level, seed, policy, noise, overrides, move_ms)
+        outcomes[game.outcome] += 1
+        if game.outcome == "win":
+            exit_times.append(game.clock())
+        elif game.death_position is not None:
+            deaths[game.death_position] += 1
+    return key, games, outcomes, exit_times, deaths
+
+
+def init_worker(level_dir, generated):
+    """
+    Give a worker process the same level sources as the parent.
+    """
+    levels.LEVEL_DIR = level_dir
+    levels.GENERATED_LEVELS.update(generated)
+
+
+def find_levels(level_dir):
+    """
+    Return the names of every level file in level_dir, numbers first.
+    """
+    names = set()
+    for file_name in os.listdir(level_dir):
+        match = LEVEL_FILE.match(file_name)
+        if match:
+            name = match.group(1)
+            names.add(int(name) if name.isdigit() else name)
+    return sorted(names, key=lambda name: (isinstance(name, str), str(name).zfill(8)))
+
+
+def percentile(values, fraction):
+    """
+    Return the value below which the given fraction of a sorted list falls.
+    """
+    if not values:
+        return None
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+class LevelReport:
+    """
+    Class representing the merged results for one level, setting and policy.
+    """
+    def __init__(self, level, policy, overrides):
+        """
+        Initialize the LevelReport object.
+        """
+        self.level = level
+        self.policy = policy
+        self.overrides = overrides
+        self.games = 0
+        self.outcomes = Counter()
+        self.exit_times = []
+        self.deaths = Counter()
+
+    def add(self, games, outcomes, exit_times, deaths):
+        """
+        Merge the counts of one finished chunk.
+        """
+        self.games += games
+        self.outcomes.update(outcomes)
+        self.exit_times.extend(exit_times)
+        self.deaths.update(deaths)
+
+    def win_probability(self):
+        """
+        Return the win rate and the half-width of its 95% confidence interval.
+        """
+        if not self.games:
+            return 0.0, 0.0
+        rate = self.outcomes["win"] / self.games
+        return rate, 1.96 * math.sqrt(rate * (1 - rate) / self.games)
+
+    def label(self):
+        """
+        Return a short name for the report, used in tables and file names.
+        """
+        parts = [f"level{self.level}", self.policy]
+        parts += [f"{name}{value}" for name, value in sorted(self.overrides.items())]
+        return "-".join(parts)
+
+    def lines(self, top=3):
+        """
+        Return the report as lines of text.
+        """
+        rate, margin = self.win_probability()
+        times = sorted(self.exit_times)
+        lines = [f"{self.label()}: {self.games} games, win {rate:.1%} +/- {margin:.1%}, "
+                 f"spiked {self.outcomes['spike'] / self.games:.1%}, timed out {self.outcomes['timeout'] / self.games:.1%}"]
+        if times:
+            quartiles = ", ".join(f"p{int(f * 100)} {percentile(times, f) / 1000:.1f}s" for f in (0.1, 0.5, 0.9))
+            lines.append(f"    time to exit: {quartiles}, worst {times[-1] / 1000:.1f}s")
+        if self.deaths:
+            cells = ", ".join(f"{cell} x{count}" for cell, count in self.deaths.most_common(top))
+            lines.append(f"    deadliest cells: {cells}")
+        return lines
+
+
+def heatmap_rows(level_data, deaths, scale=HEATMAP_SCALE):
+    """
+    Return the RGB rows of a heatmap image of the deaths on each cell, with walls,
+    start and exit drawn in flat colours.
+    """
+    most = max(deaths.values(), default=0)
+    tiles = level_data.tile_bytes()
+    rows = []
+    for y in range(level_data.height):
+        row = bytearray()
+        for x in range(level_data.width):
+            tile = tiles[y * level_data.width + x]
+            count = deaths.get((x, y), 0)
+            if count:
+                # Dark red through yellow to white as deaths approach the maximum
+                heat = 3 * count / most
+                colour = (int(255 * min(1.0, 0.3 + heat)), int(255 * min(1.0, max(0.0, heat - 1))),
+                          int(255 * min(1.0, max(0.0, heat - 2))))
+            else:
+                colour = HEATMAP_COLOURS.get(tile, (0, 0, 0))
+            row.extend(bytes(colour) * scale)
+        rows.extend([bytes(row)] * scale)
+    return rows
+
+
+def write_png(path, width, height, rows):
+    """
+    Write 8-bit RGB rows to a PNG file using only the standard library.
+    """
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    raw = b"".join(b"\x00" + row for row in rows)
+    with open(path, "wb") as png_file:
+        png_file.write(b"\x89PNG\r\n\x1a\n")
+        png_file.write(chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)))
+        png_file.write(chunk(b"IDAT", zlib.compress(raw, 6)))
+        png_file.write(chunk(b"IEND", b""))
+
+
+def write_heatmap_image(path, level, deaths):
+    """
+    Write a PNG of a level with a mapping of (x, y) to death counts laid over it.
+    """
+    level_data = load_level_data(level)
+    rows = heatmap_rows(level_data, deaths)
+    write_png(path, level_data.width * HEATMAP_SCALE, level_data.height * HEATMAP_SCALE, rows)
+
+
+def write_heatmap(report, directory):
+    """
+    Write the death heatmap of a report into directory and return its path.
+    """
+    path = os.path.join(directory, f"{report.label()}.png")
+    write_heatmap_image(path, report.level, report.deaths)
+    return path
+
+
+def analyze(level_names, policies, settings, games, seed=0, noise=0.1, move_ms=250,
+            workers=None, level_dir=levels.LEVEL_DIR, generated=None):
+    """
+    Play every combination of level, spike setting and policy on a process pool
+    and return the list of LevelReports in that order.
+    """
+    generated = generated or {}
+    reports = {}
+    tasks = []
+    for level in level_names:
+        for overrides in settings:
+            for policy in policies:
+                key = len(reports)
+                reports[key] = LevelReport(level, policy, overrides)
+                for first in range(0, games, CHUNK_SIZE):
+                    count = min(CHUNK_SIZE, games - first)
+                    tasks.append((key, level, policy, noise, overrides, seed + first, count, move_ms))
+
+    # Chunks finish in any order; each one is merged into its report as it arrives
+    with multiprocessing.Pool(workers, initializer=init_worker, initargs=(level_dir, generated)) as pool:
+        for key, count, outcomes, exit_times, deaths in pool.imap_unordered(run_chunk, tasks):
+            reports[key].add(count, outcomes, exit_times, deaths)
+    return list(reports.values())
+
+
+def main(argv=None):
+    """
+    Parse the command line, run the analysis and print one report per level, setting and policy.
+    """
+    parser = argparse.ArgumentParser(description="Estimate how hard Graveyard Shift levels are.")
+    parser.add_argument("levels", nargs="*", help="level names (default: every level file in --level-dir)")
+    parser.add_argument("--level-dir", default=levels.LEVEL_DIR, help="directory of level files")
+    parser.add_argument("--generate", type=int, default=0, metavar="COUNT", help="also analyze COUNT generated mazes")
+    parser.add_argument("--algorithm", choices=ALGORITHMS, default="backtracker", help="algorithm of generated mazes")
+    parser.add_argument("--games", type=int, default=1000, help="games per level, setting and policy")
+    parser.add_argument("--seed", type=int, default=0, help="spike seed of the first game; game i uses seed + i")
+    parser.add_argument("--policies", nargs="+", choices=POLICIES, default=list(POLICIES))
+    parser.add_argument("--noise", type=float, default=0.1, help="chance of a random move for the noisy policy")
+    parser.add_argument("--move-ms", type=int, default=250, help="simulated milliseconds between moves")
+    parser.add_argument("--spikes", type=int, nargs="+", help="spikes per wave to try instead of the level's own")
+    parser.add_argument("--time-limit", type=int, nargs="+", help="time limits in seconds to try instead of the level's own")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--heatmaps", metavar="DIR", help="write a death heatmap PNG per report into DIR")
+    args = parser.parse_args(argv)
+    if args.games < 1:
+        parser.error("--games must be at least 1")
+
+    levels.LEVEL_DIR = args.level_dir
+    level_names = [int(name) if name.isdigit() else name for name in args.levels]
+    # Generated mazes are analyzed as well as the level files, never instead of them
+    if not level_names:
+        level_names = find_levels(args.level_dir)
+    generated = {}
+    for index in range(args.generate):
+        name = f"generated{index}"
+        generated[name] = {"algorithm": args.algorithm, "width": 32, "height": 22, "seed": index}
+        level_names.append(name)
+    levels.GENERATED_LEVELS.update(generated)
+
+    settings = [{}]
+    if args.spikes:
+        settings = [dict(overrides, num_spikes=count) for overrides in settings for count in args.spikes]
+    if args.time_limit:
+        settings = [dict(overrides, time_limit=limit) for overrides in settings for limit in args.time_limit]
+
+    start = time.perf_counter()
+    reports = analyze(level_names, args.policies, settings, args.games, args.seed, args.noise, args.move_ms,
+                      args.workers, args.level_dir, generated)
+    elapsed = time.perf_counter() - start
+
+    if args.heatmaps:
+        os.makedirs(args.heatmaps, exist_ok=True)
+    for report in reports:
+        print("\n".join(report.lines()))
+        if args.heatmaps:
+            write_heatmap(report, args.heatmaps)
+    total = sum(report.games for report in reports)
+    print(f"{total} games of {len(level_names)} levels in {elapsed:.2f}s ({total / elapsed:.0f} games/s)")
+
+
+if __name__ == "__main__":
+    main()
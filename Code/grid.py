@@ -0,0 +1,104 @@
+"""
+Author: Agilan Hariharan
+Description: Grid backends and bulk tile operations for Graveyard Shift
+Creation Date: October 18, 2026
+Last Modified: October 18, 2026
+
+A grid is indexed as grid[y][x] whatever the backend. The "list" backend is a
+Python list with one bytearray per row, so a tile reads back as an int; the
+"numpy" backend is a uint8 ndarray, whose rows are views, so
+grid[y][x] = tile still writes through. The helpers below pick a
+vectorized path when they get an ndarray.
+"""
+# Import and Initialize
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from levels import EMPTY, WALL
+
+BACKENDS = ("list", "numpy")
+
+
+def is_array(grid):
+    """
+    Check if the grid is stored as a NumPy array.
+    """
+    return np is not None and isinstance(grid, np.ndarray)
+
+
+def make_grid(rows, backend="list"):
+    """
+    Build a grid from rows of tile codes using the given backend.
+    """
+    if backend == "list":
+        return [bytearray(row) for row in rows]
+    if backend == "numpy":
+        if np is None:
+            raise RuntimeError("The numpy grid backend requires NumPy to be installed")
+        return np.array(rows, dtype=np.uint8)
+    raise ValueError(f"Unknown grid backend: {backend}")
+
+
+def grid_size(grid):
+    """
+    Return the (width, height) of the grid.
+    """
+    return len(grid[0]), len(grid)
+
+
+def empty_cells(grid):
+    """
+    Return a list of (x, y) positions whose tile is empty.
+    """
+    if is_array(grid):
+        ys, xs = np.nonzero(grid == EMPTY)
+        return list(zip(xs.tolist(), ys.tolist()))
+    return [(x, y) for y, row in enumerate(grid) for x, block in enumerate(row) if block == EMPTY]
+
+
+def replace_tiles(grid, old, new):
+    """
+    Replace every tile equal to old with new, in place.
+    """
+    if is_array(grid):
+        grid[grid == old] = new
+        return
+    for row in grid:
+        for x, block in enumerate(row):
+            if block == old:
+                row[x] = new
+
+
+def remove_walls(grid):
+    """
+    Turn every wall tile into an empty tile, in place.
+    """
+    replace_tiles(grid, WALL, EMPTY)
+
+
+def stamp(grid, positions, tile):
+    """
+    Set the tile at each (x, y) position, in place.
+    """
+    if is_array(grid) and positions:
+        xs, ys = zip(*positions)
+        grid[list(ys), list(xs)] = tile
+        return
+    for x, y in positions:
+        grid[y][x] = tile
+
+
+def count_tiles(grid):
+    """
+    Return a dictionary mapping each tile code present in the grid to its count.
+    """
+    if is_array(grid):
+        counts = np.bincount(grid.ravel())
+        return {tile: int(count) for tile, count in enumerate(counts) if count}
+    counts = {}
+    for row in grid:
+        for block in row:
+            counts[block] = counts.get(block, 0) + 1
+    return counts
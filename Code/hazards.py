@@ -0,0 +1,107 @@
+"""
+Author: Agilan Hariharan
+Description: Free-cell index and expiry queue for spike spawning in Graveyard Shift
+Creation Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+# Import and Initialize
+import heapq
+
+
+class FreeCells:
+    """
+    Class representing the set of empty cells, with O(1) add, remove and random pick.
+    """
+    def __init__(self, positions=()):
+        """
+        Initialize the FreeCells object from an iterable of (x, y) positions.
+        """
+        self.cells = list(dict.fromkeys(positions))
+        self.slots = dict(zip(self.cells, range(len(self.cells))))
+
+    def __len__(self):
+        """
+        Return the number of free cells.
+        """
+        return len(self.cells)
+
+    def __contains__(self, position):
+        """
+        Check if the position is free.
+        """
+        return position in self.slots
+
+    def add(self, position):
+        """
+        Mark a position as free.
+        """
+        if position not in self.slots:
+            self.slots[position] = len(self.cells)
+            self.cells.append(position)
+
+    def discard(self, position):
+        """
+        Mark a position as taken. The last cell fills the hole so removal is O(1).
+        """
+        slot = self.slots.pop(position, None)
+        if slot is None:
+            return
+        last = self.cells.pop()
+        if slot < len(self.cells):
+            self.cells[slot] = last
+            self.slots[last] = slot
+
+    def pop_random(self, rng):
+        """
+        Remove and return a random free position, or None if there are none.
+        """
+        if not self.cells:
+            return None
+        position = self.cells[rng.randrange(len(self.cells))]
+        self.discard(position)
+        return position
+
+
+class ExpiryQueue:
+    """
+    Class representing items that expire at given times, kept in a min-heap.
+    """
+    def __init__(self):
+        """
+        Initialize the ExpiryQueue object.
+        """
+        self.heap = []
+
+    def __len__(self):
+        """
+        Return the number of scheduled items.
+        """
+        return len(self.heap)
+
+    def push(self, due_time, item):
+        """
+        Schedule an item to expire at due_time.
+        """
+        heapq.heappush(self.heap, (due_time, item))
+
+    def next_due(self):
+        """
+        Return the time of the next expiry, or None if nothing is scheduled.
+        """
+        return self.heap[0][0] if self.heap else None
+
+    def pop_due(self, current_time):
+        """
+        Remove and return every item due at or before current_time, earliest first.
+        """
+        heap = self.heap
+        due = []
+        while heap and heap[0][0] <= current_time:
+            due.append(heapq.heappop(heap)[1])
+        return due
+
+    def clear(self):
+        """
+        Drop every scheduled item.
+        """
+        self.heap.clear()
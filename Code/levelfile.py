@@ -0,0 +1,256 @@
+"""
+Author: Agilan Hariharan
+Description: Text and binary level file formats for Graveyard Shift
+Creation Date: October 18, 2026
+Last Modified: October 18, 2026
+
+Text levels (.lvl) are for authoring: "key: value" settings, a "---" line,
+then one line of symbols per grid row. Binary levels (.lvb) are a fixed
+header followed by one byte per tile, and are memory-mapped when loaded.
+
+Usage:
+    python Code/levelfile.py compile Levels/level1.lvl Levels/level1.lvb
+    python Code/levelfile.py decompile Levels/level1.lvb Levels/level1.lvl
+"""
+# Import and Initialize
+import argparse
+import mmap
+import struct
+import zlib
+from grid import make_grid
+from levels import EMPTY, WALL, EXIT, PLAYER
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MAGIC = b"GSLV"
+VERSION = 1
+# magic, version, header size, width, height, num_spikes, spawn_interval,
+# spike_duration, time_limit, crc32 of the header (with this field zeroed) and tiles
+HEADER = struct.Struct("<4sHHIIIIIII")
+
+SYMBOLS = {EMPTY: ".", WALL: "#", EXIT: "E", PLAYER: "P"}
+TILES = {symbol: tile for tile, symbol in SYMBOLS.items()}
+
+DEFAULT_SETTINGS = {
+    "num_spikes": 10,
+    "spawn_interval": 5000,
+    "spike_duration": 2000,
+    "time_limit": 45,
+}
+
+
+class LevelData:
+    """
+    Class representing a level's tiles and spawn settings.
+    """
+    def __init__(self, width, height, tiles, settings=None, offset=0):
+        """
+        Initialize the LevelData object. tiles is any buffer holding width * height
+        tile bytes starting at offset (a bytearray, bytes or an mmap).
+        """
+        self.width = width
+        self.height = height
+        self.tiles = tiles
+        self.offset = offset
+        self.settings = dict(DEFAULT_SETTINGS)
+        if settings:
+            self.settings.update(settings)
+
+    def close(self):
+        """
+        Unmap the file the tiles were read from, if any. Grids built before
+        keep working; the LevelData itself must not be used afterwards.
+        """
+        if isinstance(self.tiles, mmap.mmap):
+            self.tiles.close()
+
+    def tile_bytes(self):
+        """
+        Return a zero-copy view of the tile bytes.
+        """
+        size = self.width * self.height
+        return memoryview(self.tiles)[self.offset:self.offset + size]
+
+    def position_of(self, tile):
+        """
+        Return the (x, y) position of the first tile of the given type, or None.
+        """
+        index = self.tiles.find(bytes([tile]), self.offset, self.offset + self.width * self.height)
+        if index < 0:
+            return None
+        return divmod(index - self.offset, self.width)[::-1]
+
+    def grid(self, backend="list"):
+        """
+        Build a mutable grid. The list backend uses one bytearray per row and the
+        numpy backend copies the tiles in one block, so no per-tile objects are made.
+        """
+        view = self.tile_bytes()
+        width = self.width
+        if backend == "list":
+            return [bytearray(view[y * width:(y + 1) * width]) for y in range(self.height)]
+        if backend == "numpy" and np is not None:
+            return np.frombuffer(view, dtype=np.uint8).reshape(self.height, width).copy()
+        return make_grid([view[y * width:(y + 1) * width] for y in range(self.height)], backend)
+
+
+def from_rows(rows, settings=None):
+    """
+    Build a LevelData from rows of tile codes.
+    """
+    width = len(rows[0])
+    tiles = bytearray()
+    for row in rows:
+        if len(row) != width:
+            raise ValueError("All level rows must have the same width")
+        tiles.extend(row)
+    return LevelData(width, len(rows), tiles, settings)
+
+
+def checksum(header, tiles):
+    """
+    Return the CRC32 of a packed header (checksum field zeroed) and the tiles.
+    """
+    return zlib.crc32(tiles, zlib.crc32(header)) & 0xFFFFFFFF
+
+
+def pack_header(level_data, crc=0):
+    """
+    Pack the binary header for a level.
+    """
+    settings = level_data.settings
+    return HEADER.pack(MAGIC, VERSION, HEADER.size, level_data.width, level_data.height,
+                       settings["num_spikes"], settings["spawn_interval"],
+                       settings["spike_duration"], settings["time_limit"], crc)
+
+
+def read_text(path):
+    """
+    Read a text level file.
+    """
+    settings = {}
+    rows = []
+    in_grid = False
+    with open(path) as level_file:
+        for number, line in enumerate(level_file, start=1):
+            line = line.rstrip("\n")
+            if not in_grid:
+                if line.strip() == "---":
+                    in_grid = True
+                elif line.strip() and not line.startswith("#"):
+                    key, _, value = line.partition(":")
+                    if key.strip() not in DEFAULT_SETTINGS:
+                        raise ValueError(f"{path}:{number}: unknown setting {key.strip()!r}")
+                    settings[key.strip()] = int(value)
+                continue
+            if not line:
+                continue
+            try:
+                rows.append([TILES[symbol] for symbol in line])
+            except KeyError as error:
+                raise ValueError(f"{path}:{number}: unknown tile symbol {error.args[0]!r}")
+    if not rows:
+        raise ValueError(f"{path}: level has no grid")
+    return from_rows(rows, settings)
+
+
+def write_text(level_data, path):
+    """
+    Write a level as a text file.
+    """
+    with open(path, "w") as level_file:
+        for key, value in level_data.settings.items():
+            level_file.write(f"{key}: {value}\n")
+        level_file.write("---\n")
+        view = level_data.tile_bytes()
+        width = level_data.width
+        for y in range(level_data.height):
+            level_file.write("".join(SYMBOLS[tile] for tile in view[y * width:(y + 1) * width]) + "\n")
+
+
+def write_binary(level_data, path):
+    """
+    Write a level as a binary file.
+    """
+    tiles = level_data.tile_bytes()
+    crc = checksum(pack_header(level_data), tiles)
+    with open(path, "wb") as level_file:
+        level_file.write(pack_header(level_data, crc))
+        level_file.write(tiles)
+
+
+def read_binary(path):
+    """
+    Memory-map a binary level file and check its header and checksum. The file
+    itself is closed at once; the map stays open until LevelData.close().
+    """
+    with open(path, "rb") as level_file:
+        data = mmap.mmap(level_file.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        return check_binary(path, data)
+    except ValueError:
+        data.close()
+        raise
+
+
+def check_binary(path, data):
+    """
+    Check the header and checksum of a mapped binary level and return its LevelData.
+    """
+    if len(data) < HEADER.size:
+        raise ValueError(f"{path}: file is too short to be a level")
+    fields = HEADER.unpack_from(data)
+    magic, version, header_size, width, height = fields[:5]
+    num_spikes, spawn_interval, spike_duration, time_limit, crc = fields[5:]
+    if magic != MAGIC:
+        raise ValueError(f"{path}: not a Graveyard Shift level file")
+    if version != VERSION:
+        raise ValueError(f"{path}: unsupported level version {version}")
+    if len(data) < header_size + width * height:
+        raise ValueError(f"{path}: tile data is truncated")
+
+    settings = {
+        "num_spikes": num_spikes,
+        "spawn_interval": spawn_interval,
+        "spike_duration": spike_duration,
+        "time_limit": time_limit,
+    }
+    level_data = LevelData(width, height, data, settings, offset=header_size)
+    if checksum(pack_header(level_data), level_data.tile_bytes()) != crc:
+        raise ValueError(f"{path}: checksum mismatch")
+    return level_data
+
+
+def read_level(path):
+    """
+    Read a level file in either format, chosen by its extension.
+    """
+    if path.endswith(".lvb"):
+        return read_binary(path)
+    return read_text(path)
+
+
+def main(argv=None):
+    """
+    Convert level files between the text and binary forms.
+    """
+    parser = argparse.ArgumentParser(description="Convert Graveyard Shift level files.")
+    parser.add_argument("command", choices=["compile", "decompile"])
+    parser.add_argument("source")
+    parser.add_argument("target")
+    args = parser.parse_args(argv)
+
+    level_data = read_level(args.source)
+    if args.command == "compile":
+        write_binary(level_data, args.target)
+    else:
+        write_text(level_data, args.target)
+    print(f"{args.source} -> {args.target} ({level_data.width}x{level_data.height})")
+    level_data.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Author: Agilan Hariharan
+Description: Level layouts and settings for Graveyard Shift
+Creation Date: October 18, 2026
+Last Modified: October 18, 2026
+"""
+# Import and Initialize
+import os
+
+# Tile codes used by every maze grid
+EMPTY = 0
+WALL = 1
+EXIT = 2
+PLAYER = 3
+SPIKE = 4
+
+# Level files live in LEVEL_DIR as level<n>.lvb (compiled) or level<n>.lvl (text)
+LEVEL_DIR = "Levels"
+
+# Levels built by the procedural generator instead of read from a file, e.g.
+#     GENERATED_LEVELS[4] = {"algorithm": "kruskal", "width": 33, "height": 23, "seed": 7, "num_spikes": 10}
+GENERATED_LEVELS = {}
+
+# LevelData already loaded, by level
+LOADED_LEVELS = {}
+
+
+def level_path(level):
+    """
+    Return the path of the file for the given level, preferring the compiled form.
+    """
+    for extension in (".lvb", ".lvl"):
+        path = os.path.join(LEVEL_DIR, f"level{level}{extension}")
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def load_level_data(level):
+    """
+    Return the LevelData (tiles and spawn settings) for the given level. The
+    result is shared, so callers copy the tiles out with LevelData.grid().
+    """
+    level_data = LOADED_LEVELS.get(level)
+    if level_data is None:
+        level_data = LOADED_LEVELS[level] = read_level_data(level)
+    return level_data
+
+
+def read_level_data(level):
+    """
+    Read or generate the LevelData for the given level.
+    """
+    # Imported here because both modules need the tile codes above
+    from levelfile import LevelData, read_level
+    from mazegen import generate
+
+    if level in GENERATED_LEVELS:
+        options = dict(GENERATED_LEVELS[level])
+        maze = generate(options.pop("width"), options.pop("height"), options.pop("algorithm", "backtracker"), options.pop("seed", None))
+        return LevelData(maze.width, maze.height, maze.tiles, options)
+
+    path = level_path(level)
+    if path is None:
+        raise ValueError(f"Unknown level: {level}")
+    return read_level(path)
+
+
+def unload_levels():
+    """
+    Forget every loaded level and close the level files mapped for them, so
+    the files can be replaced or deleted (Windows locks a mapped file).
+    """
+    for level_data in LOADED_LEVELS.values():
+        level_data.close()
+    LOADED_LEVELS.clear()
+
+
+def load_level(level):
+    """
+    Return a fresh, mutable copy of the grid for the given level.
+    """
+    return load_level_data(level).grid()
@@ -2,238 +2,102 @@
 Author: Agilan Hariharan
 Description: An Original Maze Game: Graveyard Shift
 Creation Date: January 08, 2024
-Last Modified: January 19, 2024
+Last Modified: October 18, 2026
 """
 
 # I - Import and Initialize - Start IDEA
+import time
+startup_start = time.perf_counter()
+
+import os
 import pygame
-from sprites import Character, Spikes, ScoreKeeper, HomeScreen, HowToPlayScreen, Maze
+from core import GameClock, ManualClock
+from sprites import ScoreKeeper, HomeScreen, HowToPlayScreen, BACKGROUND_IMAGE, LEVEL_IMAGES, LEVEL_SOUNDS
+from assets import assets, Preloader
+from bake import load_baked
+from audio import audio
+from presenter import from_environment as presenter_from_environment
+from profiler import StartupReport, export_from_environment, from_environment, startup_report_enabled
+from replay import save_from_environment
+from scenes import EndScene, HowToPlayScene, LevelScene, MenuScene, SceneManager
+from stats import open_from_environment
+startup = StartupReport(startup_start)
+startup.mark("imports")
 pygame.init()
 pygame.mixer.init()
 
 # D - Display configuration
 screen_width = 640
 screen_height = 480
-screen = pygame.display.set_mode((screen_width, screen_height))
+# Scenes draw into a fixed 640x480 framebuffer that is scaled to the window
+presenter = presenter_from_environment((screen_width, screen_height))
+screen = presenter.open()
 pygame.display.set_caption("Graveyard Shift")
-
-# E - Entities 
-background_image = pygame.image.load("Images/background_image.png").convert()
-background_image = pygame.transform.scale(background_image, (screen_width, screen_height))
-
-pygame.mixer.music.load("Sounds/background_music.mp3")
-pygame.mixer.music.play(-1)
-
-win_sound = pygame.mixer.Sound("Sounds/win_sound.mp3")
-lose_sound = pygame.mixer.Sound("Sounds/lose_sound.mp3")
+startup.mark("display")
+
+# E - Entities
+# Images baked by bake.py are read raw from disk. Everything else the
+# menu does not show is decoded on a background thread once the first frame is up
+assets.baked = load_baked()
+preloader = Preloader()
+for path, sizes in LEVEL_IMAGES.items():
+    sizes = [size for size in sizes if not (assets.baked and assets.baked.has(path, size))]
+    if sizes:
+        preloader.add_image(path, sizes)
+for path in LEVEL_SOUNDS:
+    preloader.add_sound(path)
+assets.preloader = preloader
+# Sound effects share the decoded sounds of the asset cache, and are skipped
+# rather than waited for while the preloader is still decoding them
+audio.loader = assets.sound
+audio.preloader = preloader
+
+background_image = assets.image(BACKGROUND_IMAGE, (screen_width, screen_height))
+
+try:
+    pygame.mixer.music.load("Sounds/background_music.mp3")
+    pygame.mixer.music.play(-1)
+except pygame.error:
+    # The game is playable without music
+    pass
 
 # A - Action (broken into ALTER steps)
 # A - Assign values to key variables
-clock = pygame.time.Clock()
-
-# Initialize game objects
-character = Character(20, 20)
-spikes = pygame.sprite.Group()
-timer = ScoreKeeper()
-how_to_play_screen = HowToPlayScreen(screen_width, screen_height)
-home_screen = HomeScreen(640, 700)
-maze = None
-
-# Main menu loop
-main_menu = True
-selected_level = None
-maze = None
-running = False
-
-def show_how_to_play_screen():
-    """
-    Display the How To Play screen.
-    """
-    how_to_play_screen = HowToPlayScreen(screen_width, screen_height)
-    running_how_to_play = True
-
-    # Shows Instructional Screen
-    while running_how_to_play:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running_how_to_play = False
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if how_to_play_screen.back_rect.collidepoint(event.pos):
-                    running_how_to_play = False
-
-        how_to_play_screen.draw(screen)
-        pygame.display.flip()
-
-while main_menu:
-    # Creates Main Menu Screen
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            main_menu = False
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            if home_screen.level1_rect.collidepoint(event.pos):
-                selected_level = 1
-                main_menu = False
-            elif home_screen.level2_rect.collidepoint(event.pos):
-                selected_level = 2
-                main_menu = False
-            elif home_screen.level3_rect.collidepoint(event.pos):
-                selected_level = 3
-                main_menu = False
-            elif home_screen.how_to_play_rect.collidepoint(event.pos):
-                show_how_to_play_screen()
-
-    home_screen.draw(screen)
-    pygame.display.flip()
-
-# If a level is selected, start the game loop
-if selected_level is not None:
-    running = True
-    current_level = selected_level
-
-    # Create an end rectangle to check if the player reached the destination
-    end_rect = pygame.Rect(700, 500, 30, 30)
-    maze = Maze(current_level)
-
-# Show the main menu after completing a level
-show_main_menu = False
+# Redraw at the display's refresh rate when pygame can report it; GS_FPS overrides
+FPS = int(os.environ.get("GS_FPS", "0")) or getattr(pygame.display, "get_current_refresh_rate", lambda: 0)() or 60
+profiler = from_environment()
+
+# The rules read the clock once per simulation step so a recording can replay it exactly.
+# The pace clock decides how many steps are due; GS_TIME_SCALE runs it faster or slower
+game_clock = ManualClock(pygame.time.get_ticks())
+pace_clock = GameClock(scale=float(os.environ.get("GS_TIME_SCALE", "1")))
+# Level results are written to disk from a background thread
+stats = open_from_environment()
+
+# Initialize game objects once; every scene keeps its screen across transitions
+timer = ScoreKeeper(game_clock)
+manager = SceneManager(screen, profiler, FPS, presenter)
+level_scene = LevelScene(manager, timer, game_clock, stats=stats, pace_clock=pace_clock)
+manager.add("menu", MenuScene(manager, HomeScreen(screen_width, screen_height)))
+manager.add("how_to_play", HowToPlayScene(manager, HowToPlayScreen(screen_width, screen_height)))
+manager.add("level", level_scene)
+manager.add("win", EndScene(manager, background_image, "Congrats! You beat", "Level {level}"))
+manager.add("lose", EndScene(manager, background_image, "Unfortunate :(", " You Lost Level {level}"))
+startup.mark("scenes")
 
 # L - Loop
-while running:
-    # T - Timer to set frame rate
-    clock.tick(30)
-    # E - Event handling
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-        elif event.type == pygame.KEYDOWN:
-            if current_level is not None:
-                # Movement System to Play the Game
-                if event.key == pygame.K_LEFT:
-                    maze.move_player("left")
-                elif event.key == pygame.K_RIGHT:
-                    maze.move_player("right")
-                elif event.key == pygame.K_UP:
-                    maze.move_player("up")
-                elif event.key == pygame.K_DOWN:
-                    maze.move_player("down")
-                # Shows Menu Screen based on whether or not destination reached
-                if maze.dest_reached:
-                    if event.type == pygame.MOUSEBUTTONDOWN:
-                        if button_rect.collidepoint(event.pos):
-                            maze.dest_reached = False
-                            show_main_menu = True  
-                if maze.dest_unreached:
-                    if event.type == pygame.QUIT:
-                        maze.dest_reached = False
-                        show_main_menu = True
-                    elif event.type == pygame.MOUSEBUTTONDOWN:
-                        if button_rect.collidepoint(event.pos):
-                            maze.dest_reached = False
-                            show_main_menu = True  
-                             
-
-    else:
-        # Update Timer and Refresh Baground
-        timer.update()
-        # R - Refresh display
-        screen.blit(background_image,(0,0))
-        if not maze.dest_reached:
-            maze.render(timer)
-        maze.update(timer)
-
-        if timer.time_left <= 0:
-            screen.blit(background_image,(0,0))
-            # Shows Losing Message
-            congrats_font = pygame.font.Font("Fonts/youmurdererbb_reg.ttf", 100)
-
-            congrats_text = congrats_font.render("Unfortunate :(", True, (255, 255, 255))
-            congrats_text2 = congrats_font.render(f" You Lost Level {selected_level}", True, (255, 255, 255))
-
-            congrats_rect = congrats_text.get_rect(center=(screen_width // 2, screen_height // 2 - 75)) 
-            congrats_rect2 = congrats_text2.get_rect(center=(screen_width // 2, screen_height // 2 + 25)) 
-
-            screen.blit(congrats_text2, congrats_rect2)           
-            screen.blit(congrats_text, congrats_rect)
-
-            # Display "Back to Main Menu" button
-            button_font = pygame.font.Font("Fonts/youmurdererbb_reg.ttf", 50)
-            button_text = button_font.render("Back to Main Menu", True, (255, 255, 255))
-            button_rect = button_text.get_rect(center=(screen_width // 2, screen_height // 2 + 125))            
-            pygame.draw.rect(screen, (255, 255, 255), button_rect, 3)
-            screen.blit(button_text, button_rect)
-        
-        elif maze.dest_unreached:
-            screen.blit(background_image,(0,0))
-            
-            # Shows Losing Message
-            congrats_font = pygame.font.Font("Fonts/youmurdererbb_reg.ttf", 100)
-            congrats_text = congrats_font.render("Unfortunate :(", True, (255, 255, 255))
-            congrats_text2 = congrats_font.render(f" You Lost Level {selected_level}", True, (255, 255, 255))
-            congrats_rect = congrats_text.get_rect(center=(screen_width // 2, screen_height // 2 - 75)) 
-            congrats_rect2 = congrats_text2.get_rect(center=(screen_width // 2, screen_height // 2 + 25)) 
-            screen.blit(congrats_text2, congrats_rect2)           
-            screen.blit(congrats_text, congrats_rect)
-
-            # Display "Back to Main Menu" button
-            button_font = pygame.font.Font("Fonts/youmurdererbb_reg.ttf", 50)
-            button_text = button_font.render("Back to Main Menu", True, (255, 255, 255))
-            button_rect = button_text.get_rect(center=(screen_width // 2, screen_height // 2 + 125))            
-            pygame.draw.rect(screen, (255, 255, 255), button_rect, 3)
-            screen.blit(button_text, button_rect)
-        
-        elif maze.dest_reached:
-            screen.blit(background_image,(0,0))
-            # Display congratulatory message
-            congrats_font = pygame.font.Font("Fonts/youmurdererbb_reg.ttf", 100)
-            congrats_text = congrats_font.render("Congrats! You beat", True, (255, 255, 255))
-            congrats_text2 = congrats_font.render(f"Level {selected_level}", True, (255, 255, 255))
-            congrats_rect = congrats_text.get_rect(center=(screen_width // 2, screen_height // 2 - 75)) 
-            congrats_rect2 = congrats_text2.get_rect(center=(screen_width // 2, screen_height // 2 + 25)) 
-            screen.blit(congrats_text2, congrats_rect2)           
-            screen.blit(congrats_text, congrats_rect)
-
-            # Display "Back to Main Menu" button
-            button_font = pygame.font.Font("Fonts/youmurdererbb_reg.ttf", 50)
-            button_text = button_font.render("Back to Main Menu", True, (255, 255, 255))
-            button_rect = button_text.get_rect(center=(screen_width // 2, screen_height // 2 + 125))            
-            pygame.draw.rect(screen, (255, 255, 255), button_rect, 3)
-            screen.blit(button_text, button_rect)
-
-            for event in pygame.event.get():
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    if button_rect.collidepoint(event.pos):
-                        # Reset variables and show the main menu
-                        maze.dest_reached = False
-                        maze.dest_unreached = False
-                        show_main_menu = True            
-                        while show_main_menu:
-                            for event in pygame.event.get():
-                                if event.type == pygame.QUIT:
-                                    main_menu = False
-                                elif event.type == pygame.MOUSEBUTTONDOWN:
-                                    if home_screen.level1_rect.collidepoint(event.pos):
-                                        selected_level = 1
-                                        show_main_menu = False
-                                    elif home_screen.level2_rect.collidepoint(event.pos):
-                                        selected_level = 2
-                                        show_main_menu = False
-                                    elif home_screen.level3_rect.collidepoint(event.pos):
-                                        selected_level = 1
-                                        show_main_menu = False
-                                    elif home_screen.how_to_play_rect.collidepoint(event.pos):
-                                        show_how_to_play_screen()
-
-                            home_screen.draw(screen)
-                            pygame.display.flip()
-
-                        if selected_level is not None:
-                            running = True
-                            current_level = selected_level
-
-                            end_rect = pygame.Rect(700, 500, 30, 30)
-                            maze = Maze(current_level)                           
-                            timer.reset()
-
-        pygame.display.flip()
-
-pygame.quit()
\ No newline at end of file
+manager.start("menu")
+manager.frame()
+startup.mark("first frame")
+preloader.start()
+manager.run()
+
+if startup_report_enabled():
+    print("\n".join(startup.lines(preloader)))
+export_from_environment(profiler)
+if level_scene.recorder and not level_scene.recorder.finished:
+    save_from_environment(level_scene.recorder)
+if stats:
+    stats.close()
+
+pygame.quit()
@@ -0,0 +1,374 @@
+"""
+Author: Agilan Hariharan
+Description: Seeded procedural maze generator for Graveyard Shift
+Creation Date: October 18, 2026
+Last Modified: October 18, 2026
+
+Mazes are carved on a lattice of "cells" at odd tile coordinates; the tiles
+between two cells are walls until a passage is carved through them. Tiles are
+kept in one flat bytearray so memory grows linearly with the level size.
+
+Usage:
+    python Code/mazegen.py --width 1001 --height 1001 --algorithm kruskal --seed 7
+"""
+# Import and Initialize
+import argparse
+import random
+import time
+from collections import deque
+from itertools import chain
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from levels import EMPTY, WALL, EXIT, PLAYER
+
+
+class GeneratedMaze:
+    """
+    Class representing a generated maze and how it was made.
+    """
+    def __init__(self, width, height, tiles, algorithm, seed, seconds):
+        """
+        Initialize the GeneratedMaze object.
+        """
+        self.width = width
+        self.height = height
+        self.tiles = tiles
+        self.algorithm = algorithm
+        self.seed = seed
+        self.seconds = seconds
+
+    def rows(self):
+        """
+        Return the maze as a list of rows of tile codes.
+        """
+        width = self.width
+        return [list(self.tiles[y * width:(y + 1) * width]) for y in range(self.height)]
+
+    def stats(self):
+        """
+        Return generation time, dead-end and branching counts and the solution length.
+        """
+        width = self.width
+        tiles = self.tiles
+        degree_counts = [0, 0, 0, 0, 0]
+        for y in range(1, self.height - 1, 2):
+            for x in range(1, width - 1, 2):
+                i = y * width + x
+                if tiles[i] == WALL:
+                    continue
+                degree = (tiles[i - 1] != WALL) + (tiles[i + 1] != WALL) + (tiles[i - width] != WALL) + (tiles[i + width] != WALL)
+                degree_counts[degree] += 1
+
+        cells = sum(degree_counts)
+        return {
+            "algorithm": self.algorithm,
+            "seed": self.seed,
+            "width": width,
+            "height": self.height,
+            "seconds": self.seconds,
+            "cells": cells,
+            "dead_ends": degree_counts[1],
+            "corridors": degree_counts[2],
+            "branches": degree_counts[3] + degree_counts[4],
+            "dead_end_ratio": degree_counts[1] / cells if cells else 0.0,
+            "solution_length": self.solution_length(),
+        }
+
+    def solution_length(self):
+        """
+        Return the number of moves from the player to the exit, or -1 if unreachable.
+        """
+        width = self.width
+        tiles = self.tiles
+        start = tiles.index(PLAYER)
+        distance = {start: 0}
+        queue = deque([start])
+        while queue:
+            i = queue.popleft()
+            if tiles[i] == EXIT:
+                return distance[i]
+            for n in (i - 1, i + 1, i - width, i + width):
+                if n not in distance and tiles[n] != WALL:
+                    distance[n] = distance[i] + 1
+                    queue.append(n)
+        return -1
+
+
+def recursive_backtracker(cells_wide, cells_high, rng):
+    """
+    Return the passages of a depth-first (recursive backtracker) spanning tree.
+    """
+    count = cells_wide * cells_high
+    last_row = count - cells_wide
+    visited = bytearray(count)
+    rand = rng.random
+    start = int(rand() * count)
+    visited[start] = 1
+    stack = [start]
+    passages = []
+    while stack:
+        cell = stack[-1]
+        x = cell % cells_wide
+        options = []
+        if x > 0 and not visited[cell - 1]:
+            options.append(cell - 1)
+        if x < cells_wide - 1 and not visited[cell + 1]:
+            options.append(cell + 1)
+        if cell >= cells_wide and not visited[cell - cells_wide]:
+            options.append(cell - cells_wide)
+        if cell < last_row and not visited[cell + cells_wide]:
+            options.append(cell + cells_wide)
+        if not options:
+            stack.pop()
+            continue
+        nxt = options[int(rand() * len(options))]
+        visited[nxt] = 1
+        passages.append((cell, nxt))
+        stack.append(nxt)
+    return passages
+
+
+def kruskal(cells_wide, cells_high, rng):
+    """
+    Return the passages of a randomized Kruskal spanning tree using union-find.
+    """
+    count = cells_wide * cells_high
+    # Edge e < count joins cell e to its right neighbour; edge count + c joins
+    # cell c to the cell below. Shuffle by sorting on random float keys, which
+    # is much faster than random.shuffle.
+    rand = rng.random
+    keys = [rand() for _ in range(2 * count - cells_wide)]
+    if np is not None:
+        return boruvka(cells_wide, cells_high, np.array(keys))
+    order = sorted(range(2 * count - cells_wide), key=keys.__getitem__)
+
+    # Union by size keeps the trees shallow; both endpoints are re-pointed at
+    # their root after every lookup
+    parent = list(range(count))
+    size = [1] * count
+    passages = []
+    last_column = cells_wide - 1
+    for edge in order:
+        if edge < count:
+            if edge % cells_wide == last_column:
+                continue
+            a, b = edge, edge + 1
+        else:
+            a = edge - count
+            b = a + cells_wide
+        root_a = parent[a]
+        while root_a != parent[root_a]:
+            root_a = parent[root_a]
+        root_b = parent[b]
+        while root_b != parent[root_b]:
+            root_b = parent[root_b]
+        if root_a != root_b:
+            if size[root_a] < size[root_b]:
+                root_a, root_b = root_b, root_a
+            parent[root_b] = root_a
+            size[root_a] += size[root_b]
+            passages.append((a, b))
+        parent[a] = root_a
+        parent[b] = root_a
+    return passages
+
+
+def boruvka(cells_wide, cells_high, keys):
+    """
+    Return the same spanning tree as kruskal, built with whole-array numpy steps.
+
+    Kruskal over random keys builds the minimum spanning tree of those keys,
+    and that tree is unique once ties are broken by edge number. Boruvka's
+    algorithm finds it in a handful of rounds: every component takes its
+    cheapest edge to another component, then the components joined by those
+    edges are merged.
+    """
+    count = cells_wide * cells_high
+    edges = np.arange(len(keys))
+    rank = np.empty(len(keys), dtype=np.int64)
+    rank[np.argsort(keys, kind="stable")] = edges
+    right = edges < count
+    valid = ~right | (edges % cells_wide != cells_wide - 1)
+    first = np.where(right, edges, edges - count)[valid]
+    second = np.where(right, edges + 1, edges - count + cells_wide)[valid]
+    rank = rank[valid]
+
+    cells = np.arange(count)
+    component = cells.copy()
+    chosen = []
+    while True:
+        comp_a = component[first]
+        comp_b = component[second]
+        crossing = comp_a != comp_b
+        if not crossing.any():
+            break
+        first, second, rank = first[crossing], second[crossing], rank[crossing]
+        comp_a, comp_b = comp_a[crossing], comp_b[crossing]
+
+        cheapest = np.full(count, len(keys), dtype=np.int64)
+        np.minimum.at(cheapest, comp_a, rank)
+        np.minimum.at(cheapest, comp_b, rank)
+        from_a = cheapest[comp_a] == rank
+        from_b = cheapest[comp_b] == rank
+        picked = from_a | from_b
+        chosen.append((rank[picked], first[picked], second[picked]))
+
+        # Every component points across its cheapest edge; two components
+        # that picked the same edge point at each other, and the lower one
+        # becomes the root. Pointer jumping then flattens each new tree.
+        pointer = cells.copy()
+        pointer[comp_a[from_a]] = comp_b[from_a]
+        pointer[comp_b[from_b]] = comp_a[from_b]
+        mutual = (pointer[pointer] == cells) & (cells < pointer)
+        pointer[mutual] = cells[mutual]
+        while True:
+            jumped = pointer[pointer]
+            if np.array_equal(jumped, pointer):
+                break
+            pointer = jumped
+        component = pointer[component]
+
+    if not chosen:
+        return np.empty((0, 2), dtype=np.int64)
+    rank, first, second = (np.concatenate(parts) for parts in zip(*chosen))
+    # Same order kruskal would carve them in
+    return np.stack((first, second), axis=1)[np.argsort(rank)]
+
+
+def wilson(cells_wide, cells_high, rng):
+    """
+    Return the passages of a uniform spanning tree using Wilson's algorithm.
+    """
+    # The walk runs on the cell lattice with a one-cell border of state 2
+    # around it, so each step is one addition; steps into the border are
+    # redrawn, which keeps the walk uniform over the real neighbours.
+    stride = cells_wide + 2
+    count = cells_wide * cells_high
+    state = bytearray([2]) * (stride * (cells_high + 2))
+    for cy in range(cells_high):
+        row = (cy + 1) * stride + 1
+        state[row:row + cells_wide] = bytes(cells_wide)
+    root = int(rng.random() * count)
+    state[(root // cells_wide + 1) * stride + root % cells_wide + 1] = 1
+    next_cell = [0] * len(state)
+
+    # One random byte per step; any byte picks one of the four directions.
+    # Breaking out of the for loop leaves the stream where the walk stopped.
+    steps = (-1, 1, -stride, stride) * 64
+    randbytes = rng.randbytes
+    directions = chain.from_iterable(iter(lambda: randbytes(65536), None))
+    passages = []
+    # The spanning tree is uniform whatever order the walks start in
+    for cy in range(cells_high):
+        row = (cy + 1) * stride + 1
+        for start in range(row, row + cells_wide):
+            if state[start]:
+                continue
+            # Loop-erased random walk: only the last exit from each cell is kept
+            cell = start
+            for direction in directions:
+                step = cell + steps[direction]
+                reached = state[step]
+                if reached == 2:
+                    continue
+                next_cell[cell] = step
+                cell = step
+                if reached:
+                    break
+            cell = start
+            while state[cell] != 1:
+                state[cell] = 1
+                passages.append((cell, next_cell[cell]))
+                cell = next_cell[cell]
+
+    # Back from the bordered lattice to plain cell numbers
+    return [((a // stride - 1) * cells_wide + a % stride - 1, (b // stride - 1) * cells_wide + b % stride - 1)
+            for a, b in passages]
+
+
+def carve_passages(tiles, width, cells_wide, passages):
+    """
+    Open the wall tile between the two cells of every passage.
+    """
+    if np is not None and len(passages):
+        cells = np.array(passages, dtype=np.int64)
+        rows, cols = np.divmod(cells, cells_wide)
+        tile_index = (2 * rows + 1) * width + 2 * cols + 1
+        np.frombuffer(tiles, dtype=np.uint8)[tile_index.sum(axis=1) // 2] = EMPTY
+        return
+    for a, b in passages:
+        ta = (2 * (a // cells_wide) + 1) * width + 2 * (a % cells_wide) + 1
+        tb = (2 * (b // cells_wide) + 1) * width + 2 * (b % cells_wide) + 1
+        tiles[(ta + tb) // 2] = EMPTY
+
+
+ALGORITHMS = ("backtracker", "kruskal", "wilson")
+
+
+def generate(width, height, algorithm="backtracker", seed=None):
+    """
+    Generate a maze of width x height tiles. The player starts in the top-left
+    cell and the exit sits in the bottom-right cell.
+    """
+    cells_wide = (width - 1) // 2
+    cells_high = (height - 1) // 2
+    # The player and the exit need cells of their own
+    if cells_wide < 1 or cells_high < 1 or cells_wide * cells_high < 2:
+        raise ValueError("Mazes must be at least 5x3 or 3x5 tiles")
+    rng = random.Random(seed)
+
+    start_time = time.perf_counter()
+    if algorithm == "backtracker":
+        passages = recursive_backtracker(cells_wide, cells_high, rng)
+    elif algorithm == "kruskal":
+        passages = kruskal(cells_wide, cells_high, rng)
+    elif algorithm == "wilson":
+        passages = wilson(cells_wide, cells_high, rng)
+    else:
+        raise ValueError(f"Unknown maze algorithm: {algorithm}")
+
+    tiles = bytearray([WALL]) * (width * height)
+    for cy in range(cells_high):
+        row = (2 * cy + 1) * width
+        tiles[row + 1:row + 2 * cells_wide:2] = bytes(cells_wide)
+    carve_passages(tiles, width, cells_wide, passages)
+
+    tiles[width + 1] = PLAYER
+    tiles[(2 * cells_high - 1) * width + 2 * cells_wide - 1] = EXIT
+    seconds = time.perf_counter() - start_time
+    return GeneratedMaze(width, height, tiles, algorithm, seed, seconds)
+
+
+def main(argv=None):
+    """
+    Generate one maze from the command line and print its statistics.
+    """
+    parser = argparse.ArgumentParser(description="Generate a Graveyard Shift maze and report its statistics.")
+    parser.add_argument("--width", type=int, default=32)
+    parser.add_argument("--height", type=int, default=22)
+    parser.add_argument("--algorithm", choices=ALGORITHMS, default="backtracker")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--show", action="store_true", help="print the maze as text")
+    args = parser.parse_args(argv)
+
+    try:
+        maze = generate(args.width, args.height, args.algorithm, args.seed)
+    except ValueError as error:
+        parser.error(str(error))
+    if args.show:
+        symbols = {EMPTY: " ", WALL: "#", EXIT: "E", PLAYER: "P"}
+        for row in maze.rows():
+            print("".join(symbols[block] for block in row))
+    for key, value in maze.stats().items():
+        if isinstance(value, float):
+            print(f"{key}: {value:.4f}")
+        else:
+            print(f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
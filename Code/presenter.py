@@ -0,0 +1,136 @@
+"""
+Author: Agilan Hariharan
+Description: Fixed-size framebuffer presented to any window size for Graveyard Shift
+Creation Date: October 18, 2026
+Last Modified: October 18, 2026
+
+The game always draws into a 640x480 framebuffer. A Presenter copies it to
+the window once per frame with a nearest-neighbour scale by the largest
+whole factor that fits, centred with black bars around it, so large screens
+get sharp pixels instead of a blurry stretch. Only the rectangles that
+changed are scaled when the scene reports them. Windows smaller than the
+framebuffer get a plain nearest-neighbour shrink to fit.
+
+Set GS_WINDOW to a size such as 1920x1080 to open a larger window, and
+GS_FULLSCREEN=1 to fill the screen (at GS_WINDOW, or the desktop size).
+"""
+# Import and Initialize
+import os
+import pygame
+
+INTERNAL_SIZE = (640, 480)
+MOUSE_EVENTS = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION)
+RESIZE_EVENTS = (pygame.VIDEORESIZE, pygame.WINDOWSIZECHANGED)
+
+
+def parse_size(value):
+    """
+    Return the (width, height) of a size written as WIDTHxHEIGHT.
+    """
+    width, height = value.lower().split("x")
+    return int(width), int(height)
+
+
+class Presenter:
+    """
+    Class representing the internal framebuffer and how it is shown in the window.
+    """
+    def __init__(self, internal_size=INTERNAL_SIZE, window_size=None, fullscreen=False):
+        """
+        Initialize the Presenter object. window_size defaults to the internal
+        size, or to the desktop size when fullscreen.
+        """
+        self.internal_size = internal_size
+        self.window_size = window_size
+        self.fullscreen = fullscreen
+        self.window = None
+        self.frame = None
+        self.scale = 1
+        self.rect = pygame.Rect((0, 0), internal_size)
+        self.needs_full_present = True
+
+    def open(self):
+        """
+        Open the window and return the framebuffer every scene draws into.
+        """
+        if self.fullscreen:
+            pygame.display.set_mode(self.window_size or (0, 0), pygame.FULLSCREEN)
+        else:
+            pygame.display.set_mode(self.window_size or self.internal_size, pygame.RESIZABLE)
+        # The framebuffer lives as long as the presenter, so surfaces that keep
+        # a reference to it stay valid when the window is resized
+        self.frame = pygame.Surface(self.internal_size).convert()
+        self.layout()
+        return self.frame
+
+    def layout(self):
+        """
+        Work out the scale and position of the framebuffer for the current window size.
+        """
+        self.window = pygame.display.get_surface()
+        window_width, window_height = self.window.get_size()
+        width, height = self.internal_size
+        self.scale = min(window_width // width, window_height // height)
+        if self.scale >= 1:
+            size = (width * self.scale, height * self.scale)
+        else:
+            ratio = min(window_width / width, window_height / height)
+            size = (max(1, int(width * ratio)), max(1, int(height * ratio)))
+        self.rect = pygame.Rect((0, 0), size)
+        self.rect.center = self.window.get_rect().center
+        self.window.fill((0, 0, 0))
+        self.needs_full_present = True
+
+    def to_window(self, rect):
+        """
+        Return where a framebuffer Rect lands in the window. Only exact for whole scales.
+        """
+        scale = self.scale
+        return pygame.Rect(self.rect.x + rect.x * scale, self.rect.y + rect.y * scale, rect.width * scale, rect.height * scale)
+
+    def to_internal(self, position):
+        """
+        Return the framebuffer position under a window position.
+        """
+        x, y = position
+        width, height = self.internal_size
+        return (x - self.rect.x) * width // self.rect.width, (y - self.rect.y) * height // self.rect.height
+
+    def map_event(self, event):
+        """
+        Return the event with any mouse position moved into framebuffer coordinates.
+        """
+        if event.type in MOUSE_EVENTS:
+            return pygame.event.Event(event.type, dict(event.dict, pos=self.to_internal(event.pos)))
+        return event
+
+    def present(self, dirty_rects=None):
+        """
+        Show the framebuffer in the window. With a list of changed rectangles
+        only those are scaled and updated; None presents the whole frame.
+        """
+        if dirty_rects is None or self.needs_full_present or self.scale < 1:
+            pygame.transform.scale(self.frame, self.rect.size, self.window.subsurface(self.rect))
+            pygame.display.flip()
+            self.needs_full_present = False
+            return
+
+        bounds = self.frame.get_rect()
+        updated = []
+        for rect in dirty_rects:
+            rect = rect.clip(bounds)
+            if not rect:
+                continue
+            target = self.to_window(rect)
+            pygame.transform.scale(self.frame.subsurface(rect), target.size, self.window.subsurface(target))
+            updated.append(target)
+        pygame.display.update(updated)
+
+
+def from_environment(internal_size=INTERNAL_SIZE):
+    """
+    Build a Presenter configured from the GS_WINDOW and GS_FULLSCREEN environment variables.
+    """
+    window = os.environ.get("GS_WINDOW")
+    fullscreen = os.environ.get("GS_FULLSCREEN", "") not in ("", "0")
+    return Presenter(internal_size, parse_size(window) if window else None, fullscreen)
@@ -0,0 +1,232 @@
+"""
+Author: Agilan Hariharan
+Description: Per-phase frame profiler with an on-screen overlay for Graveyard Shift
+Creation Date: October 18, 2026
+Last Modified: October 18, 2026
+
+Set GS_PROFILE=1 to start with profiling on, or press F3 in game to toggle
+it. GS_PROFILE_OUT names the .csv or .json file written on exit. Set
+GS_STARTUP_REPORT=1 to print how long each startup step took on exit.
+"""
+# Import and Initialize
+import csv
+import json
+import os
+import time
+from array import array
+import pygame
+from assets import assets
+
+PHASES = ("events", "timer", "update", "render", "display")
+TOGGLE_KEY = pygame.K_F3
+OVERLAY_SIZE = (230, 130)
+OVERLAY_REFRESH_FRAMES = 15
+
+
+class FrameProfiler:
+    """
+    Class representing a ring buffer of per-phase frame timings.
+    """
+    def __init__(self, capacity=600, enabled=False, phases=PHASES):
+        """
+        Initialize the FrameProfiler object.
+        """
+        self.capacity = capacity
+        self.enabled = enabled
+        self.phases = phases
+        self.columns = ("frame",) + tuple(phases)
+        self.samples = {column: array("q", bytes(8 * capacity)) for column in self.columns}
+        self.current = dict.fromkeys(phases, 0)
+        self.index = 0
+        self.count = 0
+        self.frame_start = 0
+        self.mark_time = 0
+
+        self.overlay = None
+        self.overlay_rect = None
+        self.frames_since_overlay = 0
+
+    def toggle(self):
+        """
+        Turn profiling on or off. A frame in progress is not timed; timing
+        starts with the next begin_frame().
+        """
+        self.enabled = not self.enabled
+        self.current = dict.fromkeys(self.phases, 0)
+        self.frame_start = self.mark_time = 0
+
+    def begin_frame(self):
+        """
+        Start timing a frame.
+        """
+        if not self.enabled:
+            return
+        self.frame_start = self.mark_time = time.perf_counter_ns()
+
+    def mark(self, phase):
+        """
+        Charge the time since the last mark to the given phase. Does nothing
+        until a frame has begun.
+        """
+        if not self.enabled or not self.frame_start:
+            return
+        now = time.perf_counter_ns()
+        self.current[phase] += now - self.mark_time
+        self.mark_time = now
+
+    def end_frame(self):
+        """
+        Store the finished frame in the ring buffer.
+        """
+        if not self.enabled or not self.frame_start:
+            return
+        slot = self.index
+        self.samples["frame"][slot] = time.perf_counter_ns() - self.frame_start
+        for phase in self.phases:
+            self.samples[phase][slot] = self.current[phase]
+            self.current[phase] = 0
+        self.index = (slot + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        self.frame_start = 0
+
+    def ordered(self, column):
+        """
+        Return the stored samples of one column from oldest to newest.
+        """
+        values = self.samples[column]
+        if self.count < self.capacity:
+            return list(values[:self.count])
+        return list(values[self.index:]) + list(values[:self.index])
+
+    def percentiles(self, column="frame", fractions=(0.50, 0.95, 0.99)):
+        """
+        Return the given percentiles of one column in nanoseconds.
+        """
+        values = sorted(self.ordered(column))
+        if not values:
+            return [0 for _ in fractions]
+        return [values[min(len(values) - 1, int(fraction * len(values)))] for fraction in fractions]
+
+    def summary(self):
+        """
+        Return p50/p95/p99 in milliseconds for every column.
+        """
+        result = {}
+        for column in self.columns:
+            p50, p95, p99 = self.percentiles(column)
+            result[column] = {"p50_ms": p50 / 1e6, "p95_ms": p95 / 1e6, "p99_ms": p99 / 1e6}
+        return result
+
+    def build_overlay(self):
+        """
+        Render the percentile table and a sparkline of recent frame times.
+        """
+        width, height = OVERLAY_SIZE
+        overlay = pygame.Surface(OVERLAY_SIZE)
+        overlay.fill((0, 0, 0))
+        font = assets.font(None, 18)
+
+        summary = self.summary()
+        y = 4
+        for column in self.columns:
+            row = summary[column]
+            line = f"{column:<8} {row['p50_ms']:6.2f} {row['p95_ms']:6.2f} {row['p99_ms']:6.2f}"
+            overlay.blit(font.render(line, True, (255, 255, 255)), (4, y))
+            y += 14
+
+        # Sparkline of the most recent frames, scaled so 33 ms fills the box
+        frames = self.ordered("frame")[-(width - 8):]
+        top = y + 4
+        span = height - top - 4
+        points = [(4 + i, top + span - min(span, int(value / 33e6 * span))) for i, value in enumerate(frames)]
+        if len(points) > 1:
+            pygame.draw.lines(overlay, (0, 255, 0), False, points)
+        return overlay
+
+    def draw_overlay(self, screen, position=(400, 340)):
+        """
+        Draw the overlay on the screen and return the rectangle it covers.
+        """
+        self.frames_since_overlay += 1
+        if self.overlay is None or self.frames_since_overlay >= OVERLAY_REFRESH_FRAMES:
+            self.overlay = self.build_overlay()
+            self.frames_since_overlay = 0
+        self.overlay_rect = screen.blit(self.overlay, position)
+        return self.overlay_rect
+
+    def export(self, path):
+        """
+        Write the buffered frames to a .csv or .json file.
+        """
+        columns = {column: self.ordered(column) for column in self.columns}
+        if path.endswith(".json"):
+            with open(path, "w") as export_file:
+                json.dump({
+                    "unit": "ns",
+                    "columns": columns,
+                    "summary": self.summary(),
+                }, export_file, indent=2)
+            return
+        with open(path, "w", newline="") as export_file:
+            writer = csv.writer(export_file)
+            writer.writerow([f"{column}_ns" for column in self.columns])
+            writer.writerows(zip(*columns.values()))
+
+
+class StartupReport:
+    """
+    Class representing the time taken by each step of starting the game.
+    """
+    def __init__(self, start=None):
+        """
+        Initialize the StartupReport object. start is a time.perf_counter() value
+        taken as early as possible, before the heavy imports.
+        """
+        self.start = start if start is not None else time.perf_counter()
+        self.marks = []
+
+    def mark(self, step):
+        """
+        Record that a startup step has just finished.
+        """
+        self.marks.append((step, time.perf_counter()))
+
+    def lines(self, preloader=None):
+        """
+        Return the report as lines of text, including the preloader's progress.
+        """
+        lines = [f"{'step':<24}{'ms':>9}{'total ms':>11}"]
+        previous = self.start
+        for step, moment in self.marks:
+            lines.append(f"{step:<24}{(moment - previous) * 1000:9.1f}{(moment - self.start) * 1000:11.1f}")
+            previous = moment
+        if preloader is not None:
+            for key, seconds in list(preloader.seconds.items()):
+                lines.append(f"  preloaded {key[1]:<32}{seconds * 1000:9.1f}")
+            if preloader.finished is not None:
+                lines.append(f"preloader finished {(preloader.finished - self.start) * 1000:.1f} ms after start")
+            else:
+                lines.append(f"preloader still running: {len(preloader.seconds)} of {len(preloader.jobs)} files decoded")
+        return lines
+
+
+def startup_report_enabled():
+    """
+    Check if GS_STARTUP_REPORT asks for the startup report.
+    """
+    return os.environ.get("GS_STARTUP_REPORT", "") not in ("", "0")
+
+
+def from_environment():
+    """
+    Build a profiler configured from the GS_PROFILE environment variable.
+    """
+    return FrameProfiler(enabled=os.environ.get("GS_PROFILE", "") not in ("", "0"))
+
+
+def export_from_environment(profiler):
+    """
+    Export the profiler buffer on exit if it recorded anything.
+    """
+    if profiler.count:
+        profiler.export(os.environ.get("GS_PROFILE_OUT", "frame_profile.csv"))
@@ -0,0 +1,1119 @@
+"""
+Author: Agilan Hariharan
+Description: Networked race mode for Graveyard Shift
+Creation Date: October 18, 2026
+Last Modified: October 18, 2026
+
+Two to eight players race through the same maze under the same spikes. An
+asyncio server owns the rules: it runs a RaceCore at a fixed tick, applies
+at most one queued move per player each tick and sends every client only
+what changed since the tick before, namely the players that moved or
+finished, the spikes that spawned or expired and the timer once a second.
+A round starts when enough players have joined, ends when nobody is still
+racing or the time is up, and the next one starts a few seconds later with
+a new spike seed.
+
+Clients apply their own moves straight away with the same movement rule
+and keep them until the server acknowledges them; every update from the
+server is replayed under the moves still in flight, so the player never
+waits for a round trip. raceclient.py draws a race with pygame, and the
+bots here play over the same sockets for load tests.
+
+Messages are a two-byte length followed by a kind and unsigned varints.
+
+Usage:
+    python Code/race.py --level 2 --players 2
+    python Code/race.py --players 2 --bots 1
+    python Code/race.py --load 1 2 4 8 --seconds 10
+"""
+# Import and Initialize
+import argparse
+import asyncio
+import multiprocessing
+import random
+import struct
+import time
+from collections import Counter, deque
+from collision import CollisionGrid
+from core import DIRECTIONS, GameCore, ManualClock
+from difficulty import percentile
+from levels import EMPTY, EXIT, PLAYER, SPIKE, load_level_data
+from replay import MOVE_CODES, MOVE_NAMES, level_checksum, read_varints, write_varint
+from solver import DistanceField
+
+HOST = "127.0.0.1"
+PORT = 5050
+# One move per player per tick, the same step as the single-player simulation
+TICK_MS = 20
+MIN_PLAYERS = 2
+MAX_PLAYERS = 8
+# Pause between the end of a round and the start of the next
+ROUND_BREAK_MS = 3000
+# Moves a client may have in flight; the server ignores any beyond this
+MAX_QUEUED = 8
+MAX_NAME = 16
+# A client that falls this far behind on reading is dropped
+MAX_BUFFERED = 256 * 1024
+# Ticks the server may run late before it gives up catching up
+MAX_LATE_TICKS = 5
+
+FRAME = struct.Struct("<H")
+
+# Client to server
+JOIN = 1
+MOVE = 2
+# Server to client
+WELCOME = 10
+ROUND = 11
+DELTA = 12
+JOINED = 13
+LEFT = 14
+RESULT = 15
+FULL = 16
+
+STATES = ("racing", "win", "spike", "timeout")
+STATE_CODES = {state: code for code, state in enumerate(STATES)}
+# Moving onto these tiles ends the race for a player
+FINISHING_TILES = {EXIT: "win", SPIKE: "spike"}
+
+# Sections present in a delta
+TIME_CHANGED = 1
+PLAYERS_CHANGED = 2
+SPIKES_SPAWNED = 4
+SPIKES_EXPIRED = 8
+
+# A player entry in a delta is its id * 8 plus one of these operations; a
+# single step costs one byte, since players move at most one tile per tick
+STEP_CODES = {DIRECTIONS[direction]: code for code, direction in enumerate(DIRECTIONS)}
+STEP_OFFSETS = {code: offset for offset, code in STEP_CODES.items()}
+SET_STATE = 4
+SET_POSITION = 5
+
+
+def resolve_move(collision, position, direction):
+    """
+    Return where a player at position ends up after one move and the tile it
+    ran into. This is the movement rule of GameCore.move_player, shared by the
+    server and the clients that predict their own moves.
+    """
+    x, y = position
+    new_x, new_y, block = collision.step(x, y, *DIRECTIONS[direction])
+    if block == EMPTY:
+        return (new_x, new_y), block
+    return position, block
+
+
+def write_string(buffer, text):
+    """
+    Append a string to a bytearray as its length and code points.
+    """
+    write_varint(buffer, len(text))
+    for character in text:
+        write_varint(buffer, ord(character))
+
+
+def read_string(values):
+    """
+    Read a string written by write_string from an iterator of varints.
+    """
+    length = next(values)
+    return "".join([chr(next(values)) for _ in range(length)])
+
+
+def write_positions(buffer, positions):
+    """
+    Append a count and the (x, y) of each position to a bytearray.
+    """
+    write_varint(buffer, len(positions))
+    for x, y in positions:
+        write_varint(buffer, x)
+        write_varint(buffer, y)
+
+
+def read_positions(values):
+    """
+    Read positions written by write_positions from an iterator of varints.
+    """
+    return [(next(values), next(values)) for _ in range(next(values))]
+
+
+def message(kind, *values):
+    """
+    Return the body of a message made of a kind and unsigned integers.
+    """
+    body = bytearray((kind,))
+    for value in values:
+        write_varint(body, value)
+    return body
+
+
+def level_name(text):
+    """
+    Return the level key for a level name sent over the network.
+    """
+    return int(text) if text.isdigit() else text
+
+
+async def read_message(reader):
+    """
+    Return the body of the next message on a stream.
+    """
+    (length,) = FRAME.unpack(await reader.readexactly(FRAME.size))
+    return await reader.readexactly(length)
+
+
+def frame(body):
+    """
+    Return a message body with its length in front.
+    """
+    if len(body) > 0xFFFF:
+        raise ValueError(f"Message of {len(body)} bytes is too long to send")
+    return FRAME.pack(len(body)) + body
+
+
+class Racer:
+    """
+    Class representing one player in a race.
+    """
+    def __init__(self, player_id, name, position, state="racing"):
+        """
+        Initialize the Racer object.
+        """
+        self.id = player_id
+        self.name = name
+        self.position = position
+        self.state = state
+        self.moves = 0
+        # Milliseconds from the start of the round to reaching the exit
+        self.finish_time = 0
+
+
+class RaceCore(GameCore):
+    """
+    Class representing the rules of a race: one maze, one spike schedule and
+    any number of players.
+
+    Players are not written into the grid, so they pass through each other.
+    The cells they stand on are kept out of the free-cell index instead, so
+    no spike rises under a player, and a spike is only placed if every player
+    who could still reach the exit can reach it afterwards.
+    """
+    def __init__(self, current_level, clock, rng=None):
+        """
+        Initialize the race. Every player starts on the level's player tile.
+        """
+        super().__init__(current_level, clock, rng=rng)
+        self.start = self.player_position
+        x, y = self.start
+        self.maze[y][x] = EMPTY
+        self.paths.cell_changed(x, y)
+        self.start_time = clock()
+        self.racers = {}
+        self.occupied = Counter()
+        # Changes since the last call to take_changes
+        self.changed = set()
+        self.spawned = []
+        self.expired = []
+
+    @property
+    def finished(self):
+        """
+        Check if the race is over: time is up, or nobody is still racing.
+        """
+        if self.timer.time_up():
+            return True
+        return not any(racer.state == "racing" for racer in self.racers.values())
+
+    def occupy(self, position):
+        """
+        Mark a cell as stood on, so no spike is placed there.
+        """
+        self.occupied[position] += 1
+        self.free_cells.discard(position)
+
+    def release(self, position):
+        """
+        Mark a cell as left by one player, and free it once nobody stands there.
+        """
+        self.occupied[position] -= 1
+        if not self.occupied[position]:
+            del self.occupied[position]
+            x, y = position
+            if self.maze[y][x] == EMPTY:
+                self.free_cells.add(position)
+
+    def join(self, player_id, name):
+        """
+        Put a new player on the start cell and return its Racer.
+        """
+        racer = self.racers[player_id] = Racer(player_id, name, self.start)
+        self.occupy(self.start)
+        self.changed.add(player_id)
+        return racer
+
+    def leave(self, player_id):
+        """
+        Take a player out of the race.
+        """
+        racer = self.racers.pop(player_id, None)
+        self.changed.discard(player_id)
+        if racer is not None and racer.state == "racing":
+            self.release(racer.position)
+
+    def finish(self, racer, state):
+        """
+        End the race for one player with the given state.
+        """
+        racer.state = state
+        if state == "win":
+            racer.finish_time = self.clock() - self.start_time
+        self.release(racer.position)
+        self.changed.add(racer.id)
+
+    def move(self, player_id, direction):
+        """
+        Move a player in the specified direction within the maze.
+        """
+        racer = self.racers.get(player_id)
+        if racer is None or racer.state != "racing" or direction not in DIRECTIONS:
+            return
+        position, block = resolve_move(self.collision, racer.position, direction)
+        racer.moves += 1
+        if position != racer.position:
+            self.release(racer.position)
+            self.occupy(position)
+            racer.position = position
+            self.changed.add(player_id)
+        if block in FINISHING_TILES:
+            self.finish(racer, FINISHING_TILES[block])
+
+    def time_out(self):
+        """
+        End the race for everyone still racing when the time is up.
+        """
+        for racer in self.racers.values():
+            if racer.state == "racing":
+                self.finish(racer, "timeout")
+
+    def generate_spikes(self):
+        """
+        Generate a wave of spikes in empty cells. A spike that would cut any
+        player off from the exit is taken back and another cell is drawn instead.
+        """
+        routes = [self.paths.route(*racer.position) for racer in self.racers.values() if racer.state == "racing"]
+        routes = [route for route in routes if route is not None]
+        rejected = []
+        placed = 0
+        while placed < self.num_spikes and self.free_cells:
+            x, y = self.free_cells.pop_random(self.rng)
+            if self.place_spike(x, y, routes):
+                placed += 1
+            else:
+                rejected.append((x, y))
+        for position in rejected:
+            self.free_cells.add(position)
+
+    def place_spike(self, x, y, routes=()):
+        """
+        Put a spike at (x, y). Returns False, leaving the grid unchanged, if the
+        spike sits on any of the routes and no way around it is found.
+        """
+        self.maze[y][x] = SPIKE
+        self.paths.cell_changed(x, y)
+        if not all(route.avoid(x, y) for route in routes):
+            self.maze[y][x] = EMPTY
+            self.paths.cell_changed(x, y)
+            return False
+        self.add_spike(x, y)
+        return True
+
+    def add_spike(self, x, y):
+        """
+        Record a spike and remember it for the next update.
+        """
+        super().add_spike(x, y)
+        self.spawned.append((x, y))
+
+    def remove_spike(self, position):
+        """
+        Remove an expired spike and remember it for the next update.
+        """
+        super().remove_spike(position)
+        self.expired.append(position)
+
+    def take_changes(self):
+        """
+        Return the players, spawned spikes and expired spikes that changed since the last call.
+        """
+        changed = [self.racers[player_id] for player_id in sorted(self.changed)]
+        spawned, expired = self.spawned, self.expired
+        self.changed = set()
+        self.spawned = []
+        self.expired = []
+        return changed, spawned, expired
+
+    def standings(self):
+        """
+        Return the racers in finishing order: winners by time, then everyone else by moves.
+        """
+        return sorted(self.racers.values(),
+                      key=lambda racer: (racer.state != "win", racer.finish_time, STATE_CODES[racer.state], racer.moves))
+
+
+def write_racer(buffer, racer, sent):
+    """
+    Append the change of one racer to a delta, relative to the (position, state)
+    last sent for it. Returns the number of entries written.
+    """
+    old_position, old_state = sent
+    entries = 0
+    if racer.position != old_position:
+        offset = (racer.position[0] - old_position[0], racer.position[1] - old_position[1])
+        if offset in STEP_CODES:
+            write_varint(buffer, racer.id * 8 + STEP_CODES[offset])
+        else:
+            write_varint(buffer, racer.id * 8 + SET_POSITION)
+            write_varint(buffer, racer.position[0])
+            write_varint(buffer, racer.position[1])
+        entries += 1
+    if racer.state != old_state:
+        write_varint(buffer, racer.id * 8 + SET_STATE)
+        write_varint(buffer, STATE_CODES[racer.state])
+        entries += 1
+    return entries
+
+
+class Connection:
+    """
+    Class representing one client connected to the race server.
+    """
+    def __init__(self, player_id, name, writer):
+        """
+        Initialize the Connection object.
+        """
+        self.id = player_id
+        self.name = name
+        self.writer = writer
+        self.inputs = deque()
+        # Sequence numbers of the last move received, applied and acknowledged
+        self.received = 0
+        self.ack = 0
+        self.sent_ack = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.messages_sent = 0
+
+
+class RaceServer:
+    """
+    Class representing the authoritative race server.
+    """
+    def __init__(self, level, tick_ms=TICK_MS, min_players=MIN_PLAYERS, max_players=MAX_PLAYERS, seed=None,
+                 round_break_ms=ROUND_BREAK_MS):
+        """
+        Initialize the RaceServer object. seed makes the spike seeds of every
+        round repeatable.
+        """
+        self.level = level
+        self.level_crc = level_checksum(load_level_data(level))
+        self.tick_ms = tick_ms
+        self.min_players = min_players
+        self.max_players = max_players
+        self.round_break_ms = round_break_ms
+        self.rng = random.Random(seed)
+        # Game time only moves one tick at a time, so a round plays out the
+        # same way for the same seed and moves however late the ticks run
+        self.clock = ManualClock()
+        self.connections = {}
+        self.game = None
+        self.racing = False
+        self.round = 0
+        self.next_round = 0
+        # (position, state) of every racer as the clients last saw it
+        self.sent_racers = {}
+        self.sent_time_left = None
+        self.server = None
+        self.task = None
+        self.handlers = set()
+        self.reset_stats()
+
+    def reset_stats(self):
+        """
+        Start counting tick times and traffic afresh.
+        """
+        self.tick_times = []
+        self.late_ticks = 0
+        self.rounds_played = 0
+        self.stats_start = time.perf_counter()
+        for connection in self.connections.values():
+            connection.bytes_sent = connection.bytes_received = connection.messages_sent = 0
+
+    async def start(self, host=HOST, port=PORT):
+        """
+        Start listening and ticking. Returns the port, which is useful when port is 0.
+        """
+        self.server = await asyncio.start_server(self.handle_client, host, port)
+        self.task = asyncio.create_task(self.run())
+        return self.server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        """
+        Stop ticking and disconnect every client.
+        """
+        if self.task:
+            self.task.cancel()
+        self.server.close()
+        for connection in list(self.connections.values()):
+            connection.writer.close()
+        # Each handler ends as soon as it sees its connection close
+        await asyncio.gather(*self.handlers, return_exceptions=True)
+        await self.server.wait_closed()
+
+    def send(self, connection, body):
+        """
+        Queue a message to one client. A client too slow to read its updates is dropped,
+        since every delta builds on the one before.
+        """
+        writer = connection.writer
+        if writer.is_closing():
+            return
+        if writer.transport.get_write_buffer_size() > MAX_BUFFERED:
+            writer.transport.abort()
+            return
+        data = frame(body)
+        writer.write(data)
+        connection.bytes_sent += len(data)
+        connection.messages_sent += 1
+
+    def broadcast(self, body):
+        """
+        Queue the same message to every client.
+        """
+        for connection in list(self.connections.values()):
+            self.send(connection, body)
+
+    async def handle_client(self, reader, writer):
+        """
+        Serve one client: take its join, then queue its moves until it disconnects.
+        """
+        handler = asyncio.current_task()
+        self.handlers.add(handler)
+        handler.add_done_callback(self.handlers.discard)
+        try:
+            body = await read_message(reader)
+            values = read_varints(body)
+            if next(values) != JOIN:
+                raise ValueError("Expected a join")
+            name = read_string(values)[:MAX_NAME]
+        except (asyncio.IncompleteReadError, ConnectionError, StopIteration, ValueError, OverflowError):
+            writer.close()
+            return
+        free_ids = [player_id for player_id in range(self.max_players) if player_id not in self.connections]
+        if not free_ids:
+            writer.write(frame(message(FULL)))
+            writer.close()
+            return
+
+        connection = Connection(free_ids[0], name, writer)
+        connection.bytes_received += FRAME.size + len(body)
+        self.send(connection, message(WELCOME, connection.id, self.tick_ms, self.min_players, self.max_players))
+        for other in self.connections.values():
+            self.send(connection, self.joined_message(other))
+        self.connections[connection.id] = connection
+        self.broadcast(self.joined_message(connection))
+        # Someone joining during a round watches it and races in the next one
+        if self.game is not None:
+            self.send(connection, self.round_message())
+
+        try:
+            while True:
+                body = await read_message(reader)
+                connection.bytes_received += FRAME.size + len(body)
+                values = read_varints(body)
+                if next(values, None) != MOVE:
+                    continue
+                sequence = next(values)
+                direction = MOVE_NAMES.get(next(values))
+                if direction and sequence > connection.received and len(connection.inputs) < MAX_QUEUED:
+                    connection.inputs.append((sequence, direction))
+                    connection.received = sequence
+        except (asyncio.IncompleteReadError, ConnectionError, StopIteration):
+            pass
+        finally:
+            self.disconnect(connection)
+
+    def joined_message(self, connection):
+        """
+        Return the message announcing a player.
+        """
+        body = message(JOINED, connection.id)
+        write_string(body, connection.name)
+        return body
+
+    def disconnect(self, connection):
+        """
+        Forget a client and take it out of the race.
+        """
+        if self.connections.get(connection.id) is not connection:
+            return
+        del self.connections[connection.id]
+        if self.game is not None:
+            self.game.leave(connection.id)
+            self.sent_racers.pop(connection.id, None)
+        self.broadcast(message(LEFT, connection.id))
+        connection.writer.close()
+
+    async def run(self):
+        """
+        Run a tick every tick_ms, catching up after a late one.
+        """
+        loop = asyncio.get_running_loop()
+        interval = self.tick_ms / 1000
+        next_tick = loop.time()
+        while True:
+            self.tick()
+            next_tick += interval
+            delay = next_tick - loop.time()
+            if delay < 0:
+                self.late_ticks += 1
+                if delay < -interval * MAX_LATE_TICKS:
+                    # Too far behind to catch up; let the race slow down instead
+                    next_tick = loop.time()
+            await asyncio.sleep(max(0.0, delay))
+
+    def tick(self):
+        """
+        Run the rules for one tick and send what changed.
+        """
+        start = time.perf_counter_ns()
+        self.clock.advance(self.tick_ms)
+        game = self.game
+        # Every client gets at most one of its moves applied per tick
+        for connection in self.connections.values():
+            if connection.inputs:
+                sequence, direction = connection.inputs.popleft()
+                connection.ack = sequence
+                if game is not None:
+                    game.move(connection.id, direction)
+
+        if self.racing:
+            game.timer.update()
+            if game.timer.time_up():
+                game.time_out()
+            elif not game.finished:
+                game.update()
+            self.send_delta()
+            if game.finished:
+                self.end_round()
+        elif self.clock() >= self.next_round and len(self.connections) >= self.min_players:
+            self.start_round()
+        else:
+            self.send_acks()
+        self.tick_times.append(time.perf_counter_ns() - start)
+
+    def start_round(self):
+        """
+        Start a new round with every connected client racing and a fresh spike seed.
+        """
+        self.round += 1
+        self.racing = True
+        game = self.game = RaceCore(self.level, self.clock, random.Random(self.rng.randrange(2 ** 32)))
+        for connection in self.connections.values():
+            game.join(connection.id, connection.name)
+            connection.inputs.clear()
+            connection.ack = connection.sent_ack = connection.received
+        game.take_changes()
+        self.sent_racers = {racer.id: (racer.position, racer.state) for racer in game.racers.values()}
+        self.sent_time_left = game.timer.time_left
+        self.broadcast(self.round_message())
+
+    def round_message(self):
+        """
+        Return the full state of the current round, sent when it starts and to anyone joining during it.
+        """
+        game = self.game
+        body = message(ROUND, self.round)
+        write_string(body, str(self.level))
+        write_varint(body, self.level_crc)
+        write_varint(body, max(0, game.timer.time_left))
+        write_varint(body, len(game.racers))
+        for racer in game.racers.values():
+            for value in (racer.id, racer.position[0], racer.position[1], STATE_CODES[racer.state]):
+                write_varint(body, value)
+        write_positions(body, list(game.spikes))
+        return body
+
+    def send_delta(self):
+        """
+        Send every client the changes of this tick, with the last of its moves that was applied.
+        """
+        racers, spawned, expired = self.game.take_changes()
+        time_left = max(0, self.game.timer.time_left)
+        flags = 0
+        body = bytearray()
+        if time_left != self.sent_time_left:
+            flags |= TIME_CHANGED
+            write_varint(body, time_left)
+            self.sent_time_left = time_left
+        if racers:
+            flags |= PLAYERS_CHANGED
+            entries = bytearray()
+            count = 0
+            for racer in racers:
+                count += write_racer(entries, racer, self.sent_racers.get(racer.id, (self.game.start, "racing")))
+                self.sent_racers[racer.id] = (racer.position, racer.state)
+            write_varint(body, count)
+            body += entries
+        if spawned:
+            flags |= SPIKES_SPAWNED
+            write_positions(body, spawned)
+        if expired:
+            flags |= SPIKES_EXPIRED
+            write_positions(body, expired)
+
+        # The changes are encoded once; only the acknowledgement differs per client
+        for connection in list(self.connections.values()):
+            if not flags and connection.ack == connection.sent_ack:
+                continue
+            self.send(connection, message(DELTA, connection.ack, flags) + body)
+            connection.sent_ack = connection.ack
+
+    def send_acks(self):
+        """
+        Acknowledge moves applied between rounds, which change nothing.
+        """
+        for connection in list(self.connections.values()):
+            if connection.ack != connection.sent_ack:
+                self.send(connection, message(DELTA, connection.ack, 0))
+                connection.sent_ack = connection.ack
+
+    def end_round(self):
+        """
+        Send the finishing order and schedule the next round.
+        """
+        standings = self.game.standings()
+        body = message(RESULT, self.round, len(standings))
+        for racer in standings:
+            for value in (racer.id, STATE_CODES[racer.state], racer.finish_time, racer.moves):
+                write_varint(body, value)
+        self.broadcast(body)
+        self.racing = False
+        self.rounds_played += 1
+        self.next_round = self.clock() + self.round_break_ms
+
+    def report(self):
+        """
+        Return the tick times and the traffic per player since the last reset_stats().
+        """
+        elapsed = time.perf_counter() - self.stats_start
+        times = sorted(self.tick_times)
+        connections = list(self.connections.values())
+        players = len(connections)
+
+        def per_player_second(total):
+            return total / players / elapsed if players else 0.0
+
+        return {
+            "players": players,
+            "ticks": len(times),
+            "late_ticks": self.late_ticks,
+            "rounds": self.rounds_played,
+            "tick_us": {name: (percentile(times, fraction) or 0) / 1000
+                        for name, fraction in (("median", 0.5), ("p95", 0.95), ("p99", 0.99), ("max", 1.0))},
+            "down_bytes": per_player_second(sum(connection.bytes_sent for connection in connections)),
+            "up_bytes": per_player_second(sum(connection.bytes_received for connection in connections)),
+            "messages": per_player_second(sum(connection.messages_sent for connection in connections)),
+        }
+
+
+class RaceClient:
+    """
+    Class representing a connection to a race server and this client's view of the race.
+
+    The client's own player is shown where its moves will take it: moves are
+    applied locally as soon as they are made, and each server update is
+    replayed under the moves the server has not acknowledged yet.
+    """
+    def __init__(self, name="player"):
+        """
+        Initialize the RaceClient object.
+        """
+        self.name = name[:MAX_NAME]
+        self.reader = None
+        self.writer = None
+        self.id = None
+        self.tick_ms = TICK_MS
+        self.min_players = MIN_PLAYERS
+        self.max_players = MAX_PLAYERS
+        self.names = {}
+        self.round = 0
+        self.level = None
+        self.grid = None
+        self.start = None
+        self.collision = None
+        self.players = {}
+        self.spikes = set()
+        self.time_left = 0
+        self.results = None
+        self.full = False
+        # Moves sent but not yet acknowledged, and the predicted position and state
+        self.sequence = 0
+        self.pending = deque()
+        self.position = None
+        self.state = None
+        self.corrections = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.updated = asyncio.Event()
+
+    async def connect(self, host=HOST, port=PORT):
+        """
+        Connect to a server and ask to join.
+        """
+        self.reader, self.writer = await asyncio.open_connection(host, port)
+        body = message(JOIN)
+        write_string(body, self.name)
+        self.send(body)
+
+    def send(self, body):
+        """
+        Send a message to the server.
+        """
+        data = frame(body)
+        self.writer.write(data)
+        self.bytes_sent += len(data)
+
+    def close(self):
+        """
+        Disconnect from the server.
+        """
+        if self.writer is not None:
+            self.writer.close()
+
+    async def run(self):
+        """
+        Apply messages from the server until it disconnects.
+        """
+        try:
+            while True:
+                body = await read_message(self.reader)
+                self.bytes_received += FRAME.size + len(body)
+                self.handle(body)
+                self.updated.set()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.updated.set()
+
+    def handle(self, body):
+        """
+        Apply one message from the server.
+        """
+        values = read_varints(body)
+        kind = next(values)
+        if kind == WELCOME:
+            self.id, self.tick_ms, self.min_players, self.max_players = (next(values) for _ in range(4))
+        elif kind == JOINED:
+            player_id = next(values)
+            self.names[player_id] = read_string(values)
+        elif kind == LEFT:
+            player_id = next(values)
+            self.names.pop(player_id, None)
+            self.players.pop(player_id, None)
+        elif kind == ROUND:
+            self.start_round(values)
+        elif kind == DELTA:
+            self.apply_delta(values)
+        elif kind == RESULT:
+            self.round = next(values)
+            self.results = []
+            for _ in range(next(values)):
+                player_id, state, finish_time, moves = (next(values) for _ in range(4))
+                racer = Racer(player_id, self.names.get(player_id, "?"), None, STATES[state])
+                racer.finish_time = finish_time
+                racer.moves = moves
+                self.results.append(racer)
+        elif kind == FULL:
+            self.full = True
+
+    def start_round(self, values):
+        """
+        Take the full state of a round from a ROUND message.
+        """
+        self.round = next(values)
+        level = level_name(read_string(values))
+        crc = next(values)
+        level_data = load_level_data(level)
+        if level_checksum(level_data) != crc:
+            raise ValueError(f"Level {level} differs from the server's copy")
+        self.level = level
+        self.grid = level_data.grid()
+        self.start = level_data.position_of(PLAYER)
+        x, y = self.start
+        self.grid[y][x] = EMPTY
+        self.collision = CollisionGrid(self.grid)
+        self.time_left = next(values)
+        self.players = {}
+        for _ in range(next(values)):
+            player_id, x, y, state = (next(values) for _ in range(4))
+            self.players[player_id] = Racer(player_id, self.names.get(player_id, "?"), (x, y), STATES[state])
+        self.spikes = set()
+        for x, y in read_positions(values):
+            self.set_tile(x, y, SPIKE)
+        self.results = None
+        self.pending.clear()
+        self.position = None
+        self.reconcile()
+
+    def apply_delta(self, values):
+        """
+        Apply the changes of one server tick, then replay the moves still in flight.
+        """
+        ack = next(values)
+        flags = next(values)
+        while self.pending and self.pending[0][0] <= ack:
+            self.pending.popleft()
+        if flags & TIME_CHANGED:
+            self.time_left = next(values)
+        if flags & PLAYERS_CHANGED:
+            self.read_players(values)
+        if flags & SPIKES_SPAWNED:
+            for x, y in read_positions(values):
+                self.set_tile(x, y, SPIKE)
+        if flags & SPIKES_EXPIRED:
+            for x, y in read_positions(values):
+                self.set_tile(x, y, EMPTY)
+        self.reconcile()
+
+    def read_players(self, values):
+        """
+        Apply the player entries of a delta.
+        """
+        for _ in range(next(values)):
+            player_id, operation = divmod(next(values), 8)
+            racer = self.players.get(player_id)
+            if racer is None:
+                racer = self.players[player_id] = Racer(player_id, self.names.get(player_id, "?"), self.start)
+            if operation in STEP_OFFSETS:
+                dx, dy = STEP_OFFSETS[operation]
+                racer.position = (racer.position[0] + dx, racer.position[1] + dy)
+            elif operation == SET_STATE:
+                racer.state = STATES[next(values)]
+            elif operation == SET_POSITION:
+                racer.position = (next(values), next(values))
+
+    def set_tile(self, x, y, tile):
+        """
+        Change one cell of the grid, as sent by the server.
+        """
+        self.grid[y][x] = tile
+        if tile == SPIKE:
+            self.spikes.add((x, y))
+        else:
+            self.spikes.discard((x, y))
+
+    def predict(self, position, state, direction):
+        """
+        Return the position and state one move would lead to.
+        """
+        if state != "racing":
+            return position, state
+        position, block = resolve_move(self.collision, position, direction)
+        return position, FINISHING_TILES.get(block, state)
+
+    def reconcile(self):
+        """
+        Put the own player where the server last saw it, moved by every move the
+        server has not applied yet. Counts a correction when that differs from
+        what was predicted.
+        """
+        me = self.players.get(self.id)
+        if me is None:
+            self.position = self.state = None
+            return
+        position, state = me.position, me.state
+        for _, direction in self.pending:
+            position, state = self.predict(position, state, direction)
+        if self.position is not None and (position, state) != (self.position, self.state):
+            self.corrections += 1
+        self.position, self.state = position, state
+
+    def move(self, direction):
+        """
+        Send a move and apply it locally at once. Returns False if the player cannot move.
+        """
+        if self.state != "racing" or direction not in MOVE_CODES or len(self.pending) >= MAX_QUEUED:
+            return False
+        self.sequence += 1
+        self.pending.append((self.sequence, direction))
+        self.send(message(MOVE, self.sequence, MOVE_CODES[direction]))
+        self.position, self.state = self.predict(self.position, self.state, direction)
+        return True
+
+
+class BotClient(RaceClient):
+    """
+    Class representing a client that races by itself, for testing and load generation.
+    """
+    def __init__(self, name="bot", rng=None, noise=0.1):
+        """
+        Initialize the BotClient object. noise is the chance of a random move
+        instead of a step along the shortest path to the exit.
+        """
+        super().__init__(name)
+        self.rng = rng if rng is not None else random.Random()
+        self.noise = noise
+        self.paths = None
+
+    def start_round(self, values):
+        """
+        Take the state of a new round and plan paths over its grid.
+        """
+        self.paths = None
+        super().start_round(values)
+        self.paths = DistanceField(self.grid)
+
+    def set_tile(self, x, y, tile):
+        """
+        Change one cell of the grid and update the planned paths.
+        """
+        super().set_tile(x, y, tile)
+        if self.paths is not None:
+            self.paths.cell_changed(x, y)
+
+    def choose(self):
+        """
+        Return the next move to make, or None to wait.
+        """
+        if self.state != "racing":
+            return None
+        if self.rng.random() < self.noise:
+            return self.rng.choice(list(DIRECTIONS))
+        return self.paths.next_step(*self.position)
+
+    async def play(self, host=HOST, port=PORT, move_ms=120):
+        """
+        Connect and make a move every move_ms milliseconds until the server disconnects.
+        """
+        await self.connect(host, port)
+        receiver = asyncio.create_task(self.run())
+        # Bots start out of step so their moves do not all land on the same tick
+        await asyncio.sleep(self.rng.random() * move_ms / 1000)
+        while not receiver.done():
+            direction = self.choose()
+            if direction:
+                self.move(direction)
+            await asyncio.sleep(move_ms / 1000)
+        self.close()
+
+
+async def run_bots(host, port, count, move_ms, noise, seed):
+    """
+    Race count bots on a server until it disconnects them, and return their
+    (moves sent, prediction corrections) in total.
+    """
+    bots = [BotClient(f"bot{index}", random.Random(f"{seed}-{index}"), noise) for index in range(count)]
+    await asyncio.gather(*(bot.play(host, port, move_ms) for bot in bots))
+    return sum(bot.sequence for bot in bots), sum(bot.corrections for bot in bots)
+
+
+def bot_process(host, port, count, move_ms, noise, seed, results):
+    """
+    Run bots in a process of their own, so their work does not count towards the server's tick time.
+    """
+    results.put(asyncio.run(run_bots(host, port, count, move_ms, noise, seed)))
+
+
+async def load_test(level, counts, seconds, tick_ms, move_ms, noise, seed):
+    """
+    Race growing numbers of bots against a local server and return one report per count.
+    """
+    loop = asyncio.get_running_loop()
+    reports = []
+    for count in counts:
+        server = RaceServer(level, tick_ms, min_players=count, seed=seed)
+        port = await server.start(HOST, 0)
+        results = multiprocessing.Queue()
+        process = multiprocessing.Process(target=bot_process, args=(HOST, port, count, move_ms, noise, seed, results))
+        process.start()
+        while len(server.connections) < count:
+            await asyncio.sleep(0.05)
+        server.reset_stats()
+        await asyncio.sleep(seconds)
+        report = server.report()
+        await server.close()
+        report["moves"], report["corrections"] = await loop.run_in_executor(None, results.get)
+        process.join()
+        reports.append(report)
+    return reports
+
+
+def report_lines(reports):
+    """
+    Return the load test reports as a table.
+    """
+    lines = ["players  rounds  ticks  late   tick median/p95/p99/max (us)   down B/s  up B/s  msgs/s  corrections",
+             "                                                            per player"]
+    for report in reports:
+        tick = report["tick_us"]
+        lines.append(f"{report['players']:7}  {report['rounds']:6}  {report['ticks']:5}  {report['late_ticks']:4}   "
+                     f"{tick['median']:6.0f} {tick['p95']:6.0f} {tick['p99']:6.0f} {tick['max']:6.0f}   "
+                     f"{report['down_bytes']:8.0f}  {report['up_bytes']:6.0f}  {report['messages']:6.1f}  "
+                     f"{report['corrections']:5} of {report['moves']}")
+    return lines
+
+
+async def serve(level, host, port, tick_ms, min_players, seed, bots, move_ms, noise):
+    """
+    Run a race server until interrupted, with bots joining it if asked.
+    """
+    server = RaceServer(level, tick_ms, min_players=min_players, seed=seed)
+    port = await server.start(host, port)
+    print(f"Racing level {level} on {host}:{port}; a round starts once {min_players} players have joined")
+    for index in range(bots):
+        bot = BotClient(f"bot{index}", random.Random(f"{seed}-{index}"), noise)
+        asyncio.create_task(bot.play(host, port, move_ms))
+    try:
+        await server.task
+    finally:
+        await server.close()
+
+
+def main(argv=None):
+    """
+    Serve a race, or load test the server with bots, from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Host a Graveyard Shift race over the network.")
+    parser.add_argument("--level", default="1")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--players", type=int, default=MIN_PLAYERS, help="players needed to start a round")
+    parser.add_argument("--tick-ms", type=int, default=TICK_MS, help="milliseconds per server tick")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the spike seeds of every round")
+    parser.add_argument("--bots", type=int, default=0, help="bots to add to the race")
+    parser.add_argument("--move-ms", type=int, default=120, help="milliseconds between bot moves")
+    parser.add_argument("--noise", type=float, default=0.1, help="chance of a random bot move")
+    parser.add_argument("--load", type=int, nargs="+", metavar="COUNT", help="load test with these numbers of bots")
+    parser.add_argument("--seconds", type=float, default=10, help="seconds to measure each load test count")
+    args = parser.parse_args(argv)
+
+    for count in [args.players, args.bots] + (args.load or []):
+        if not 0 <= count <= MAX_PLAYERS:
+            parser.error(f"a race has at most {MAX_PLAYERS} players")
+    level = level_name(args.level)
+
+    if args.load:
+        seed = 0 if args.seed is None else args.seed
+        reports = asyncio.run(load_test(level, args.load, args.seconds, args.tick_ms, args.move_ms, args.noise, seed))
+        print(f"Level {level}, {args.tick_ms} ms ticks, bots moving every {args.move_ms} ms, {args.seconds:g}s per count")
+        print("\n".join(report_lines(reports)))
+        return
+    try:
+        asyncio.run(serve(level, args.host, args.port, args.tick_ms, max(1, args.players), args.seed, args.bots,
+                          args.move_ms, args.noise))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""
+Author: Agilan Hariharan
+Description: Pygame client for the Graveyard Shift race mode
+Creation Date: October 18, 2026
+Last Modified: October 18, 2026
+
+Connects to a race server started with race.py and draws the race. Arrow
+keys move the player at once; the server's updates arrive in between frames
+on the same asyncio loop and correct the prediction if a spike got there
+first. Other players are drawn faded with their names above them.
+
+Usage:
+    python Code/race.py --players 2
+    python Code/raceclient.py --name Ana
+    python Code/raceclient.py --host 192.168.1.20 --name Sam
+"""
+# Import and Initialize
+import argparse
+import asyncio
+import time
+import pygame
+from assets import assets, text
+from audio import audio
+from presenter import RESIZE_EVENTS, from_environment as presenter_from_environment
+from race import HOST, PORT, RaceClient
+from scenes import KEY_REPEAT_DELAY, KEY_REPEAT_INTERVAL, MOVE_KEYS
+from sprites import (BACKGROUND_IMAGE, BRICK_SIZE, HUD_HEIGHT, TITLE_FONT, WHITE, draw_maze_chunk, screen_height,
+                     screen_size, screen_width)
+from viewport import CHUNK_TILES, ChunkCache, Viewport
+
+FPS = 60
+# Name tag colours, one per player slot
+PLAYER_COLORS = [(255, 210, 60), (90, 200, 255), (120, 255, 120), (255, 120, 200),
+                 (255, 150, 60), (180, 140, 255), (80, 255, 220), (240, 240, 240)]
+# Opacity of the other players
+GHOST_ALPHA = 140
+STATUS_TEXT = {"win": "You escaped!", "spike": "You hit a spike", "timeout": "Time's up"}
+
+
+class RaceView:
+    """
+    Class representing the race as drawn on the screen.
+    """
+    def __init__(self, client, screen):
+        """
+        Initialize the RaceView object.
+        """
+        self.client = client
+        self.screen = screen
+        self.round = None
+        self.viewport = None
+        self.chunks = None
+        self.static_layer = pygame.Surface(screen_size).convert()
+        self.static_dirty = True
+        self.spikes = set()
+        self.state = None
+        self.ghost = assets.image("Images/character.png", (BRICK_SIZE, BRICK_SIZE)).copy()
+        self.ghost.set_alpha(GHOST_ALPHA)
+        # Loaded here because chunks may be drawn on the chunk cache's worker thread
+        self.end_block_image = assets.image("Images/end_block.jpg", (BRICK_SIZE, BRICK_SIZE))
+
+    def start_round(self):
+        """
+        Set up the camera and the maze chunks for the round the client is in.
+        """
+        client = self.client
+        self.round = client.round
+        if self.chunks is not None:
+            self.chunks.close()
+        grid = client.grid
+        world_size = (len(grid[0]) * BRICK_SIZE, len(grid) * BRICK_SIZE)
+        self.viewport = Viewport((0, HUD_HEIGHT, screen_width, screen_height - HUD_HEIGHT), world_size)
+        self.viewport.center_on(self.world_rect(*client.start))
+        # Walls never change during a race, so chunks are drawn once per round
+        self.chunks = ChunkCache(lambda column, row: draw_maze_chunk(grid, column, row, BRICK_SIZE, self.screen,
+                                                                     self.end_block_image),
+                                 threaded=self.viewport.scrolls())
+        self.static_dirty = True
+        self.spikes = set(client.spikes)
+
+    def world_rect(self, x, y):
+        """
+        Return the rectangle covered by the grid cell (x, y) in maze pixels.
+        """
+        return pygame.Rect(x * BRICK_SIZE, y * BRICK_SIZE, BRICK_SIZE, BRICK_SIZE)
+
+    def build_static_layer(self):
+        """
+        Bake the background, the visible part of the maze and the title into one surface.
+        """
+        layer = self.static_layer
+        layer.blit(assets.image(BACKGROUND_IMAGE, screen_size), (0, 0))
+        viewport = self.viewport
+        if viewport is not None:
+            chunk_size = CHUNK_TILES * BRICK_SIZE
+            layer.set_clip(viewport.view)
+            for column, row in viewport.visible_chunks(chunk_size):
+                chunk_rect = pygame.Rect(column * chunk_size, row * chunk_size, chunk_size, chunk_size)
+                layer.blit(self.chunks.get((column, row)), viewport.to_screen(chunk_rect))
+            layer.set_clip(None)
+            self.chunks.prefetch(viewport.visible_chunks(chunk_size, margin=1))
+        title_text = text.render(TITLE_FONT, 36, "Graveyard Shift", WHITE)
+        layer.blit(title_text, title_text.get_rect(center=(screen_width // 2, 20)))
+        subtitle_text = text.render(TITLE_FONT, 18, "race", WHITE)
+        layer.blit(subtitle_text, subtitle_text.get_rect(topleft=(10, 20)))
+        self.static_dirty = False
+
+    def play_sounds(self):
+        """
+        Play the sounds for new spikes and for the end of the own race.
+        """
+        client = self.client
+        if client.spikes - self.spikes:
+            audio.play("spike")
+        self.spikes = set(client.spikes)
+        if self.state == "racing" and client.state != "racing" and client.state is not None:
+            audio.play("win" if client.state == "win" else "lose")
+        self.state = client.state
+
+    def status(self):
+        """
+        Return the line telling the player what is going on, or None while racing.
+        """
+        client = self.client
+        if client.full:
+            return "The race is full"
+        if client.grid is None:
+            return f"Waiting for players ({len(client.names)}/{client.min_players})"
+        if client.state is None:
+            return "Watching; you race next round"
+        return STATUS_TEXT.get(client.state)
+
+    def draw(self):
+        """
+        Draw the whole frame.
+        """
+        client = self.client
+        screen = self.screen
+        if client.grid is not None and client.round != self.round:
+            self.start_round()
+        self.play_sounds()
+
+        viewport = self.viewport
+        if viewport is not None:
+            followed = client.position if client.position is not None else client.start
+            if viewport.follow(self.world_rect(*followed)):
+                self.static_dirty = True
+        if self.static_dirty:
+            self.build_static_layer()
+        screen.blit(self.static_layer, (0, 0))
+
+        if viewport is not None:
+            visible = viewport.world_rect()
+            screen.set_clip(viewport.view)
+            spike_image = assets.image("Images/spike.png", (BRICK_SIZE, BRICK_SIZE))
+            for x, y in client.spikes:
+                rect = self.world_rect(x, y)
+                if rect.colliderect(visible):
+                    screen.blit(spike_image, viewport.to_screen(rect))
+            for racer in client.players.values():
+                if racer.id == client.id or racer.state != "racing":
+                    continue
+                rect = viewport.to_screen(self.world_rect(*racer.position))
+                screen.blit(self.ghost, rect)
+                name_text = text.render(TITLE_FONT, 14, racer.name, PLAYER_COLORS[racer.id % len(PLAYER_COLORS)])
+                screen.blit(name_text, name_text.get_rect(midbottom=rect.midtop))
+            if client.state == "racing":
+                character_image = assets.image("Images/character.png", (BRICK_SIZE, BRICK_SIZE))
+                screen.blit(character_image, viewport.to_screen(self.world_rect(*client.position)))
+            screen.set_clip(None)
+            timer_text = text.number(TITLE_FONT, 24, "Time Left: ", client.time_left, WHITE)
+            screen.blit(timer_text, timer_text.get_rect(topright=(screen_width - 10, 20)))
+
+        status = self.status()
+        if status:
+            status_text = text.render(TITLE_FONT, 36, status, WHITE)
+            screen.blit(status_text, status_text.get_rect(center=(screen_width // 2, screen_height // 2 - 60)))
+        if client.results:
+            for place, racer in enumerate(client.results, start=1):
+                outcome = f"{racer.finish_time / 1000:.2f}s" if racer.state == "win" else racer.state
+                line = text.render(TITLE_FONT, 24, f"{place}. {racer.name}  {outcome}", WHITE)
+                screen.blit(line, line.get_rect(center=(screen_width // 2, screen_height // 2 - 20 + place * 26)))
+
+    def close(self):
+        """
+        Stop drawing chunks ahead of time.
+        """
+        if self.chunks is not None:
+            self.chunks.close()
+
+
+async def play(client, view, presenter, fps=FPS):
+    """
+    Run the frame loop until the window is closed or the server goes away.
+    """
+    receiver = asyncio.create_task(client.run())
+    frame_time = 1 / fps
+    running = True
+    while running and not receiver.done():
+        start = time.perf_counter()
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                running = False
+            elif event.type in RESIZE_EVENTS:
+                presenter.layout()
+            elif event.type == pygame.KEYDOWN:
+                direction = MOVE_KEYS.get(event.key)
+                if direction and client.move(direction):
+                    audio.play("move")
+        view.draw()
+        presenter.present()
+        # Server updates are read while the loop waits for the next frame
+        await asyncio.sleep(max(0.0, frame_time - (time.perf_counter() - start)))
+    client.close()
+    view.close()
+    await receiver
+
+
+async def run(host, port, name, presenter, screen, fps):
+    """
+    Connect to the server and play until the window is closed.
+    """
+    client = RaceClient(name)
+    try:
+        await client.connect(host, port)
+    except OSError as error:
+        print(f"Could not connect to {host}:{port}: {error}")
+        return
+    try:
+        await play(client, RaceView(client, screen), presenter, fps)
+    except ValueError as error:
+        # The server is racing a level this copy of the game does not have
+        print(error)
+
+
+def main(argv=None):
+    """
+    Join a race from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Join a Graveyard Shift race.")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--name", default="player")
+    parser.add_argument("--fps", type=int, default=FPS)
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    pygame.mixer.init()
+    presenter = presenter_from_environment(screen_size)
+    screen = presenter.open()
+    pygame.display.set_caption("Graveyard Shift Race")
+    pygame.key.set_repeat(KEY_REPEAT_DELAY, KEY_REPEAT_INTERVAL)
+    audio.loader = assets.sound
+    try:
+        asyncio.run(run(args.host, args.port, args.name, presenter, screen, args.fps))
+    except KeyboardInterrupt:
+        pass
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
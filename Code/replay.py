@@ -0,0 +1,331 @@
+"""
+Author: Agilan Hariharan
+Description: Input recording and deterministic replay for Graveyard Shift
+Creation Date: October 18, 2026
+Last Modified: October 18, 2026
+
+A recording holds the level, the spike RNG seed and the ordered stream of
+frame ticks and moves of one session. Moves never read the clock and every
+rule only reads it inside a tick, so feeding the same stream to a game built
+with the same seed reproduces every spike wave and the outcome exactly.
+
+Set GS_RECORD to a file name to record the next level played in main.py.
+
+Usage:
+    python Code/replay.py session.gsr more.gsr ...
+    python Code/replay.py session.gsr --watch --speed 4
+"""
+# Import and Initialize
+import argparse
+import os
+import random
+import struct
+import time
+import zlib
+from core import DIRECTIONS, GameCore, ManualClock
+from levelfile import checksum, pack_header
+
+MAGIC = b"GSRP"
+VERSION = 1
+# magic, version, seed, start time, level checksum, outcome, moves, time left,
+# spike waves, spike digest, level name length
+HEADER = struct.Struct("<4sHQQIBIiIIH")
+
+# Stream opcodes: a frame tick carries the milliseconds since the previous
+# tick, a move carries no time at all
+TICK = 0
+MOVE_CODES = {direction: code for code, direction in enumerate(DIRECTIONS, start=1)}
+MOVE_NAMES = {code: direction for direction, code in MOVE_CODES.items()}
+
+OUTCOMES = (None, "win", "spike", "timeout")
+SPEEDS = (1, 2, 4, 8, 16)
+
+
+def level_checksum(level_data):
+    """
+    Return the checksum of a level's settings and tiles.
+    """
+    return checksum(pack_header(level_data), level_data.tile_bytes())
+
+
+def write_varint(buffer, value):
+    """
+    Append an unsigned integer to a bytearray, seven bits per byte.
+    """
+    while value >= 0x80:
+        buffer.append(value & 0x7F | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def read_varints(data):
+    """
+    Yield the unsigned integers packed in data by write_varint.
+    """
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            yield value
+            value = shift = 0
+
+
+class SpikeDigest:
+    """
+    Class representing a running checksum of every spike wave placed in a game.
+    """
+    def __init__(self, game):
+        """
+        Initialize the SpikeDigest object.
+        """
+        self.crc = 0
+        self.waves = 0
+        self.last_wave = game.spawn_spikes_timer
+
+    def observe(self, game):
+        """
+        Fold in the spikes of a wave spawned since the last call, in placement order.
+        """
+        wave_time = game.spawn_spikes_timer
+        if wave_time == self.last_wave:
+            return
+        self.last_wave = wave_time
+        self.waves += 1
+        positions = [coordinate for position, spawn_time in game.spikes.items() if spawn_time == wave_time
+                     for coordinate in position]
+        self.crc = zlib.crc32(struct.pack(f"<q{len(positions)}I", wave_time, *positions), self.crc)
+
+
+def step(game, now):
+    """
+    Run one frame of the rules at time now, the same way the game loop does.
+    """
+    game.clock.now = now
+    game.timer.update()
+    if game.outcome is None:
+        game.update()
+
+
+class Recorder:
+    """
+    Class representing a recording in progress.
+    """
+    def __init__(self, game, seed):
+        """
+        Start recording a game that was just built with random.Random(seed).
+        """
+        self.game = game
+        self.level = game.level
+        self.seed = seed
+        self.level_crc = level_checksum(game.level_data)
+        self.start_time = self.last_time = game.clock()
+        self.stream = bytearray()
+        self.digest = SpikeDigest(game)
+        self.finished = False
+
+    def move(self, direction):
+        """
+        Record a move passed to move_player.
+        """
+        if not self.finished and direction in MOVE_CODES:
+            write_varint(self.stream, MOVE_CODES[direction])
+
+    def tick(self, now):
+        """
+        Record a frame that ran the rules at time now.
+        """
+        if self.finished:
+            return
+        write_varint(self.stream, (now - self.last_time) << 3 | TICK)
+        self.last_time = now
+        self.digest.observe(self.game)
+        if self.game.outcome is not None:
+            self.finished = True
+
+    def to_bytes(self):
+        """
+        Return the recording in its binary form.
+        """
+        game = self.game
+        name = str(self.level).encode("utf-8")
+        header = HEADER.pack(MAGIC, VERSION, self.seed, self.start_time, self.level_crc,
+                             OUTCOMES.index(game.outcome), game.moves, game.timer.time_left,
+                             self.digest.waves, self.digest.crc, len(name))
+        return header + name + zlib.compress(bytes(self.stream), 9)
+
+    def save(self, path):
+        """
+        Write the recording to a file.
+        """
+        with open(path, "wb") as recording_file:
+            recording_file.write(self.to_bytes())
+
+
+class Recording:
+    """
+    Class representing a loaded recording.
+    """
+    def __init__(self, level, seed, start_time, level_crc, expected, events):
+        """
+        Initialize the Recording object. events is a list of (time, direction)
+        pairs where direction is None for a frame tick.
+        """
+        self.level = level
+        self.seed = seed
+        self.start_time = start_time
+        self.level_crc = level_crc
+        self.expected = expected
+        self.events = events
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Parse a recording produced by Recorder.to_bytes.
+        """
+        (magic, version, seed, start_time, level_crc, outcome, moves, time_left,
+         waves, crc, name_length) = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Not a Graveyard Shift recording")
+        if version != VERSION:
+            raise ValueError(f"Unsupported recording version {version}")
+        name = data[HEADER.size:HEADER.size + name_length].decode("utf-8")
+        level = int(name) if name.isdigit() else name
+
+        events = []
+        now = start_time
+        for value in read_varints(zlib.decompress(data[HEADER.size + name_length:])):
+            if value & 7 == TICK:
+                now += value >> 3
+                events.append((now, None))
+            else:
+                events.append((now, MOVE_NAMES[value]))
+        expected = {"outcome": OUTCOMES[outcome], "moves": moves, "time_left": time_left,
+                    "waves": waves, "crc": crc}
+        return cls(level, seed, start_time, level_crc, expected, events)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a recording from a file.
+        """
+        with open(path, "rb") as recording_file:
+            return cls.from_bytes(recording_file.read())
+
+    def new_game(self, game_class=GameCore, **options):
+        """
+        Build the game the recording was made on, with a manual clock at its start time.
+        """
+        clock = ManualClock(self.start_time)
+        game = game_class(self.level, clock=clock, rng=random.Random(self.seed), **options)
+        if level_checksum(game.level_data) != self.level_crc:
+            raise ValueError(f"Level {self.level} has changed since the recording was made")
+        return game
+
+
+def replay(recording, game=None):
+    """
+    Play a recording as fast as possible and return the finished game and a
+    dictionary of its results.
+    """
+    game = game if game is not None else recording.new_game()
+    digest = SpikeDigest(game)
+    for now, direction in recording.events:
+        if direction is None:
+            step(game, now)
+            digest.observe(game)
+        else:
+            game.move_player(direction)
+    return game, {"outcome": game.outcome, "moves": game.moves, "time_left": game.timer.time_left,
+                  "waves": digest.waves, "crc": digest.crc}
+
+
+def watch(recording, speed=1):
+    """
+    Show a recording in the game window at the given speed multiplier.
+    """
+    import pygame
+    pygame.init()
+    from sprites import Maze, screen_size
+    pygame.display.set_mode(screen_size)
+    pygame.display.set_caption("Graveyard Shift replay")
+
+    game = recording.new_game(Maze)
+    frame_clock = pygame.time.Clock()
+    wall_start = pygame.time.get_ticks()
+    digest = SpikeDigest(game)
+    events = recording.events
+    index = 0
+    while index < len(events):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return game, None
+
+        # Apply every input up to the point the accelerated clock has reached
+        target = recording.start_time + (pygame.time.get_ticks() - wall_start) * speed
+        while index < len(events) and events[index][0] <= target:
+            now, direction = events[index]
+            if direction is None:
+                step(game, now)
+                digest.observe(game)
+            else:
+                game.move_player(direction)
+            index += 1
+
+        pygame.display.update(game.render(game.timer))
+        frame_clock.tick(60)
+
+    # Hold the final frame so the outcome can be seen
+    pygame.time.wait(1000)
+    return game, {"outcome": game.outcome, "moves": game.moves, "time_left": game.timer.time_left,
+                  "waves": digest.waves, "crc": digest.crc}
+
+
+def recorder_from_environment(game, seed):
+    """
+    Return a Recorder for the game if GS_RECORD names an output file, otherwise None.
+    """
+    return Recorder(game, seed) if os.environ.get("GS_RECORD") else None
+
+
+def save_from_environment(recorder):
+    """
+    Write the recording to the file named by GS_RECORD.
+    """
+    if recorder is not None:
+        recorder.save(os.environ["GS_RECORD"])
+
+
+def main(argv=None):
+    """
+    Replay recordings from the command line and check them against their recorded results.
+    """
+    parser = argparse.ArgumentParser(description="Replay Graveyard Shift recordings.")
+    parser.add_argument("recordings", nargs="+", help="recording files (.gsr)")
+    parser.add_argument("--watch", action="store_true", help="show the replay in a window")
+    parser.add_argument("--speed", type=int, choices=SPEEDS, default=1, help="playback speed when watching")
+    args = parser.parse_args(argv)
+
+    mismatches = 0
+    start = time.perf_counter()
+    for path in args.recordings:
+        recording = Recording.load(path)
+        if args.watch:
+            _, results = watch(recording, args.speed)
+            if results is None:
+                break
+        else:
+            _, results = replay(recording)
+        if results != recording.expected:
+            mismatches += 1
+            print(f"{path}: MISMATCH recorded {recording.expected} replayed {results}")
+        else:
+            print(f"{path}: {results['outcome']} after {results['moves']} moves, {results['waves']} spike waves")
+    elapsed = time.perf_counter() - start
+    print(f"{len(args.recordings)} recordings in {elapsed:.3f}s, {mismatches} mismatched")
+    raise SystemExit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,502 @@
+"""
+Author: Agilan Hariharan
+Description: Scene manager and the scenes of Graveyard Shift
+Creation Date: October 18, 2026
+Last Modified: October 18, 2026
+
+Every screen of the game is a Scene run by one SceneManager loop with shared
+frame pacing. The level runs its rules at a fixed rate, independent of the
+frame rate. Idle scenes (menus and end screens) sleep in the event queue
+and only redraw after input, so they use no CPU while nobody is playing.
+"""
+# Import and Initialize
+import random
+from collections import deque
+import pygame
+from assets import text
+from audio import audio
+from core import GameClock
+from presenter import RESIZE_EVENTS
+from profiler import TOGGLE_KEY
+from replay import recorder_from_environment, save_from_environment
+from sprites import Maze, TITLE_FONT, WHITE
+
+MOVE_KEYS = {pygame.K_LEFT: "left", pygame.K_RIGHT: "right", pygame.K_UP: "up", pygame.K_DOWN: "down"}
+PAUSE_KEY = pygame.K_p
+
+# Game time advanced by one simulation step, in milliseconds
+SIM_STEP_MS = 20
+# Steps run in one frame before the simulation gives up catching up
+MAX_STEPS_PER_FRAME = 10
+# Held arrow keys start repeating after the delay, then move every interval
+KEY_REPEAT_DELAY = 250
+KEY_REPEAT_INTERVAL = 120
+
+
+class Scene:
+    """
+    Class representing one screen of the game.
+    """
+    # Idle scenes wait for input instead of running every frame
+    idle = True
+
+    def __init__(self, manager):
+        """
+        Initialize the Scene object.
+        """
+        self.manager = manager
+        self.needs_redraw = True
+
+    def enter(self, **options):
+        """
+        Called when the scene becomes the current one.
+        """
+
+    def exit(self):
+        """
+        Called when another scene replaces this one.
+        """
+
+    def handle_event(self, event):
+        """
+        React to one pygame event.
+        """
+
+    def update(self):
+        """
+        Advance the scene by one frame.
+        """
+
+    def draw(self, screen):
+        """
+        Draw the scene. Returns the list of changed rectangles, or None if
+        the whole screen has to be flipped.
+        """
+        return None
+
+
+class SceneManager:
+    """
+    Class representing the main loop that runs the current scene.
+    """
+    def __init__(self, screen, profiler, fps=60, presenter=None):
+        """
+        Initialize the SceneManager object. With a Presenter, scenes draw into its
+        framebuffer and mouse positions are mapped back into it.
+        """
+        self.screen = presenter.frame if presenter else screen
+        self.presenter = presenter
+        self.profiler = profiler
+        self.fps = fps
+        self.clock = pygame.time.Clock()
+        self.scenes = {}
+        self.scene = None
+        self.pending = None
+        self.running = False
+
+        # Nothing in the game reacts to mouse movement, so it should not wake idle scenes
+        pygame.event.set_blocked(pygame.MOUSEMOTION)
+
+    def add(self, name, scene):
+        """
+        Register a scene under a name.
+        """
+        self.scenes[name] = scene
+
+    def switch(self, name, **options):
+        """
+        Change to another scene once the current frame has been handled.
+        """
+        self.pending = (name, options)
+
+    def apply_switch(self):
+        """
+        Make the pending scene the current one.
+        """
+        name, options = self.pending
+        self.pending = None
+        if self.scene is not None:
+            self.scene.exit()
+        self.scene = self.scenes[name]
+        self.scene.needs_redraw = True
+        self.scene.enter(**options)
+
+    def frame(self):
+        """
+        Run one frame of the current scene.
+        """
+        profiler = self.profiler
+        self.clock.tick(self.fps)
+        scene = self.scene
+        if scene.idle and not scene.needs_redraw:
+            # Sleep until something happens
+            events = [pygame.event.wait()] + pygame.event.get()
+        else:
+            events = pygame.event.get()
+
+        profiler.begin_frame()
+        presenter = self.presenter
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.running = False
+                return
+            if presenter:
+                if event.type in RESIZE_EVENTS:
+                    presenter.layout()
+                    scene.needs_redraw = True
+                    continue
+                event = presenter.map_event(event)
+            scene.handle_event(event)
+            scene.needs_redraw = True
+        profiler.mark("events")
+
+        scene.update()
+        if self.pending:
+            self.apply_switch()
+            scene = self.scene
+
+        if scene.idle and not scene.needs_redraw:
+            profiler.end_frame()
+            return
+        dirty_rects = scene.draw(self.screen)
+        scene.needs_redraw = False
+        profiler.mark("render")
+        self.present(dirty_rects)
+        profiler.mark("display")
+        profiler.end_frame()
+
+    def present(self, dirty_rects=None):
+        """
+        Show the changed rectangles of the screen, or all of it for None.
+        """
+        if self.presenter:
+            self.presenter.present(dirty_rects)
+        elif dirty_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects)
+
+    def start(self, name, **options):
+        """
+        Make the named scene the first one.
+        """
+        self.switch(name, **options)
+        self.apply_switch()
+        self.running = True
+
+    def run(self, name=None, **options):
+        """
+        Start with the named scene, if given, and run until the window is closed.
+        """
+        if name is not None:
+            self.start(name, **options)
+        while self.running:
+            self.frame()
+
+
+class MenuScene(Scene):
+    """
+    Class representing the main menu.
+    """
+    def __init__(self, manager, home_screen):
+        """
+        Initialize the MenuScene object around a HomeScreen that is kept for the whole run.
+        """
+        super().__init__(manager)
+        self.home_screen = home_screen
+
+    def handle_event(self, event):
+        """
+        Start a level or open the instructions when a button is clicked.
+        """
+        if event.type != pygame.MOUSEBUTTONDOWN:
+            return
+        home_screen = self.home_screen
+        if home_screen.level1_rect.collidepoint(event.pos):
+            self.manager.switch("level", level=1)
+        elif home_screen.level2_rect.collidepoint(event.pos):
+            self.manager.switch("level", level=2)
+        elif home_screen.level3_rect.collidepoint(event.pos):
+            self.manager.switch("level", level=3)
+        elif home_screen.how_to_play_rect.collidepoint(event.pos):
+            self.manager.switch("how_to_play")
+
+    def draw(self, screen):
+        """
+        Draw the Home screen.
+        """
+        self.home_screen.draw(screen)
+        return None
+
+
+class HowToPlayScene(Scene):
+    """
+    Class representing the instructions screen.
+    """
+    def __init__(self, manager, how_to_play_screen):
+        """
+        Initialize the HowToPlayScene object.
+        """
+        super().__init__(manager)
+        self.how_to_play_screen = how_to_play_screen
+
+    def handle_event(self, event):
+        """
+        Go back to the menu when the back button is clicked.
+        """
+        if event.type == pygame.MOUSEBUTTONDOWN and self.how_to_play_screen.back_rect.collidepoint(event.pos):
+            self.manager.switch("menu")
+
+    def draw(self, screen):
+        """
+        Draw the How to Play screen.
+        """
+        self.how_to_play_screen.draw(screen)
+        return None
+
+
+class LevelScene(Scene):
+    """
+    Class representing a level being played.
+
+    The rules run in fixed steps of SIM_STEP_MS of game time, however fast the
+    screen is redrawn. How many steps are due comes from a pacing GameClock,
+    which can be paused with P or run faster or slower than real time. Key
+    presses are queued and applied one per step, and a held arrow key keeps
+    moving the player after a delay.
+    """
+    idle = False
+
+    def __init__(self, manager, timer, game_clock, repeat_delay=KEY_REPEAT_DELAY, repeat_interval=KEY_REPEAT_INTERVAL,
+                 stats=None, pace_clock=None):
+        """
+        Initialize the LevelScene object. game_clock is a ManualClock advanced one
+        step at a time, so a recording can replay the level. repeat_delay and
+        repeat_interval are in milliseconds; a delay of 0 turns key repeat off.
+        stats is an optional StatsStore that every start and finish is logged to.
+        pace_clock is the real-time GameClock that decides when steps are due.
+        """
+        super().__init__(manager)
+        self.timer = timer
+        self.game_clock = game_clock
+        self.pace_clock = pace_clock if pace_clock is not None else GameClock()
+        self.stats = stats
+        self.repeat_delay = repeat_delay
+        self.repeat_interval = repeat_interval
+        self.level = None
+        self.maze = None
+        self.seed = None
+        self.recorder = None
+        self.inputs = deque()
+        self.held = []
+        self.next_repeat = 0
+        self.wall_time = 0
+        self.accumulator = 0
+        self.pause_rect = None
+
+    def enter(self, level):
+        """
+        Build the maze for a level with a fresh spike seed, and start recording
+        it if GS_RECORD is set.
+        """
+        self.level = level
+        self.pace_clock.resume()
+        self.idle = False
+        self.wall_time = self.game_clock.now = self.pace_clock()
+        self.accumulator = 0
+        self.pause_rect = None
+        self.inputs.clear()
+        self.held = []
+        seed = self.seed = random.randrange(2 ** 32)
+        # The maze resets the timer to the level's time limit
+        self.maze = Maze(level, self.timer, clock=self.game_clock, rng=random.Random(seed), screen=self.manager.screen)
+        self.recorder = recorder_from_environment(self.maze, seed)
+        if self.stats:
+            self.stats.record(level, "start", self.timer.time_left, 0, self.maze.player_position, seed)
+
+    def handle_event(self, event):
+        """
+        Queue arrow key presses, track held keys and toggle the profiler.
+        """
+        if event.type == pygame.KEYUP:
+            direction = MOVE_KEYS.get(event.key)
+            if direction in self.held:
+                self.held.remove(direction)
+            return
+        if event.type != pygame.KEYDOWN:
+            return
+        if event.key == TOGGLE_KEY:
+            profiler = self.manager.profiler
+            if profiler.overlay_rect:
+                self.maze.restore(profiler.overlay_rect)
+                self.manager.present([profiler.overlay_rect])
+                profiler.overlay_rect = None
+            profiler.toggle()
+            return
+        if event.key == PAUSE_KEY:
+            self.toggle_pause()
+            return
+        direction = MOVE_KEYS.get(event.key)
+        if direction and not self.pace_clock.paused:
+            self.inputs.append(direction)
+            if direction in self.held:
+                self.held.remove(direction)
+            self.held.append(direction)
+            self.next_repeat = self.game_clock.now + self.repeat_delay
+
+    def toggle_pause(self):
+        """
+        Stop or restart game time. Keys pressed before the pause are forgotten,
+        and the scene sleeps like a menu until it is resumed.
+        """
+        if self.pace_clock.paused:
+            self.pace_clock.resume()
+            self.idle = False
+            if self.pause_rect:
+                self.maze.restore(self.pause_rect)
+                self.manager.present([self.pause_rect])
+                self.pause_rect = None
+        else:
+            self.pace_clock.pause()
+            self.idle = True
+            self.inputs.clear()
+            self.held = []
+
+    def step(self):
+        """
+        Run the rules for one fixed step: at most one queued move, then the timer
+        and the spikes.
+        """
+        profiler = self.manager.profiler
+        maze = self.maze
+        recorder = self.recorder
+        maze.previous_position = maze.player_position
+        now = self.game_clock.now + SIM_STEP_MS
+
+        # The most recently pressed key that is still down repeats
+        if self.held and self.repeat_delay and not self.inputs and now >= self.next_repeat:
+            self.inputs.append(self.held[-1])
+            self.next_repeat = now + self.repeat_interval
+        if self.inputs:
+            direction = self.inputs.popleft()
+            maze.move_player(direction)
+            if recorder:
+                recorder.move(direction)
+
+        self.game_clock.now = now
+        self.timer.update()
+        profiler.mark("timer")
+        if maze.outcome is None:
+            maze.update(self.timer)
+        profiler.mark("update")
+
+        if recorder and not recorder.finished:
+            recorder.tick(now)
+            if recorder.finished:
+                save_from_environment(recorder)
+
+    def update(self):
+        """
+        Run as many fixed steps as the time since the last frame covers, and end
+        the level once it is decided.
+        """
+        wall_time = self.pace_clock()
+        self.accumulator += wall_time - self.wall_time
+        self.wall_time = wall_time
+
+        maze = self.maze
+        steps = 0
+        # A faster pace clock is allowed proportionally more steps per frame
+        max_steps = MAX_STEPS_PER_FRAME * max(1, int(self.pace_clock.scale))
+        while self.accumulator >= SIM_STEP_MS:
+            self.accumulator -= SIM_STEP_MS
+            self.step()
+            steps += 1
+            if maze.outcome is not None:
+                break
+            if steps == max_steps:
+                # Too far behind to catch up; let game time slow down instead
+                self.accumulator = 0
+                break
+
+        if maze.outcome is not None and self.stats:
+            self.stats.record_finish(maze, self.seed)
+        if maze.outcome == "win":
+            audio.play("win")
+            self.manager.switch("win", level=self.level)
+        elif maze.outcome is not None:
+            audio.play("lose")
+            self.manager.switch("lose", level=self.level)
+
+    def draw(self, screen):
+        """
+        Refresh only the parts of the display that changed.
+        """
+        profiler = self.manager.profiler
+        if profiler.enabled and profiler.overlay_rect:
+            self.maze.restore(profiler.overlay_rect)
+        # Draw the player part of the way through the step in progress
+        dirty_rects = self.maze.render(self.timer, self.accumulator / SIM_STEP_MS)
+        if self.pace_clock.paused:
+            paused_text = text.render(TITLE_FONT, 72, "Paused", WHITE)
+            self.pause_rect = paused_text.get_rect(center=screen.get_rect().center)
+            screen.blit(paused_text, self.pause_rect)
+            dirty_rects.append(self.pause_rect)
+        if profiler.enabled:
+            dirty_rects.append(profiler.draw_overlay(screen))
+        return dirty_rects
+
+    def exit(self):
+        """
+        Forget the overlay position, since the next scene draws over it, and
+        release the maze.
+        """
+        self.manager.profiler.overlay_rect = None
+        self.maze.close()
+
+
+class EndScene(Scene):
+    """
+    Class representing the message shown when a level is won or lost.
+    """
+    def __init__(self, manager, background, headline, subtitle):
+        """
+        Initialize the EndScene object. subtitle may contain {level}.
+        """
+        super().__init__(manager)
+        self.background = background
+        self.headline = headline
+        self.subtitle = subtitle
+        self.level = None
+
+        screen_width, screen_height = background.get_size()
+        self.center = (screen_width // 2, screen_height // 2)
+        self.button_text = text.render(TITLE_FONT, 50, "Back to Main Menu", WHITE)
+        self.button_rect = self.button_text.get_rect(center=(self.center[0], self.center[1] + 125))
+
+    def enter(self, level):
+        """
+        Remember which level the message is about.
+        """
+        self.level = level
+
+    def handle_event(self, event):
+        """
+        Go back to the menu when the button is clicked.
+        """
+        if event.type == pygame.MOUSEBUTTONDOWN and self.button_rect.collidepoint(event.pos):
+            self.manager.switch("menu")
+
+    def draw(self, screen):
+        """
+        Draw the message and the "Back to Main Menu" button.
+        """
+        center_x, center_y = self.center
+        screen.blit(self.background, (0, 0))
+        headline = text.render(TITLE_FONT, 100, self.headline, WHITE)
+        subtitle = text.render(TITLE_FONT, 100, self.subtitle.format(level=self.level), WHITE)
+        screen.blit(subtitle, subtitle.get_rect(center=(center_x, center_y + 25)))
+        screen.blit(headline, headline.get_rect(center=(center_x, center_y - 75)))
+        pygame.draw.rect(screen, WHITE, self.button_rect, 3)
+        screen.blit(self.button_text, self.button_rect)
+        return None
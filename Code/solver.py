@@ -0,0 +1,463 @@
+"""
+Author: Agilan Hariharan
+Description: Incremental exit distance field and solvability checks for Graveyard Shift
+Creation Date: October 18, 2026
+Last Modified: October 18, 2026
+
+DistanceField keeps the BFS distance from every tile to the nearest exit.
+Queries are a list lookup. Changed tiles are queued, and the next query
+repairs only the distances that depended on them: a new spike raises the
+tiles whose shortest path went through it, an expired one lowers the tiles
+it gives a shorter way out. Spawning spikes never pays for the repair.
+Spike placement does not need the distances at all: it checks new spikes
+against a Route, one open path from the player to the exit.
+
+Usage:
+    python Code/solver.py Levels/level1.lvb
+"""
+# Import and Initialize
+import argparse
+import heapq
+from collections import deque
+from levels import WALL, EXIT, PLAYER, SPIKE
+
+UNREACHABLE = -1
+# Tiles a search for a way around a new spike may reach before the spike is refused
+DETOUR_LIMIT = 256
+# Changed tiles repaired one by one; more than this are recomputed in one search
+REPAIR_LIMIT = 64
+
+# 1 for the tile codes a path may go through, indexed by tile code
+OPEN_TILES = bytes(0 if block in (WALL, SPIKE) else 1 for block in range(256))
+
+# Grid offsets for each movement direction, matching core.DIRECTIONS
+STEPS = (("left", -1, 0), ("right", 1, 0), ("up", 0, -1), ("down", 0, 1))
+
+
+class DistanceField:
+    """
+    Class representing the distance from every tile of a grid to the exit.
+
+    Tiles are stored in flat arrays with a one-tile border of blocked cells,
+    so the four neighbours of index i are always i - 1, i + 1, i - stride and
+    i + stride without any bounds checks.
+    """
+    def __init__(self, grid):
+        """
+        Initialize the DistanceField object and run the first full search.
+        """
+        self.grid = grid
+        self.width = len(grid[0])
+        self.height = len(grid)
+        self.stride = self.width + 2
+        self.open = bytearray()
+        self.exits = bytearray()
+        self.distance = []
+        # Tiles changed since the distances were last brought up to date,
+        # with their (open, exit) flags from before the first change
+        self.pending = {}
+        # Set when the grid changed in bulk and only a full search will do
+        self.stale = False
+        self.rebuild()
+
+    def index(self, x, y):
+        """
+        Return the flat index of the tile at (x, y).
+        """
+        return (y + 1) * self.stride + x + 1
+
+    def passable(self, x, y):
+        """
+        Check if a path may go through the tile at (x, y).
+        """
+        block = self.grid[y][x]
+        return block != WALL and block != SPIKE
+
+    def read_tiles(self):
+        """
+        Re-read the open and exit flags of every tile from the grid.
+        """
+        stride = self.stride
+        size = stride * (self.height + 2)
+        passable = self.open = bytearray(size)
+        exits = self.exits = bytearray(size)
+        # Whole rows are classified at once by translating their tile codes
+        for y, row in enumerate(self.grid):
+            base = (y + 1) * stride + 1
+            tiles = bytes(row)
+            passable[base:base + self.width] = tiles.translate(OPEN_TILES)
+            x = tiles.find(EXIT)
+            while x != -1:
+                exits[base + x] = 1
+                x = tiles.find(EXIT, x + 1)
+
+    def rebuild(self):
+        """
+        Recompute every distance with a breadth-first search from the exits.
+        """
+        self.read_tiles()
+        stride = self.stride
+        passable = self.open
+        exits = self.exits
+        distance = [UNREACHABLE] * len(passable)
+        queue = deque()
+        index = exits.find(1)
+        while index != -1:
+            distance[index] = 0
+            queue.append(index)
+            index = exits.find(1, index + 1)
+
+        while queue:
+            index = queue.popleft()
+            next_distance = distance[index] + 1
+            for n in (index - 1, index + 1, index - stride, index + stride):
+                if passable[n] and distance[n] == UNREACHABLE:
+                    distance[n] = next_distance
+                    queue.append(n)
+        self.distance = distance
+        self.pending = {}
+        self.stale = False
+
+    def invalidate(self):
+        """
+        Re-read the grid after a change to many tiles at once. The distances are
+        recomputed by the next query that needs them.
+        """
+        self.read_tiles()
+        self.stale = True
+
+    def copy(self, grid):
+        """
+        Return an up-to-date field for grid, which must hold the same tiles as
+        this field's grid, without searching it again.
+        """
+        self.refresh()
+        field = DistanceField.__new__(DistanceField)
+        field.grid = grid
+        field.width = self.width
+        field.height = self.height
+        field.stride = self.stride
+        field.open = bytearray(self.open)
+        field.exits = bytearray(self.exits)
+        field.distance = list(self.distance)
+        field.pending = {}
+        field.stale = False
+        return field
+
+    def cell_changed(self, x, y):
+        """
+        Record that the tile at (x, y) was changed in the grid. The distances
+        are repaired by the next query that needs them.
+        """
+        index = self.index(x, y)
+        if index not in self.pending:
+            self.pending[index] = (self.open[index], self.exits[index])
+        self.open[index] = 1 if self.passable(x, y) else 0
+        self.exits[index] = 1 if self.grid[y][x] == EXIT else 0
+
+    def refresh(self):
+        """
+        Bring the distances up to date with the tiles changed since the last query.
+
+        Each changed tile is repaired on its own, so only the tiles whose
+        distance depended on it are searched again. A batch of more than
+        REPAIR_LIMIT changes, or a changed exit, is cheaper to recompute in one
+        full search.
+        """
+        if self.stale:
+            self.rebuild()
+            return
+        pending = self.pending
+        if not pending:
+            return
+        passable = self.open
+        exits = self.exits
+        if len(pending) > REPAIR_LIMIT or any(exits[index] != was_exit for index, (_, was_exit) in pending.items()):
+            self.rebuild()
+            return
+        # Roll the open flags back, then replay the changes one at a time so
+        # every repair starts from an exact field
+        changes = [(index, passable[index]) for index in pending]
+        for index, (was_open, _) in pending.items():
+            passable[index] = was_open
+        self.pending = {}
+        for index, now_open in changes:
+            if now_open == passable[index]:
+                continue
+            passable[index] = now_open
+            if now_open:
+                self.cell_opened(index, exits[index])
+            else:
+                self.cell_blocked(index)
+
+    def cell_opened(self, index, is_exit=False):
+        """
+        Lower distances outward from a tile that became passable.
+        """
+        distance = self.distance
+        stride = self.stride
+        if is_exit:
+            distance[index] = 0
+        else:
+            known = [distance[n] for n in (index - 1, index + 1, index - stride, index + stride) if distance[n] != UNREACHABLE]
+            if not known:
+                return
+            best = min(known) + 1
+            if distance[index] != UNREACHABLE and distance[index] <= best:
+                return
+            distance[index] = best
+
+        passable = self.open
+        queue = deque([index])
+        while queue:
+            current = queue.popleft()
+            next_distance = distance[current] + 1
+            for n in (current - 1, current + 1, current - stride, current + stride):
+                if passable[n] and (distance[n] == UNREACHABLE or distance[n] > next_distance):
+                    distance[n] = next_distance
+                    queue.append(n)
+
+    def cell_blocked(self, index):
+        """
+        Recompute the distances that depended on a tile that became impassable.
+        """
+        distance = self.distance
+        stride = self.stride
+        old = distance[index]
+        if old == UNREACHABLE:
+            return
+        distance[index] = UNREACHABLE
+
+        # Walk outward level by level and drop every tile that has no remaining
+        # neighbour one step closer to the exit
+        affected = []
+        queue = deque(n for n in (index - 1, index + 1, index - stride, index + stride) if distance[n] == old + 1)
+        seen = set(queue)
+        while queue:
+            current = queue.popleft()
+            level = distance[current]
+            if (distance[current - 1] == level - 1 or distance[current + 1] == level - 1
+                    or distance[current - stride] == level - 1 or distance[current + stride] == level - 1):
+                continue
+            distance[current] = UNREACHABLE
+            affected.append(current)
+            for n in (current - 1, current + 1, current - stride, current + stride):
+                if distance[n] == level + 1 and n not in seen:
+                    seen.add(n)
+                    queue.append(n)
+
+        # Re-seed the dropped tiles from their surviving neighbours, closest first
+        heap = []
+        for current in affected:
+            known = [distance[n] for n in (current - 1, current + 1, current - stride, current + stride) if distance[n] != UNREACHABLE]
+            if known:
+                heapq.heappush(heap, (min(known) + 1, current))
+        passable = self.open
+        while heap:
+            new_distance, current = heapq.heappop(heap)
+            if distance[current] != UNREACHABLE and distance[current] <= new_distance:
+                continue
+            distance[current] = new_distance
+            for n in (current - 1, current + 1, current - stride, current + stride):
+                if passable[n] and distance[n] == UNREACHABLE:
+                    heapq.heappush(heap, (new_distance + 1, n))
+
+    def route(self, x, y):
+        """
+        Return a Route from (x, y) to the exit over the tiles open right now, or None.
+
+        The stored distances may be stale. Walking down them usually still gets
+        to the exit; if a spike is in the way, a search that tries the tiles with
+        the lowest stored distance first finds another path.
+        """
+        start = self.index(x, y)
+        passable = self.open
+        distance = self.distance
+        exits = self.exits
+        stride = self.stride
+        tiles = [start]
+        current = start
+        level = distance[start]
+        while level > 0:
+            for n in (current - 1, current + 1, current - stride, current + stride):
+                if distance[n] == level - 1 and passable[n]:
+                    break
+            else:
+                break
+            tiles.append(n)
+            current = n
+            level -= 1
+        if level == 0 and exits[current]:
+            return Route(self, tiles)
+
+        unknown = len(distance)
+        came_from = {start: None}
+        heap = [(0, start)]
+        while heap:
+            current = heapq.heappop(heap)[1]
+            if exits[current]:
+                return Route(self, trace_back(came_from, current))
+            for n in (current - 1, current + 1, current - stride, current + stride):
+                if passable[n] and n not in came_from:
+                    came_from[n] = current
+                    guess = distance[n]
+                    heapq.heappush(heap, (unknown if guess == UNREACHABLE else guess, n))
+        return None
+
+    def distance_to_exit(self, x, y):
+        """
+        Return the number of moves from (x, y) to the exit, or None if unreachable.
+        """
+        self.refresh()
+        value = self.distance[self.index(x, y)]
+        return None if value == UNREACHABLE else value
+
+    def reachable(self, x, y):
+        """
+        Check if the exit can be reached from (x, y).
+        """
+        self.refresh()
+        return self.distance[self.index(x, y)] != UNREACHABLE
+
+    def next_step(self, x, y):
+        """
+        Return the direction of the next move on a shortest path to the exit, or None.
+        """
+        self.refresh()
+        index = self.index(x, y)
+        value = self.distance[index]
+        if value <= 0:
+            return None
+        for direction, dx, dy in STEPS:
+            if self.distance[index + dx + dy * self.stride] == value - 1:
+                return direction
+        return None
+
+
+class Route:
+    """
+    Class representing one open path from a tile to the exit, as flat indices.
+
+    A spike off the route cannot cut its start off from the exit, so only a
+    spike on it needs a search, and that search only has to find a way around
+    the one blocked tile back onto the rest of the route.
+    """
+    def __init__(self, field, tiles):
+        """
+        Initialize the Route object with tiles running from the start to the
+        exit. The tiles must not repeat; set_tiles cuts loops out of a walk.
+        """
+        self.field = field
+        self.tiles = tiles
+        self.position = dict(zip(tiles, range(len(tiles))))
+
+    def set_tiles(self, tiles):
+        """
+        Keep the given walk as the route, cutting out any loops in it.
+        """
+        kept = []
+        position = {}
+        for tile in tiles:
+            seen = position.get(tile)
+            if seen is None:
+                position[tile] = len(kept)
+                kept.append(tile)
+            else:
+                for dropped in kept[seen + 1:]:
+                    del position[dropped]
+                del kept[seen + 1:]
+        self.tiles = kept
+        self.position = position
+
+    def avoid(self, x, y):
+        """
+        Check that the exit can still be reached after the tile at (x, y) was
+        blocked, moving the route around it if needed. The way around is given
+        up on after DETOUR_LIMIT tiles, so this can refuse a tile that a full
+        search would have allowed, but never the other way round.
+        """
+        field = self.field
+        blocked = self.position.get(field.index(x, y))
+        if blocked is None:
+            return True
+        if blocked == 0:
+            return False
+
+        tiles = self.tiles
+        position = self.position
+        passable = field.open
+        stride = field.stride
+        # Search outward from the tile before the blocked one until the search
+        # gets back onto the route past it
+        start = tiles[blocked - 1]
+        came_from = {start: None}
+        queue = deque([start])
+        while queue and len(came_from) < DETOUR_LIMIT:
+            current = queue.popleft()
+            for n in (current - 1, current + 1, current - stride, current + stride):
+                if passable[n] and n not in came_from:
+                    came_from[n] = current
+                    rejoin = position.get(n, -1)
+                    if rejoin > blocked:
+                        self.set_tiles(tiles[:blocked - 1] + trace_back(came_from, n) + tiles[rejoin + 1:])
+                        return True
+                    queue.append(n)
+        return False
+
+
+def trace_back(came_from, tile):
+    """
+    Return the tiles a search went through from its start to tile, in order.
+    """
+    tiles = []
+    while tile is not None:
+        tiles.append(tile)
+        tile = came_from[tile]
+    tiles.reverse()
+    return tiles
+
+
+def shortest_path(field, x, y):
+    """
+    Return the list of directions from (x, y) to the exit, or None if unreachable.
+    """
+    if not field.reachable(x, y):
+        return None
+    path = []
+    offsets = {direction: (dx, dy) for direction, dx, dy in STEPS}
+    direction = field.next_step(x, y)
+    while direction is not None:
+        path.append(direction)
+        dx, dy = offsets[direction]
+        x, y = x + dx, y + dy
+        direction = field.next_step(x, y)
+    return path
+
+
+def main(argv=None):
+    """
+    Report whether each level file given on the command line is solvable.
+    """
+    # Imported here so the solver itself does not depend on the file format
+    from levelfile import read_level
+
+    parser = argparse.ArgumentParser(description="Check that Graveyard Shift levels can be solved.")
+    parser.add_argument("levels", nargs="+", help="level files (.lvl or .lvb)")
+    args = parser.parse_args(argv)
+
+    unsolvable = 0
+    for path in args.levels:
+        level_data = read_level(path)
+        field = DistanceField(level_data.grid())
+        start = level_data.position_of(PLAYER)
+        length = field.distance_to_exit(*start) if start else None
+        if length is None:
+            unsolvable += 1
+            print(f"{path}: UNSOLVABLE")
+        else:
+            print(f"{path}: shortest path {length} moves")
+    raise SystemExit(1 if unsolvable else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,49 +2,103 @@
 Author: Agilan Hariharan
 Description: An Original Maze Game: Graveyard Shift
 Creation Date: January 08, 2024
-Last Modified: January 19, 2024
+Last Modified: October 18, 2026
 """
 # Import and Initialize
 import pygame
-import random
+from assets import assets, text
+from audio import audio
+from collision import CollisionGrid
+from core import DIRECTIONS, Countdown, GameClock, GameCore
+from levels import WALL, EXIT
+from viewport import CHUNK_TILES, ChunkCache, Viewport
 
 # Global Constants for colors
 WHITE = (255, 255, 255)
 GREEN = (0, 255, 0)
 BLUE = (0, 0, 255)
 
+TITLE_FONT = "Fonts/youmurdererbb_reg.ttf"
+
 # Entities
 screen_width = 640
 screen_height = 480
-screen = pygame.display.set_mode((screen_width, screen_height))
-
-background_image = pygame.image.load("Images/background_image.png").convert()
-background_image = pygame.transform.scale(background_image, (screen_width, screen_height))
-
-pygame.mixer.init()
-move_sound = pygame.mixer.Sound("Sounds/move_sound.mp3")
-spike_sound = pygame.mixer.Sound("Sounds/spike_spawn.mp3")
-lose_sound = pygame.mixer.Sound("Sounds/lose_sound.mp3")
+screen_size = (screen_width, screen_height)
+# Side of one maze tile in pixels of the internal framebuffer
+BRICK_SIZE = 20
+# The captions sit above the maze, which scrolls in the rest of the screen
+HUD_HEIGHT = 40
+WALL_COLOR = (153, 27, 27)
+# Fills the empty parts of maze chunks so the background shows through
+CHUNK_COLORKEY = (255, 0, 255)
+
+# Nothing is opened or decoded at import time; every asset comes from the
+# shared cache the first time it is drawn or played
+BACKGROUND_IMAGE = "Images/background_image.png"
+MOVE_SOUND = "Sounds/move_sound.mp3"
+SPIKE_SOUND = "Sounds/spike_spawn.mp3"
+LOSE_SOUND = "Sounds/lose_sound.mp3"
+WIN_SOUND = "Sounds/win_sound.mp3"
+
+# Files only needed once a level starts, for the preloader to decode early,
+# with the sizes they are drawn at so the scaled variants are ready too
+LEVEL_IMAGES = {
+    "Images/character.png": [(BRICK_SIZE, BRICK_SIZE)],
+    "Images/spike.png": [(BRICK_SIZE, BRICK_SIZE)],
+    "Images/end_block.jpg": [(BRICK_SIZE, BRICK_SIZE)],
+}
+LEVEL_SOUNDS = [MOVE_SOUND, SPIKE_SOUND, LOSE_SOUND, WIN_SOUND]
+
+# Footsteps cut each other off instead of stacking, and nothing steals the
+# channel of the end-of-level stingers
+audio.register("move", MOVE_SOUND, max_voices=1, priority=0)
+audio.register("spike", SPIKE_SOUND, max_voices=2, priority=1)
+audio.register("lose", LOSE_SOUND, max_voices=1, priority=2)
+audio.register("win", WIN_SOUND, max_voices=1, priority=2)
+
+
+def draw_maze_chunk(grid, column, row, brick_size, surface_format, end_block_image):
+    """
+    Return a surface with the walls and exit blocks of one chunk of a grid,
+    transparent everywhere else. Runs on the chunk cache's worker thread, so
+    every image it needs is passed in rather than loaded here.
+    """
+    chunk_size = CHUNK_TILES * brick_size
+    chunk = pygame.Surface((chunk_size, chunk_size), 0, surface_format)
+    chunk.fill(CHUNK_COLORKEY)
+    left = column * CHUNK_TILES
+    top = row * CHUNK_TILES
+    for y, tiles in enumerate(grid[top:top + CHUNK_TILES]):
+        for x, block in enumerate(tiles[left:left + CHUNK_TILES]):
+            cell = pygame.Rect(x * brick_size, y * brick_size, brick_size, brick_size)
+            if block == WALL:
+                chunk.fill(WALL_COLOR, cell)
+            elif block == EXIT:
+                chunk.blit(end_block_image, cell)
+    chunk.set_colorkey(CHUNK_COLORKEY, pygame.RLEACCEL)
+    return chunk
 
 
 class Character(pygame.sprite.Sprite):
     """
-    Class representing the player character in the game.
+    Class representing a player character that moves smoothly in maze pixels.
     """
-    def __init__(self, screen_width, screen_height):
+    def __init__(self, screen_width, screen_height, size=40, speed=1):
         """
-        Initialize the Character object.
+        Initialize the Character object. speed is in pixels per update.
         """
         super().__init__()
         # Use the properly scaled background image as the surface
-        self.image = pygame.image.load("Images/character.png").convert()
-        self.image = pygame.transform.scale(self.image, (40, 40))
+        self.image = assets.image("Images/character.png", (size, size))
         self.rect = self.image.get_rect()
         self.rect.topleft = (20, 20)
+        self.speed = speed
+        self.spiked = False
 
     def update(self, maze):
         """
-        Update the position of the character based on user input.
+        Update the position of the character based on user input, sliding
+        along walls instead of passing through them.
         """
         keys = pygame.key.get_pressed()
         dx = 0
@@ -59,12 +113,10 @@ class Character(pygame.sprite.Sprite):
         elif keys[pygame.K_DOWN]:
             dy = 1
 
-        self.rect.x += dx
-        self.rect.y += dy
-
-        # Check for collisions with walls and reset position if collided
-        if pygame.sprite.spritecollide(self, maze.walls, False):
-            self.rect.topleft = (20, 20)
+        # The maze grid answers collisions directly, so no wall sprites are scanned
+        collision = maze.collision
+        self.rect.x, self.rect.y, _, _ = collision.sweep(self.rect, dx * self.speed, dy * self.speed)
+        self.spiked = bool(collision.rect_hazards(self.rect))
 
     def draw(self, screen):
         """
@@ -73,43 +125,24 @@ class Character(pygame.sprite.Sprite):
         screen.blit(self.image, self.rect)
 
 
-class ScoreKeeper(pygame.sprite.Sprite):
+class ScoreKeeper(Countdown, pygame.sprite.Sprite):
     """
     Class representing the score keeper and timer in the game.
     """
-    def __init__(self):
-        """
-        Initialize the ScoreKeeper object.
-        """
-        super().__init__()
-        self.font = pygame.font.Font(None, 36)
-        self.time_left = 45
-        self.last_time_update = pygame.time.get_ticks()
-
-    def update(self):
+    def __init__(self, clock=None):
         """
-        Update the timer and decrement time left.
+        Initialize the ScoreKeeper object. The clock defaults to a real-time GameClock.
         """
-        current_time = pygame.time.get_ticks()
-        if current_time - self.last_time_update >= 1000:
-            self.time_left -= 1
-            self.last_time_update = current_time
+        pygame.sprite.Sprite.__init__(self)
+        Countdown.__init__(self, clock or GameClock())
+        text.prebuild_digits(None, 36, WHITE)
 
     def draw(self, screen):
         """
         Draw the time left on the screen.
         """
-        text = self.font.render(f"Time Left: {max(0, self.time_left)}", True, WHITE)
-        screen.blit(text, (10, 10))
+        screen.blit(text.number(None, 36, "Time Left: ", max(0, self.time_left), WHITE), (10, 10))
 
-    def time_up(self):
-        """
-        Check if the time has run out.
-        """
-        return self.time_left <= 0
-    def reset(self, initial_time = 45):
-        self.time_left = initial_time
-        self.last_time_update = pygame.time.get_ticks()
 class HowToPlayScreen(pygame.sprite.Sprite):
     """
     Class representing the How to Play screen.
@@ -118,24 +151,23 @@ class HowToPlayScreen(pygame.sprite.Sprite):
         """
         Initialize the HowToPlayScreen object.
         """
-        self.image = pygame.image.load("Images/background_image.png").convert()
-        self.image = pygame.transform.scale(self.image, (background_image.get_width(), background_image.get_height()))
+        self.image = assets.image(BACKGROUND_IMAGE, screen_size)
         self.rect = self.image.get_rect()
 
-        self.title_font = pygame.font.Font("Fonts/youmurdererbb_reg.ttf", 100)
+        self.title_font = assets.font("Fonts/youmurdererbb_reg.ttf", 100)
         self.title = self.title_font.render("How to Play", True, WHITE)
         self.title_rect = self.title.get_rect(center=(screen_width // 2, 50))
         self.instructions = [
             "Welcome to Graveyard Shift!",
             "Navigate through the maze to reach the end.",
-            "Use the arrow keys to move the character.",
+            "Use the arrow keys to move, and P to pause.",
             "Avoid zombies and reach the exit by the time limit.",
-            "Zombies stay where they are, even if they disappear,",
-            "meaning you can run into empty space and die",
+            "Zombies rise at random every few seconds,",
+            "then sink back into the ground and clear the way",
             "Click on Level 1, Level 2, or Level 3 to start",
             "Good luck!",
         ]
-        self.button_font = pygame.font.Font("Fonts/mrsmonstercondital.ttf", 35)
+        self.button_font = assets.font("Fonts/mrsmonstercondital.ttf", 35)
         self.instruction_texts = [self.button_font.render(text, True, WHITE) for text in self.instructions]
         self.instruction_rects = [text.get_rect(center=(screen_width // 2, 150 + i * 30)) for i, text in enumerate(self.instruction_texts)]
         self.back_button = self.button_font.render("Back to Menu", True, WHITE)
@@ -162,15 +194,14 @@ class HomeScreen(pygame.sprite.Sprite):
         """
         super().__init__()
         # Use background image as the surface
-        self.image = pygame.image.load("Images/background_image.png").convert()
-        self.image = pygame.transform.scale(self.image, (background_image.get_width(), background_image.get_height()))
+        self.image = assets.image(BACKGROUND_IMAGE, screen_size)
         self.rect = self.image.get_rect()
 
-        self.title_font = pygame.font.Font("Fonts/youmurdererbb_reg.ttf", 100)
+        self.title_font = assets.font("Fonts/youmurdererbb_reg.ttf", 100)
         self.title = self.title_font.render("Graveyard Shift", True, WHITE)
         self.title_rect = self.title.get_rect(center=(screen_width // 2, 50))
 
-        self.button_font = pygame.font.Font("Fonts/mrsmonstercondital.ttf", 60)
+        self.button_font = assets.font("Fonts/mrsmonstercondital.ttf", 60)
 
         self.level1_button = self.button_font.render("Level 1", True, WHITE)
         self.level1_rect = self.level1_button.get_rect(center=(screen_width//4, 225))
@@ -203,16 +234,14 @@ class Spikes(pygame.sprite.Sprite):
     """
     Class representing spikes in the game.
     """
-    def __init__(self, x, y, size):
+    def __init__(self, x, y, size, spawn_time):
         """
-        Initialize a spike/zombie sprite.
+        Initialize a spike/zombie sprite. spawn_time is the game clock time it rose at.
         """
         super().__init__()
-        self.image = pygame.image.load("Images/spike.png").convert()
-        self.image = pygame.transform.scale(self.image, (size, size))
+        self.image = assets.image("Images/spike.png", (size, size))
         self.rect = self.image.get_rect(topleft=(x, y))
-        self.spawn_time = pygame.time.get_ticks()
-        self.sound = pygame.mixer.Sound("Sounds/spike_spawn.mp3")
+        self.spawn_time = spawn_time
 
     def draw(self, screen):
         """
@@ -220,269 +249,231 @@ class Spikes(pygame.sprite.Sprite):
         """
         screen.blit(self.image, self.rect)
 
-class Maze(pygame.sprite.Sprite):
+class Maze(GameCore, pygame.sprite.Sprite):
     """
     Class representing the maze.
     """
-    def __init__(self, current_level):
+    def __init__(self, current_level, timer=None, clock=None, rng=None, screen=None):
         """
-        Initialize the maze.
+        Initialize the maze. The clock defaults to a real-time GameClock; the timer
+        and the spikes always read the same clock. screen is the surface the maze
+        is drawn on, by default the display.
         """
-        super().__init__()
-        self.image = pygame.image.load("Images/background_image.png").convert()
+        pygame.sprite.Sprite.__init__(self)
+        GameCore.__init__(self, current_level, clock or GameClock(), rng=rng, timer=timer)
+        self.image = assets.image(BACKGROUND_IMAGE, screen_size)
         self.rect = self.image.get_rect()
-
-        self.level = current_level
-        self.maze = self.generate_maze(current_level)
-        self.player_position = (1, 1)
-        self.dest_reached = False
-        self.dest_unreached = False
+        self.screen = screen if screen is not None else pygame.display.get_surface()
 
         self.spikes_group = pygame.sprite.Group()
-        self.spawn_spikes_timer = pygame.time.get_ticks()
-        self.spikes_spawn_interval = 5000  # 5 seconds in milliseconds
-        self.spikes_duration = 2000  # 2 seconds in milliseconds
+        self.spike_sprites = {}
+        # Where the player stood before the last simulation step, for interpolation
+        self.previous_position = self.player_position
+
+        # The camera follows the player over mazes larger than the screen
+        self.brick_size = BRICK_SIZE
+        world_size = (len(self.maze[0]) * self.brick_size, len(self.maze) * self.brick_size)
+        self.viewport = Viewport((0, HUD_HEIGHT, screen_width, screen_height - HUD_HEIGHT), world_size)
+        self.viewport.center_on(self.world_rect(*self.player_position))
+        self.collision = CollisionGrid(self.maze, self.brick_size)
+
+        # Walls and exit blocks are drawn into chunks once; only large mazes
+        # draw the chunks next to the view ahead of time on a worker thread
+        self.chunk_size = CHUNK_TILES * self.brick_size
+        self.chunk_format = self.screen
+        self.end_block_image = assets.image("Images/end_block.jpg", (self.brick_size, self.brick_size))
+        self.chunks = ChunkCache(self.draw_chunk, threaded=self.viewport.scrolls())
+
+        # The background, the visible chunks and the captions are baked into one
+        # surface that is only rebuilt when the grid changes or the camera moves
+        self.static_layer = None
+        self.static_dirty = True
+        self.drawn_rects = {}
+        text.prebuild_digits(TITLE_FONT, 24, WHITE)
 
     def generate_spikes(self):
         """
-        Generate spikes in empty positions of the maze based on the current level.
+        Play the spawn sound and generate a new wave of spikes.
         """
-        empty_positions = [(x, y) for y, row in enumerate(self.maze) for x, block in enumerate(row) if block == 0]
+        audio.play("spike")
+        super().generate_spikes()
 
-        # Adjust the number of spikes based on the current level
-        if self.level == 1:
-            num_spikes = 5
-        elif self.level == 2:
-            num_spikes = 10
-        elif self.level == 3:
-            num_spikes = 15
-        else:
-            num_spikes = 10
-
-        for _ in range(num_spikes):
-            x, y = random.choice(empty_positions)
-            empty_positions.remove((x, y))
-            spike = Spikes(x * 20, (y * 20) + 40, 20)
-            self.spikes_group.add(spike)
-            self.maze[y][x] = 4
+    def add_spike(self, x, y):
+        """
+        Record a spike and create the sprite that shows it.
+        """
+        super().add_spike(x, y)
+        rect = self.world_rect(x, y)
+        spike = Spikes(rect.x, rect.y, self.brick_size, self.spikes[(x, y)])
+        self.spikes_group.add(spike)
+        self.spike_sprites[(x, y)] = spike
 
+    def remove_spike(self, position):
+        """
+        Remove an expired spike and hide its sprite.
+        """
+        super().remove_spike(position)
+        self.spikes_group.remove(self.spike_sprites.pop(position))
 
-    def update(self, timer):
+    def update(self, timer=None):
         """
         Update the maze, including spawning and removing spikes.
         """
-        self.brick_size = 20
-        super().update()
-
-        current_time = pygame.time.get_ticks()
-
-        # Spawn spikes every 5 seconds
-        if current_time - self.spawn_spikes_timer >= self.spikes_spawn_interval:
-            spike_sound.play()
-            self.generate_spikes()
-            self.spawn_spikes_timer = current_time
-
-        # Remove spikes after 2 seconds
-        spikes_to_remove = [spike for spike in self.spikes_group if current_time - spike.spawn_time >= self.spikes_duration]
-        for spike in spikes_to_remove:
-            self.spikes_group.remove(spike)
-
-    def generate_maze(self, current_level):
-        """
-        Generate the maze layout based on the current level.
-        """
-        if current_level == 1:
-            maze = [
-                [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-                [1, 3, 1, 0, 1, 0, 0, 0, 0, 1, 0, 1, 0, 0, 1, 0, 1, 0, 1, 0, 0, 0, 1, 0, 0, 1, 0, 1, 1, 1, 0, 1],
-                [1, 0, 0, 0, 1, 0, 1, 1, 0, 1, 0, 1, 1, 1, 1, 0, 1, 0, 1, 0, 1, 0, 1, 1, 0, 0, 0, 1, 0, 0, 0, 1],
-                [1, 1, 0, 0, 0, 0, 1, 0, 0, 1, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 1],
-                [1, 1, 1, 0, 1, 1, 1, 0, 1, 1, 0, 1, 1, 1, 1, 0, 1, 1, 1, 0, 1, 1, 0, 0, 0, 0, 0, 1, 0, 0, 1, 1],
-                [1, 0, 1, 0, 0, 0, 1, 0, 1, 1, 0, 1, 0, 0, 0, 0, 1, 0, 1, 1, 0, 0, 1, 1, 0, 0, 0, 0, 0, 0, 1, 1],
-                [1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 1, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 1, 1, 1, 0, 1],
-                [1, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 1, 0, 0, 0, 0, 1, 0, 1, 0, 1, 1, 1, 1, 0, 0, 0, 0, 0, 1],
-                [1, 0, 0, 0, 1, 0, 1, 0, 0, 1, 0, 0, 0, 1, 0, 1, 1, 0, 1, 0, 1, 0, 1, 0, 0, 1, 0, 1, 1, 1, 1, 1],
-                [1, 1, 1, 0, 1, 0, 1, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 0, 1, 0, 1, 0, 1, 0, 1, 1, 1, 1, 0, 0, 0, 1],
-                [1, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 1, 0, 1, 0, 1, 0, 1, 0, 0, 0, 0, 0, 1, 1],
-                [1, 0, 1, 0, 1, 1, 1, 1, 1, 1, 0, 1, 1, 1, 0, 1, 0, 1, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-                [1, 0, 1, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1],
-                [1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 0, 1, 0, 1, 0, 1, 0, 1, 1, 0, 1, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1],
-                [1, 0, 1, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 1, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 1],
-                [1, 0, 1, 0, 1, 0, 1, 0, 0, 0, 1, 1, 1, 1, 0, 1, 0, 0, 1, 0, 1, 0, 1, 0, 1, 1, 1, 0, 1, 1, 0, 1],
-                [1, 0, 0, 0, 1, 1, 1, 0, 1, 0, 1, 0, 0, 1, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 0, 1, 0, 0, 1, 0, 1],
-                [1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 1, 1, 1, 1, 0, 1, 1, 0, 1, 0, 0, 0, 1, 1, 1, 1, 0, 1, 0, 1],
-                [1, 0, 1, 0, 0, 0, 1, 0, 1, 0, 0, 0, 1, 0, 0, 1, 0, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 0, 1, 0, 1],
-                [1, 0, 0, 0, 1, 0, 1, 0, 1, 1, 1, 0, 1, 0, 0, 1, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 1, 0, 1],
-                [1, 0, 1, 0, 1, 0, 1, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 1, 1, 0, 0, 0, 0, 0, 2, 1],
-                [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
-            ]
-        elif current_level == 2:
-            maze = [
-                [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-                [1, 3, 1, 0, 1, 0, 0, 0, 0, 1, 0, 1, 0, 0, 1, 0, 1, 0, 1, 0, 0, 0, 1, 0, 0, 1, 0, 1, 1, 1, 0, 1],
-                [1, 0, 0, 0, 1, 0, 1, 1, 0, 1, 0, 1, 1, 1, 1, 0, 1, 0, 1, 0, 1, 0, 1, 1, 0, 0, 0, 1, 0, 0, 0, 1],
-                [1, 1, 0, 0, 0, 0, 1, 0, 0, 1, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 1],
-                [1, 1, 1, 0, 1, 1, 1, 0, 1, 1, 0, 1, 1, 1, 1, 0, 1, 1, 1, 0, 1, 1, 0, 0, 0, 0, 0, 1, 0, 0, 1, 1],
-                [1, 0, 1, 0, 0, 0, 1, 0, 1, 1, 0, 1, 0, 0, 0, 0, 1, 0, 1, 1, 0, 0, 1, 1, 0, 0, 0, 0, 0, 0, 1, 1],
-                [1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 1, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 1, 1, 1, 0, 1],
-                [1, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 1, 0, 0, 0, 0, 1, 0, 1, 0, 1, 1, 1, 1, 0, 0, 0, 0, 0, 1],
-                [1, 0, 0, 0, 1, 0, 1, 0, 0, 1, 0, 0, 0, 1, 0, 1, 1, 0, 1, 0, 1, 0, 1, 0, 0, 1, 0, 1, 1, 1, 1, 1],
-                [1, 1, 1, 0, 1, 0, 1, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 0, 1, 0, 1, 0, 1, 0, 1, 1, 1, 1, 0, 0, 0, 1],
-                [1, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 1, 0, 1, 0, 1, 0, 1, 0, 0, 0, 0, 0, 1, 1],
-                [1, 0, 1, 0, 1, 1, 1, 1, 1, 1, 0, 1, 1, 1, 0, 1, 0, 1, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-                [1, 0, 1, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1],
-                [1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 0, 1, 0, 1, 0, 1, 0, 1, 1, 0, 1, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1],
-                [1, 0, 1, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 1, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 1],
-                [1, 0, 1, 0, 1, 0, 1, 0, 0, 0, 1, 1, 1, 1, 0, 1, 0, 0, 1, 0, 1, 0, 1, 0, 1, 1, 1, 0, 1, 1, 0, 1],
-                [1, 0, 0, 0, 1, 1, 1, 0, 1, 0, 1, 0, 0, 1, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 0, 1, 0, 0, 1, 0, 1],
-                [1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 1, 1, 1, 1, 0, 1, 1, 0, 1, 0, 0, 0, 1, 1, 1, 1, 0, 1, 0, 1],
-                [1, 0, 1, 0, 0, 0, 1, 0, 1, 0, 0, 0, 1, 0, 0, 1, 0, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 0, 1, 0, 1],
-                [1, 0, 0, 0, 1, 0, 1, 0, 1, 1, 1, 0, 1, 0, 0, 1, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 1, 0, 1],
-                [1, 0, 1, 0, 1, 0, 1, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 1, 1, 0, 0, 0, 0, 0, 2, 1],
-                [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
-            ]
-        elif current_level == 3:
-            maze = [
-                [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-                [1, 3, 1, 0, 1, 0, 0, 0, 0, 1, 0, 1, 0, 0, 1, 0, 1, 0, 1, 0, 0, 0, 1, 0, 0, 1, 0, 1, 1, 1, 0, 1],
-                [1, 0, 0, 0, 1, 0, 1, 1, 0, 1, 0, 1, 1, 1, 1, 0, 1, 0, 1, 0, 1, 0, 1, 1, 0, 0, 0, 1, 0, 0, 0, 1],
-                [1, 1, 0, 0, 0, 0, 1, 0, 0, 1, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 1],
-                [1, 1, 1, 0, 1, 1, 1, 0, 1, 1, 0, 1, 1, 1, 1, 0, 1, 1, 1, 0, 1, 1, 0, 0, 0, 0, 0, 1, 0, 0, 1, 1],
-                [1, 0, 1, 0, 0, 0, 1, 0, 1, 1, 0, 1, 0, 0, 0, 0, 1, 0, 1, 1, 0, 0, 1, 1, 0, 0, 0, 0, 0, 0, 1, 1],
-                [1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 1, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 1, 1, 1, 0, 1],
-                [1, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 1, 0, 0, 0, 0, 1, 0, 1, 0, 1, 1, 1, 1, 0, 0, 0, 0, 0, 1],
-                [1, 0, 0, 0, 1, 0, 1, 0, 0, 1, 0, 0, 0, 1, 0, 1, 1, 0, 1, 0, 1, 0, 1, 0, 0, 1, 0, 1, 1, 1, 1, 1],
-                [1, 1, 1, 0, 1, 0, 1, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 0, 1, 0, 1, 0, 1, 0, 1, 1, 1, 1, 0, 0, 0, 1],
-                [1, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 1, 0, 1, 0, 1, 0, 1, 0, 0, 0, 0, 0, 1, 1],
-                [1, 0, 1, 0, 1, 1, 1, 1, 1, 1, 0, 1, 1, 1, 0, 1, 0, 1, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-                [1, 0, 1, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1],
-                [1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 0, 1, 0, 1, 0, 1, 0, 1, 1, 0, 1, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1],
-                [1, 0, 1, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 1, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 1],
-                [1, 0, 1, 0, 1, 0, 1, 0, 0, 0, 1, 1, 1, 1, 0, 1, 0, 0, 1, 0, 1, 0, 1, 0, 1, 1, 1, 0, 1, 1, 0, 1],
-                [1, 0, 0, 0, 1, 1, 1, 0, 1, 0, 1, 0, 0, 1, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 0, 1, 0, 0, 1, 0, 1],
-                [1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1, 0, 1, 1, 1, 1, 0, 1, 1, 0, 1, 0, 0, 0, 1, 1, 1, 1, 0, 1, 0, 1],
-                [1, 0, 1, 0, 0, 0, 1, 0, 1, 0, 0, 0, 1, 0, 0, 1, 0, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 0, 1, 0, 1],
-                [1, 0, 0, 0, 1, 0, 1, 0, 1, 1, 1, 0, 1, 0, 0, 1, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 1, 0, 1],
-                [1, 0, 1, 0, 1, 0, 1, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 1, 1, 0, 0, 0, 0, 0, 2, 1],
-                [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
-            ]
-        return maze
-    def render(self, timer):
+        GameCore.update(self)
+
+    def world_rect(self, x, y):
         """
-        Render the maze, spikes, and game information on the screen.
+        Return the rectangle covered by the grid cell (x, y) in maze pixels.
         """
-        self.spikes_group.draw(screen)
-        maze_height = 22
-
-        brick_size = min(20, 20)
-
-        # Calculate the vertical offset to align the bottom of the maze with the bottom of the screen
-        vertical_offset = screen_height - maze_height * brick_size
-        x, y = 0, vertical_offset
-        for row in self.maze:
-            for block in row:
-                if block == 1:
-                    pygame.draw.rect(screen, (153, 27, 27), (x, y, brick_size, brick_size))
-                elif block == 2:
-                    end_block_image = pygame.image.load("Images/end_block.jpg").convert()
-                    end_block_image = pygame.transform.scale(end_block_image, (brick_size, brick_size))
-                    screen.blit(end_block_image, (x, y))
-                elif block == 3:
-                    character_image = pygame.image.load("Images/character.png").convert()
-                    character_image = pygame.transform.scale(character_image, (brick_size, brick_size))
-                    screen.blit(character_image, (x, y))
-                x += brick_size
-            y += brick_size
-            x = 0 
-        # Display timer at the top right
-        timer_font = pygame.font.Font("Fonts/youmurdererbb_reg.ttf", 24)
-        timer_text = timer_font.render(f"Time Left: {max(0, timer.time_left)}", True, WHITE)
-        timer_rect = timer_text.get_rect(topright=(screen_width - 10, 20))
-        screen.blit(timer_text, timer_rect)
+        return pygame.Rect(x * self.brick_size, y * self.brick_size, self.brick_size, self.brick_size)
+
+    def cell_rect(self, x, y):
+        """
+        Return the screen rectangle covered by the grid cell (x, y) for the current camera.
+        """
+        return self.viewport.to_screen(self.world_rect(x, y))
+
+    def draw_chunk(self, column, row):
+        """
+        Draw the walls and exit blocks of one chunk of the maze. Called from the
+        chunk cache's worker thread too, so it only reads the grid and the
+        surfaces loaded in __init__.
+        """
+        return draw_maze_chunk(self.maze, column, row, self.brick_size, self.chunk_format, self.end_block_image)
+
+    def invalidate(self):
+        """
+        Force the next render to rebuild the static layer and redraw the whole screen.
+        """
+        self.static_dirty = True
+
+    def restore(self, rect):
+        """
+        Paint the static layer back over rect, for example after an overlay was
+        drawn there. Sprites under it are redrawn and reported on the next render.
+        """
+        if self.static_layer is None or self.static_dirty:
+            return
+        self.screen.blit(self.static_layer, rect, rect)
+        self.drawn_rects = {key: drawn for key, drawn in self.drawn_rects.items() if not drawn.colliderect(rect)}
+
+    def build_static_layer(self):
+        """
+        Bake the background, the visible part of the maze and the captions into one surface.
+        """
+        if self.static_layer is None:
+            self.static_layer = pygame.Surface((screen_width, screen_height)).convert()
+        layer = self.static_layer
+        layer.blit(assets.image(BACKGROUND_IMAGE, screen_size), (0, 0))
+
+        # Only the chunks under the view are drawn, so the cost follows the
+        # screen size rather than the maze size
+        viewport = self.viewport
+        chunk_size = self.chunk_size
+        layer.set_clip(viewport.view)
+        for column, row in viewport.visible_chunks(chunk_size):
+            chunk_rect = pygame.Rect(column * chunk_size, row * chunk_size, chunk_size, chunk_size)
+            layer.blit(self.chunks.get((column, row)), viewport.to_screen(chunk_rect))
+        layer.set_clip(None)
+        self.chunks.prefetch(viewport.visible_chunks(chunk_size, margin=1))
 
         # Display "Graveyard Shift" text at the top center
-        title_font = pygame.font.Font("Fonts/youmurdererbb_reg.ttf", 36)
-        title_text = title_font.render("Graveyard Shift", True, WHITE)
+        title_text = text.render(TITLE_FONT, 36, "Graveyard Shift", WHITE)
         title_rect = title_text.get_rect(center=(screen_width // 2, 20))
-        screen.blit(title_text, title_rect)
+        layer.blit(title_text, title_rect)
 
         # Display "escape the horror" text at the top left
-        subtitle_font = pygame.font.Font("Fonts/youmurdererbb_reg.ttf", 18)
-        subtitle_text = subtitle_font.render("escape the horror", True, WHITE)
+        subtitle_text = text.render(TITLE_FONT, 18, "escape the horror", WHITE)
         subtitle_rect = subtitle_text.get_rect(topleft=(10, 20))
-        screen.blit(subtitle_text, subtitle_rect)
+        layer.blit(subtitle_text, subtitle_rect)
+
+        self.static_dirty = False
+
+    def render(self, timer, alpha=1.0):
+        """
+        Render the maze, spikes, and game information on the screen.
+        alpha places the player between its previous and current cell.
+        Returns the list of screen rectangles that changed since the last call.
+        """
+        screen = self.screen
+        viewport = self.viewport
+        player_rect = self.world_rect(*self.player_position)
+        if alpha < 1 and self.previous_position != self.player_position:
+            previous_rect = self.world_rect(*self.previous_position)
+            player_rect.x = round(previous_rect.x + (player_rect.x - previous_rect.x) * alpha)
+            player_rect.y = round(previous_rect.y + (player_rect.y - previous_rect.y) * alpha)
+        if viewport.follow(player_rect):
+            self.static_dirty = True
+
+        full_redraw = self.static_layer is None or self.static_dirty
+        if full_redraw:
+            self.build_static_layer()
+            screen.blit(self.static_layer, (0, 0))
+            self.drawn_rects = {}
+
+        # Collect everything that moves and can be seen, keyed by what it shows and where
+        brick_size = self.brick_size
+        visible = viewport.world_rect()
+        sprites = {}
+        for spike in self.spikes_group:
+            if spike.rect.colliderect(visible):
+                sprites[("spike", spike.rect.topleft)] = (spike.image, viewport.to_screen(spike.rect))
+        character_image = assets.image("Images/character.png", (brick_size, brick_size))
+        player_rect = viewport.to_screen(player_rect)
+        sprites[("player", player_rect.topleft)] = (character_image, player_rect)
+
+        # Display timer at the top right, composed from cached digit glyphs
+        time_left = max(0, timer.time_left)
+        timer_text = text.number(TITLE_FONT, 24, "Time Left: ", time_left, WHITE)
+        timer_rect = timer_text.get_rect(topright=(screen_width - 10, 20))
+        sprites[("timer", time_left)] = (timer_text, timer_rect)
+
+        # Restore the static layer under anything that disappeared or changed
+        dirty_rects = []
+        for key, rect in self.drawn_rects.items():
+            if key not in sprites:
+                screen.blit(self.static_layer, rect, rect)
+                dirty_rects.append(rect)
+
+        # Sprites still on screen are only drawn again where something was
+        # restored over them; blitting anti-aliased text onto itself would
+        # darken its edges without the change being reported
+        restored = list(dirty_rects)
+        drawn_rects = {}
+        for key, (image, rect) in sprites.items():
+            if key in self.drawn_rects and rect.collidelist(restored) == -1:
+                drawn_rects[key] = rect
+                continue
+            dirty_rects.append(rect)
+            # Sprites at the edge of the view are cut off instead of covering the captions
+            screen.set_clip(None if key[0] == "timer" else viewport.view)
+            screen.blit(image, rect)
+            drawn_rects[key] = rect
+        screen.set_clip(None)
+        self.drawn_rects = drawn_rects
+
+        if full_redraw:
+            return [screen.get_rect()]
+        return dirty_rects
 
     def move_player(self, direction):
         """
         Move the player in the specified direction within the maze.
         """
-        if not self.dest_reached or self.dest_unreached:
-            x, y = self.player_position
-
-            if direction in ["left", "right", "up", "down"]:
-                move_sound.play()
-
-            if direction == "left" and x - 1 >= 0:
-                block = self.maze[y][x - 1]
-                if block == 0:
-                    self.maze[y][x - 1] = 3
-                    self.maze[y][x] = 0
-                    self.player_position = (x - 1, y)
-                elif block == 2:
-                    # Player reached block "2", remove all walls instantly
-                    self.remove_walls_instantly()
-                    self.dest_reached = True
-                elif block == 4:
-                    self.remove_walls_instantly()
-                    self.dest_unreached = True
-
-            elif direction == "right" and x + 1 < len(self.maze[0]):
-                block = self.maze[y][x + 1]
-                if block == 0:
-                    self.maze[y][x + 1] = 3
-                    self.maze[y][x] = 0
-                    self.player_position = (x + 1, y)
-                elif block == 2:
-                    # Player reached block "2", remove all walls instantly
-                    self.remove_walls_instantly()
-                    self.dest_reached = True
-                elif block == 4:
-                    self.remove_walls_instantly()                    
-                    self.dest_unreached = True      
-
-            elif direction == "up" and y - 1 >= 0:
-                block = self.maze[y - 1][x]
-                if block == 0:
-                    self.maze[y - 1][x] = 3
-                    self.maze[y][x] = 0
-                    self.player_position = (x, y - 1)
-                elif block == 2:
-                    # Player reached block "2", remove all walls instantly
-                    self.remove_walls_instantly()
-                    self.dest_reached = True
-                elif block == 4:
-                    self.remove_walls_instantly()
-                    self.dest_unreached = True      
-
-            elif direction == "down" and y + 1 < len(self.maze):
-                block = self.maze[y + 1][x]
-                if block == 0:
-                    self.maze[y + 1][x] = 3
-                    self.maze[y][x] = 0
-                    self.player_position = (x, y + 1)
-                elif block == 2:
-                    # Player reached block "2", remove all walls instantly
-                    self.remove_walls_instantly()
-                    self.dest_reached = True
-                elif block == 4:
-                    self.remove_walls_instantly()
-                    self.dest_unreached = True       
+        if direction in DIRECTIONS and (not self.dest_reached or self.dest_unreached):
+            audio.play("move")
+        super().move_player(direction)
 
     def remove_walls_instantly(self):
         """
         Remove all walls in the maze instantly.
         """
-        for i in range(len(self.maze)):
-            for j in range(len(self.maze[i])):
-                if self.maze[i][j] == 1:
-                    self.maze[i][j] = 0         
\ No newline at end of file
+        super().remove_walls_instantly()
+        self.chunks.clear()
+        self.static_dirty = True
+
+    def close(self):
+        """
+        Stop drawing chunks ahead of time once the maze is no longer shown.
+        """
+        self.chunks.close()
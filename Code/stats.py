@@ -0,0 +1,257 @@
+"""
+Author: Agilan Hariharan
+Description: Persistent run statistics and high scores for Graveyard Shift
+Creation Date: October 18, 2026
+Last Modified: October 18, 2026
+
+Every level start and finish is appended to an event log in an SQLite
+database in WAL mode. The game only puts events on a queue; a background
+thread writes them in batches, one transaction per batch, so a slow disk
+never holds up a frame. Leaderboards and death heatmaps are read through
+their own connection, which WAL lets run alongside the writer.
+
+The database is stats.db in the working directory. Set GS_STATS to another
+file name, or to 0 to keep nothing.
+
+Usage:
+    python Code/stats.py --level 1
+    python Code/stats.py --level 3 --top 20 --heatmap level3-deaths.png
+"""
+# Import and Initialize
+import argparse
+import os
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+
+STATS_PATH = "stats.db"
+# Events written in one transaction at most, and the longest an event waits
+# in the queue before it is written
+BATCH_SIZE = 256
+FLUSH_INTERVAL = 1.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    created REAL NOT NULL,
+    session TEXT NOT NULL,
+    level TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    time_left INTEGER,
+    moves INTEGER,
+    x INTEGER,
+    y INTEGER,
+    seed INTEGER
+);
+CREATE INDEX IF NOT EXISTS events_leaderboard ON events (level, kind, time_left DESC, moves);
+CREATE INDEX IF NOT EXISTS events_deaths ON events (level, kind, x, y);
+"""
+INSERT = ("INSERT INTO events (created, session, level, kind, time_left, moves, x, y, seed) "
+          "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)")
+
+# Event kinds: a level was started, or it ended in one of the game's outcomes
+KINDS = ("start", "win", "spike", "timeout")
+
+
+def connect(path):
+    """
+    Open the database in WAL mode and make sure the tables exist.
+    """
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA journal_mode=WAL")
+    # In WAL mode a crash can only lose the last transactions, never corrupt the file
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+class StatsStore:
+    """
+    Class representing the run statistics database and its background writer.
+    """
+    def __init__(self, path=STATS_PATH, batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL):
+        """
+        Initialize the StatsStore object and start the writer thread.
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.session = uuid.uuid4().hex
+        self.queue = queue.Queue()
+        self.reader = None
+        self.written = 0
+        self.batches = 0
+        self.errors = 0
+        # Set by the writer once it has tried to open the database, and whether
+        # that worked and the tables exist
+        self.ready = threading.Event()
+        self.opened = False
+        self.writer = threading.Thread(target=self.run, name="stats-writer", daemon=True)
+        self.writer.start()
+
+    def record(self, level, kind, time_left=None, moves=None, position=None, seed=None):
+        """
+        Queue one event. Never blocks on the disk.
+        """
+        x, y = position if position is not None else (None, None)
+        self.queue.put((time.time(), self.session, str(level), kind, time_left, moves, x, y, seed))
+
+    def record_finish(self, game, seed=None):
+        """
+        Queue the outcome of a finished game, with the cell the player died on
+        or stood on when time ran out.
+        """
+        position = game.death_position if game.outcome == "spike" else game.player_position
+        self.record(game.level, game.outcome, game.timer.time_left, game.moves, position, seed)
+
+    def run(self):
+        """
+        Write queued events in batches until a None is queued. Opening the
+        database happens here too, so the game never waits on the disk.
+        """
+        try:
+            connection = connect(self.path)
+        except sqlite3.Error:
+            connection = None
+        self.opened = connection is not None
+        self.ready.set()
+        running = True
+        while running:
+            event = self.queue.get()
+            if event is None:
+                self.queue.task_done()
+                break
+            batch = [event]
+            # Gather more events until the batch is full or has waited long enough
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    event = self.queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if event is None:
+                    self.queue.task_done()
+                    running = False
+                    break
+                batch.append(event)
+            try:
+                if connection is None:
+                    raise sqlite3.OperationalError(f"Could not open {self.path}")
+                with connection:
+                    connection.executemany(INSERT, batch)
+                self.written += len(batch)
+                self.batches += 1
+            except sqlite3.Error:
+                # Statistics are not worth stopping the game for
+                self.errors += 1
+            for _ in batch:
+                self.queue.task_done()
+        if connection is not None:
+            connection.close()
+
+    def flush(self):
+        """
+        Wait until every queued event has been written. Does nothing once the
+        writer has stopped, since nothing would take the events off the queue.
+        """
+        if self.writer.is_alive():
+            self.queue.join()
+
+    def close(self):
+        """
+        Write the remaining events and stop the writer thread.
+        """
+        self.queue.put(None)
+        self.writer.join()
+        if self.reader is not None:
+            self.reader.close()
+            self.reader = None
+
+    def query(self, sql, parameters=()):
+        """
+        Run a read-only query on the reader connection and return its rows.
+        Returns no rows if the database could not be opened.
+        """
+        if self.reader is None:
+            # The writer creates the tables before the first read
+            self.ready.wait()
+            if not self.opened:
+                return []
+            self.reader = sqlite3.connect(self.path)
+        return self.reader.execute(sql, parameters).fetchall()
+
+    def leaderboard(self, level, limit=10):
+        """
+        Return the best wins of a level as (time_left, moves, created) rows,
+        most time left first and fewest moves breaking ties.
+        """
+        return self.query("SELECT time_left, moves, created FROM events WHERE level = ? AND kind = 'win' "
+                          "ORDER BY time_left DESC, moves LIMIT ?", (str(level), limit))
+
+    def death_heatmap(self, level, kind="spike"):
+        """
+        Return a dictionary mapping (x, y) to the number of deaths of a kind on that cell.
+        """
+        rows = self.query("SELECT x, y, COUNT(*) FROM events WHERE level = ? AND kind = ? AND x IS NOT NULL "
+                          "GROUP BY x, y", (str(level), kind))
+        return {(x, y): count for x, y, count in rows}
+
+    def summary(self, level):
+        """
+        Return a dictionary of event counts of a level by kind.
+        """
+        rows = self.query("SELECT kind, COUNT(*) FROM events WHERE level = ? GROUP BY kind", (str(level),))
+        counts = dict.fromkeys(KINDS, 0)
+        counts.update(rows)
+        return counts
+
+
+def open_from_environment():
+    """
+    Return a StatsStore for the file named by GS_STATS (stats.db by default),
+    or None if GS_STATS is 0.
+    """
+    path = os.environ.get("GS_STATS", STATS_PATH)
+    if path in ("", "0"):
+        return None
+    return StatsStore(path)
+
+
+def main(argv=None):
+    """
+    Print the leaderboard and deadliest cells of a level from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Show Graveyard Shift statistics and high scores.")
+    parser.add_argument("--level", default="1")
+    parser.add_argument("--database", default=os.environ.get("GS_STATS", STATS_PATH))
+    parser.add_argument("--top", type=int, default=10, help="leaderboard entries and cells to show")
+    parser.add_argument("--heatmap", metavar="PNG", help="write the spike deaths of the level as an image")
+    args = parser.parse_args(argv)
+
+    store = StatsStore(args.database)
+    store.ready.wait()
+    if not store.opened:
+        parser.error(f"Could not open {args.database}")
+    level = int(args.level) if args.level.isdigit() else args.level
+    counts = store.summary(level)
+    print(f"Level {level}: " + ", ".join(f"{count} {kind}" for kind, count in counts.items()))
+    print("Leaderboard:")
+    for rank, (time_left, moves, created) in enumerate(store.leaderboard(level, args.top), start=1):
+        when = time.strftime("%Y-%m-%d %H:%M", time.localtime(created))
+        print(f"  {rank:2}. {time_left:3}s left, {moves:4} moves  ({when})")
+
+    deaths = store.death_heatmap(level)
+    if deaths:
+        cells = sorted(deaths.items(), key=lambda item: -item[1])[:args.top]
+        print("Deadliest cells: " + ", ".join(f"{cell} x{count}" for cell, count in cells))
+    if args.heatmap:
+        from difficulty import write_heatmap_image
+        write_heatmap_image(args.heatmap, level, deaths)
+        print(f"Heatmap written to {args.heatmap}")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,425 @@
+"""
+Author: Agilan Hariharan
+Description: Vectorized multi-game environment for bots and agents in Graveyard Shift
+Creation Date: October 18, 2026
+Last Modified: October 18, 2026
+
+VectorEnv steps N independent games of one level at once. Every piece of
+state (grids, player positions, timers, spike expiry times, outcomes) lives
+in NumPy arrays, and each rule of GameCore.move_player and GameCore.update is
+applied to all games with array operations:
+
+  * an action moves the player, or wins or loses the game like move_player
+  * the countdown loses a second for every whole 1000 ms that has passed
+  * every spawn interval a wave of spikes lands on empty cells, skipping any
+    cell that would cut the player off from the exit
+  * spikes disappear once their duration is over
+
+Actions are 0 for "wait" and 1-4 for left, right, up and down. Games that
+finish are reset at the end of the step, and the outcome they ended with is
+reported in info["outcome"]. ShardedVectorEnv splits the games across worker
+processes with the same interface.
+
+Usage:
+    python Code/vecenv.py --level 1 --envs 1024 --steps 2000
+    python Code/vecenv.py --level 3 --envs 4096 --steps 500 --shards 4
+"""
+# Import and Initialize
+import argparse
+import multiprocessing
+import time
+import numpy as np
+from core import DIRECTIONS
+from levels import EMPTY, WALL, EXIT, PLAYER, SPIKE, load_level_data
+
+OUTCOMES = (None, "win", "spike", "timeout")
+WIN, SPIKED, TIMEOUT = 1, 2, 3
+REWARDS = np.array([0.0, 1.0, -1.0, -1.0], dtype=np.float32)
+
+# Action 0 waits, actions 1-4 follow the order of core.DIRECTIONS
+ACTION_DX = np.array([0] + [dx for dx, dy in DIRECTIONS.values()], dtype=np.int64)
+ACTION_DY = np.array([0] + [dy for dx, dy in DIRECTIONS.values()], dtype=np.int64)
+
+NEVER = np.iinfo(np.int64).max
+
+
+def exit_distances(passable, exits, xs, ys):
+    """
+    Return the BFS distance from tiles to the nearest exit for a stack of
+    grids, or -1 where the exit cannot be reached. Both arrays are (k, H, W)
+    booleans whose outer ring is never passable.
+
+    The search stops once every (x, y) start tile has been reached, so only
+    tiles closer to the exit than the start are filled in; that is all a
+    reachability check or a path from the start needs.
+    """
+    distance = np.full(passable.shape, -1, dtype=np.int32)
+    frontier = exits & passable
+    distance[frontier] = 0
+    unvisited = passable & ~frontier
+    rows = np.arange(len(xs))
+    step = 0
+    while frontier.any() and (distance[rows, ys, xs] < 0).any():
+        step += 1
+        grown = np.zeros_like(frontier)
+        grown[:, 1:, :] |= frontier[:, :-1, :]
+        grown[:, :-1, :] |= frontier[:, 1:, :]
+        grown[:, :, 1:] |= frontier[:, :, :-1]
+        grown[:, :, :-1] |= frontier[:, :, 1:]
+        grown &= unvisited
+        unvisited &= ~grown
+        distance[grown] = step
+        frontier = grown
+    return distance
+
+
+def path_mask(distance, xs, ys):
+    """
+    Return a (k, H, W) mask of one shortest path from each (x, y) to the exit,
+    following the distances down. Games whose exit is unreachable get an empty mask.
+    """
+    count = len(xs)
+    mask = np.zeros(distance.shape, dtype=bool)
+    rows = np.arange(count)
+    xs = xs.copy()
+    ys = ys.copy()
+    current = distance[rows, ys, xs].astype(np.int64)
+    reachable = current >= 0
+    mask[rows[reachable], ys[reachable], xs[reachable]] = True
+
+    active = current > 0
+    while active.any():
+        r = rows[active]
+        x, y, d = xs[active], ys[active], current[active]
+        next_x, next_y = x.copy(), y.copy()
+        found = np.zeros(len(r), dtype=bool)
+        for dx, dy in DIRECTIONS.values():
+            step_here = ~found & (distance[r, y + dy, x + dx] == d - 1)
+            next_x[step_here] = x[step_here] + dx
+            next_y[step_here] = y[step_here] + dy
+            found |= step_here
+        xs[active], ys[active] = next_x, next_y
+        current[active] = d - 1
+        mask[r, next_y, next_x] = True
+        active = current > 0
+    return mask
+
+
+class VectorEnv:
+    """
+    Class representing N games of the same level stepped together.
+    """
+    def __init__(self, level, num_envs, seed=0, step_ms=250):
+        """
+        Initialize the VectorEnv object. step_ms is the game time that passes
+        on every step, like --move-ms in batch.py.
+        """
+        level_data = load_level_data(level)
+        settings = level_data.settings
+        self.level = level
+        self.num_envs = num_envs
+        self.step_ms = step_ms
+        self.rng = np.random.default_rng(seed)
+        self.num_spikes = settings["num_spikes"]
+        self.spawn_interval = settings["spawn_interval"]
+        self.spike_duration = settings["spike_duration"]
+        self.time_limit = settings["time_limit"]
+
+        # The template is padded with a ring of walls so neighbour lookups never
+        # leave the array; positions below are in padded coordinates
+        template = level_data.grid("numpy")
+        self.height, self.width = template.shape
+        self.template = np.pad(template, 1, constant_values=WALL)
+        start = level_data.position_of(PLAYER) or (1, 1)
+        self.start = (start[0] + 1, start[1] + 1)
+        self.exits = self.template == EXIT
+
+        shape = (num_envs,) + self.template.shape
+        self.grids = np.empty(shape, dtype=np.uint8)
+        self.spike_due = np.empty(shape, dtype=np.int64)
+        self.player_x = np.empty(num_envs, dtype=np.int64)
+        self.player_y = np.empty(num_envs, dtype=np.int64)
+        self.time_left = np.empty(num_envs, dtype=np.int64)
+        self.last_time_update = np.empty(num_envs, dtype=np.int64)
+        self.spawn_timer = np.empty(num_envs, dtype=np.int64)
+        self.moves = np.empty(num_envs, dtype=np.int64)
+        self.outcome = np.empty(num_envs, dtype=np.int8)
+        self.next_expiry = NEVER
+        self.now = 0
+        self.steps = 0
+        self.reset()
+
+    def reset(self, ids=None):
+        """
+        Restart the given games (all of them by default) and return the observation.
+        """
+        if ids is None:
+            ids = np.arange(self.num_envs)
+        self.grids[ids] = self.template
+        self.spike_due[ids] = NEVER
+        self.player_x[ids], self.player_y[ids] = self.start
+        self.time_left[ids] = self.time_limit
+        self.last_time_update[ids] = self.now
+        self.spawn_timer[ids] = self.now
+        self.moves[ids] = 0
+        self.outcome[ids] = 0
+        return self.observe()
+
+    def observe(self):
+        """
+        Return the observation arrays. They are reused between steps, so copy
+        anything that must be kept.
+        """
+        return {
+            "grid": self.grids[:, 1:-1, 1:-1],
+            "player": np.stack([self.player_x - 1, self.player_y - 1], axis=1),
+            "time_left": self.time_left,
+        }
+
+    def move_players(self, actions):
+        """
+        Apply one action per game, following GameCore.move_player.
+        """
+        ids = np.nonzero(actions > 0)[0]
+        if not len(ids):
+            return
+        acting = actions[ids]
+        self.moves[ids] += 1
+        x, y = self.player_x[ids], self.player_y[ids]
+        new_x, new_y = x + ACTION_DX[acting], y + ACTION_DY[acting]
+        block = self.grids[ids, new_y, new_x]
+
+        step = block == EMPTY
+        moved = ids[step]
+        self.grids[moved, y[step], x[step]] = EMPTY
+        self.grids[moved, new_y[step], new_x[step]] = PLAYER
+        self.player_x[moved], self.player_y[moved] = new_x[step], new_y[step]
+
+        self.outcome[ids[block == EXIT]] = WIN
+        self.outcome[ids[block == SPIKE]] = SPIKED
+
+    def generate_spikes(self, ids):
+        """
+        Place a wave of spikes in each of the given games. Like
+        GameCore.generate_spikes, a cell that would cut the player off from the
+        exit is rejected and another one drawn instead.
+        """
+        grids = self.grids[ids]
+        count = len(ids)
+        rows = np.arange(count)
+        xs, ys = self.player_x[ids], self.player_y[ids]
+        exits = np.broadcast_to(self.exits, grids.shape)
+
+        distance = exit_distances((grids != WALL) & (grids != SPIKE), exits, xs, ys)
+        keep_solvable = distance[rows, ys, xs] >= 0
+        on_path = path_mask(distance, xs, ys)
+        rejected = np.zeros(grids.shape, dtype=bool)
+        placed = np.zeros(count, dtype=np.int64)
+        new_spikes = np.zeros(grids.shape, dtype=bool)
+
+        flat_size = grids.shape[1] * grids.shape[2]
+        while True:
+            candidates = ((grids == EMPTY) & ~rejected).reshape(count, flat_size)
+            available = candidates.sum(axis=1)
+            wanting = np.nonzero((placed < self.num_spikes) & (available > 0))[0]
+            if not len(wanting):
+                break
+
+            # Draw one empty cell per game uniformly at random
+            picks = (self.rng.random(len(wanting)) * available[wanting]).astype(np.int64)
+            cells = np.argmax(np.cumsum(candidates[wanting], axis=1) > picks[:, None], axis=1)
+            cy, cx = np.divmod(cells, grids.shape[2])
+
+            # A cell off the current path can never block it
+            risky = keep_solvable[wanting] & on_path[wanting, cy, cx]
+            safe = wanting[~risky]
+            grids[safe, cy[~risky], cx[~risky]] = SPIKE
+            new_spikes[safe, cy[~risky], cx[~risky]] = True
+            placed[safe] += 1
+
+            check = wanting[risky]
+            if len(check):
+                rx, ry = cx[risky], cy[risky]
+                grids[check, ry, rx] = SPIKE
+                trial = grids[check]
+                trial_distance = exit_distances((trial != WALL) & (trial != SPIKE), exits[:len(check)], xs[check], ys[check])
+                ok = trial_distance[np.arange(len(check)), ys[check], xs[check]] >= 0
+
+                grids[check[~ok], ry[~ok], rx[~ok]] = EMPTY
+                rejected[check[~ok], ry[~ok], rx[~ok]] = True
+
+                kept = check[ok]
+                new_spikes[kept, ry[ok], rx[ok]] = True
+                placed[kept] += 1
+                if len(kept):
+                    on_path[kept] = path_mask(trial_distance[ok], xs[kept], ys[kept])
+
+        self.grids[ids] = grids
+        due = self.now + self.spike_duration
+        self.spike_due[ids] = np.where(new_spikes, due, self.spike_due[ids])
+        self.next_expiry = min(self.next_expiry, due)
+
+    def expire_spikes(self):
+        """
+        Clear every spike whose duration is over.
+        """
+        expired = self.spike_due <= self.now
+        self.grids[expired & (self.grids == SPIKE)] = EMPTY
+        self.spike_due[expired] = NEVER
+        self.next_expiry = int(self.spike_due.min()) if self.spike_due.size else NEVER
+
+    def update(self):
+        """
+        Advance the countdown, spawn spikes and expire old ones, following GameCore.update.
+        """
+        now = self.now
+        playing = self.outcome == 0
+
+        seconds = np.where(playing, (now - self.last_time_update) // 1000, 0)
+        self.time_left -= seconds
+        self.last_time_update += seconds * 1000
+
+        spawning = np.nonzero(playing & (now - self.spawn_timer >= self.spawn_interval))[0]
+        if len(spawning):
+            self.generate_spikes(spawning)
+            self.spawn_timer[spawning] = now
+
+        if now >= self.next_expiry:
+            self.expire_spikes()
+
+        self.outcome[(self.outcome == 0) & (self.time_left <= 0)] = TIMEOUT
+
+    def step(self, actions):
+        """
+        Apply one action per game, advance game time by step_ms and return
+        (observation, rewards, dones, info). Finished games are reset.
+        """
+        actions = np.asarray(actions, dtype=np.int64)
+        self.move_players(actions)
+        self.now += self.step_ms
+        self.steps += 1
+        self.update()
+
+        outcome = self.outcome.copy()
+        dones = outcome > 0
+        info = {"outcome": outcome, "moves": self.moves.copy(), "time_left": self.time_left.copy()}
+        if dones.any():
+            self.reset(np.nonzero(dones)[0])
+        return self.observe(), REWARDS[outcome], dones, info
+
+
+def shard_worker(connection, level, num_envs, seed, step_ms):
+    """
+    Run a VectorEnv in a worker process, answering commands from the pipe.
+    """
+    env = VectorEnv(level, num_envs, seed, step_ms)
+    while True:
+        command, data = connection.recv()
+        if command == "step":
+            connection.send(env.step(data))
+        elif command == "reset":
+            connection.send(env.reset())
+        else:
+            break
+    connection.close()
+
+
+class ShardedVectorEnv:
+    """
+    Class representing a VectorEnv split across worker processes.
+    """
+    def __init__(self, level, num_envs, shards, seed=0, step_ms=250):
+        """
+        Initialize the ShardedVectorEnv object. Shard i is seeded with seed + i.
+        """
+        self.num_envs = num_envs
+        sizes = [num_envs // shards + (1 if i < num_envs % shards else 0) for i in range(shards)]
+        self.bounds = np.cumsum([0] + sizes)
+        self.connections = []
+        self.processes = []
+        for i, size in enumerate(sizes):
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=shard_worker, args=(child, level, size, seed + i, step_ms), daemon=True)
+            process.start()
+            self.connections.append(parent)
+            self.processes.append(process)
+
+    def gather(self):
+        """
+        Collect one reply from every shard.
+        """
+        return [connection.recv() for connection in self.connections]
+
+    def reset(self):
+        """
+        Restart every game and return the combined observation.
+        """
+        for connection in self.connections:
+            connection.send(("reset", None))
+        return merge_observations(self.gather())
+
+    def step(self, actions):
+        """
+        Step every shard in parallel and combine the results.
+        """
+        actions = np.asarray(actions, dtype=np.int64)
+        for i, connection in enumerate(self.connections):
+            connection.send(("step", actions[self.bounds[i]:self.bounds[i + 1]]))
+        results = self.gather()
+        observations, rewards, dones, infos = zip(*results)
+        info = {key: np.concatenate([part[key] for part in infos]) for key in infos[0]}
+        return merge_observations(observations), np.concatenate(rewards), np.concatenate(dones), info
+
+    def close(self):
+        """
+        Stop the worker processes.
+        """
+        for connection in self.connections:
+            connection.send(("close", None))
+        for process in self.processes:
+            process.join()
+
+
+def merge_observations(observations):
+    """
+    Concatenate per-shard observation dictionaries.
+    """
+    return {key: np.concatenate([part[key] for part in observations]) for key in observations[0]}
+
+
+def main(argv=None):
+    """
+    Step random actions through a batch of games and report the throughput.
+    """
+    parser = argparse.ArgumentParser(description="Step many Graveyard Shift games at once.")
+    parser.add_argument("--level", type=int, default=1)
+    parser.add_argument("--envs", type=int, default=1024)
+    parser.add_argument("--steps", type=int, default=1000)
+    parser.add_argument("--shards", type=int, default=1, help="worker processes; 1 runs in this process")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--step-ms", type=int, default=250, help="game milliseconds per step")
+    args = parser.parse_args(argv)
+
+    if args.shards > 1:
+        env = ShardedVectorEnv(args.level, args.envs, args.shards, args.seed, args.step_ms)
+    else:
+        env = VectorEnv(args.level, args.envs, args.seed, args.step_ms)
+    env.reset()
+    rng = np.random.default_rng(args.seed)
+    totals = np.zeros(len(OUTCOMES), dtype=np.int64)
+
+    start = time.perf_counter()
+    for _ in range(args.steps):
+        _, _, dones, info = env.step(rng.integers(0, 5, args.envs))
+        totals += np.bincount(info["outcome"][dones], minlength=len(OUTCOMES))
+    elapsed = time.perf_counter() - start
+    if args.shards > 1:
+        env.close()
+
+    env_steps = args.envs * args.steps
+    print(f"{env_steps} steps in {elapsed:.2f}s: {env_steps / elapsed:,.0f} steps/s, {env_steps / elapsed * 60:,.0f} steps/min")
+    print(f"finished games: {totals[WIN]} wins, {totals[SPIKED]} spike deaths, {totals[TIMEOUT]} timeouts")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""
+Author: Agilan Hariharan
+Description: Scrolling camera and chunked maze surfaces for Graveyard Shift
+Creation Date: October 18, 2026
+Last Modified: October 18, 2026
+
+A maze larger than the screen is drawn through a Viewport, a camera that
+follows the player inside a dead zone. Its static tiles are split into
+square chunks that are drawn on first use and kept in a ChunkCache with
+least-recently-used eviction, so a frame only touches the handful of chunks
+on screen however large the maze is. The cache can also draw the chunks
+around the view on a worker thread before the camera reaches them.
+"""
+# Import and Initialize
+import threading
+from collections import OrderedDict, deque
+import pygame
+
+# Tiles along each side of a chunk
+CHUNK_TILES = 16
+# Chunks kept in memory; comfortably more than fit on one screen
+CHUNK_CAPACITY = 64
+# Fraction of the view on each side that the player can cross before the camera moves
+DEAD_ZONE = 0.3
+
+
+class Viewport:
+    """
+    Class representing the part of the world shown in a rectangle of the screen.
+    """
+    def __init__(self, view, world_size, dead_zone=DEAD_ZONE):
+        """
+        Initialize the Viewport object. view is the screen Rect the world is
+        drawn into and world_size the size of the whole maze in pixels.
+        """
+        self.view = pygame.Rect(view)
+        self.world_width, self.world_height = world_size
+        self.dead_zone = dead_zone
+        self.x = 0
+        self.y = 0
+        self.clamp()
+
+    def scrolls(self):
+        """
+        Check if the world is larger than the view, so the camera can move.
+        """
+        return self.world_width > self.view.width or self.world_height > self.view.height
+
+    def clamp(self):
+        """
+        Keep the camera inside the world. A world narrower or shorter than the
+        view is pinned to the left and bottom edges of the view.
+        """
+        view = self.view
+        if self.world_width <= view.width:
+            self.x = 0
+        else:
+            self.x = max(0, min(self.x, self.world_width - view.width))
+        if self.world_height <= view.height:
+            self.y = self.world_height - view.height
+        else:
+            self.y = max(0, min(self.y, self.world_height - view.height))
+
+    def follow(self, rect):
+        """
+        Move the camera just enough to keep a world Rect out of the edges of the
+        view. Returns True if the camera moved.
+        """
+        view = self.view
+        margin_x = int(view.width * self.dead_zone)
+        margin_y = int(view.height * self.dead_zone)
+        old = (self.x, self.y)
+        if rect.left < self.x + margin_x:
+            self.x = rect.left - margin_x
+        elif rect.right > self.x + view.width - margin_x:
+            self.x = rect.right - view.width + margin_x
+        if rect.top < self.y + margin_y:
+            self.y = rect.top - margin_y
+        elif rect.bottom > self.y + view.height - margin_y:
+            self.y = rect.bottom - view.height + margin_y
+        self.clamp()
+        return (self.x, self.y) != old
+
+    def center_on(self, rect):
+        """
+        Put a world Rect in the middle of the view.
+        """
+        self.x = rect.centerx - self.view.width // 2
+        self.y = rect.centery - self.view.height // 2
+        self.clamp()
+
+    def world_rect(self):
+        """
+        Return the part of the world that is visible.
+        """
+        return pygame.Rect(self.x, self.y, self.view.width, self.view.height)
+
+    def to_screen(self, rect):
+        """
+        Return a world Rect moved to where it appears on the screen.
+        """
+        return rect.move(self.view.x - self.x, self.view.y - self.y)
+
+    def visible_chunks(self, chunk_size, margin=0):
+        """
+        Return the (column, row) of every chunk that overlaps the view, widened
+        by margin chunks on each side.
+        """
+        left = max(0, self.x // chunk_size - margin)
+        top = max(0, self.y // chunk_size - margin)
+        right = min((self.world_width - 1) // chunk_size, (self.x + self.view.width - 1) // chunk_size + margin)
+        bottom = min((self.world_height - 1) // chunk_size, (self.y + self.view.height - 1) // chunk_size + margin)
+        return [(column, row) for row in range(top, bottom + 1) for column in range(left, right + 1)]
+
+
+class ChunkCache:
+    """
+    Class representing pre-drawn chunk surfaces with least-recently-used eviction.
+    """
+    def __init__(self, draw_chunk, capacity=CHUNK_CAPACITY, threaded=False):
+        """
+        Initialize the ChunkCache object. draw_chunk(column, row) returns a new
+        Surface and must only read state that does not change while the cache
+        is in use. threaded starts a worker that draws prefetched chunks, so
+        draw_chunk must not load assets either; pass it loaded surfaces.
+        """
+        self.draw_chunk = draw_chunk
+        self.capacity = capacity
+        self.chunks = OrderedDict()
+        self.lock = threading.Lock()
+        self.wanted = deque()
+        self.pending = set()
+        self.ready = threading.Condition(self.lock)
+        # Results drawn before the last clear() are thrown away
+        self.generation = 0
+        self.closed = False
+        self.hits = 0
+        self.misses = 0
+        self.prefetched = 0
+        self.worker = None
+        if threaded:
+            self.worker = threading.Thread(target=self.run, name="chunk-cache", daemon=True)
+            self.worker.start()
+
+    def store(self, key, surface):
+        """
+        Add a chunk and evict the least recently used ones past the capacity.
+        Must be called with the lock held.
+        """
+        self.chunks[key] = surface
+        self.chunks.move_to_end(key)
+        while len(self.chunks) > self.capacity:
+            self.chunks.popitem(last=False)
+
+    def get(self, key):
+        """
+        Return the surface of a chunk, drawing it now if it is not cached.
+        """
+        with self.lock:
+            surface = self.chunks.get(key)
+            if surface is not None:
+                self.chunks.move_to_end(key)
+                self.hits += 1
+                return surface
+            self.misses += 1
+            generation = self.generation
+        surface = self.draw_chunk(*key)
+        with self.lock:
+            if generation == self.generation:
+                self.store(key, surface)
+        return surface
+
+    def prefetch(self, keys):
+        """
+        Ask the worker to draw chunks that are about to come into view. Does
+        nothing without a worker.
+        """
+        if self.worker is None:
+            return
+        with self.lock:
+            for key in keys:
+                if key not in self.chunks and key not in self.pending:
+                    self.pending.add(key)
+                    self.wanted.append(key)
+            if self.wanted:
+                self.ready.notify()
+
+    def run(self):
+        """
+        Draw prefetched chunks until the cache is closed.
+        """
+        while True:
+            with self.lock:
+                while not self.wanted and not self.closed:
+                    self.ready.wait()
+                if self.closed:
+                    return
+                key = self.wanted.popleft()
+                generation = self.generation
+                if key in self.chunks:
+                    self.pending.discard(key)
+                    continue
+            surface = self.draw_chunk(*key)
+            with self.lock:
+                self.pending.discard(key)
+                if generation == self.generation and key not in self.chunks:
+                    self.store(key, surface)
+                    self.prefetched += 1
+
+    def clear(self):
+        """
+        Forget every chunk, for example after the tiles changed.
+        """
+        with self.lock:
+            self.chunks.clear()
+            self.wanted.clear()
+            self.pending.clear()
+            self.generation += 1
+
+    def close(self):
+        """
+        Stop the worker once it finishes the chunk it is drawing.
+        """
+        with self.lock:
+            self.closed = True
+            self.wanted.clear()
+            self.ready.notify()
+
+    def stats(self):
+        """
+        Return the hit, miss and prefetch counters and the number of cached chunks.
+        """
+        with self.lock:
+            return {"chunks": len(self.chunks), "hits": self.hits, "misses": self.misses, "prefetched": self.prefetched}
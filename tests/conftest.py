@@ -0,0 +1,24 @@
+"""
+Shared setup for the Graveyard Shift tests.
+
+The game modules live flat in Code/ and open their assets and levels relative
+to the repository root, so both are set up here for every test.
+"""
+# Import and Initialize
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "Code"))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+@pytest.fixture(autouse=True)
+def repo_root(monkeypatch):
+    """
+    Run every test from the repository root.
+    """
+    monkeypatch.chdir(ROOT)
@@ -0,0 +1,36 @@
+"""
+Tests for the shared asset cache.
+"""
+# Import and Initialize
+import pygame
+
+from assets import AssetCache
+
+
+def test_loader_runs_once_per_key():
+    cache = AssetCache()
+    calls = []
+    first = cache.get("key", lambda: calls.append(1) or object())
+    assert cache.get("key", lambda: calls.append(1) or object()) is first
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = AssetCache(max_entries=2)
+    cache.get("a", object)
+    cache.get("b", object)
+    cache.get("a", object)
+    cache.get("c", object)
+    assert list(cache.entries) == ["a", "c"]
+
+
+def test_images_are_shared_per_size():
+    pygame.display.init()
+    pygame.display.set_mode((32, 32))
+    cache = AssetCache()
+    image = cache.image("Images/spike.png", (16, 16), alpha=True)
+    assert cache.image("Images/spike.png", (16, 16), alpha=True) is image
+    assert image.get_size() == (16, 16)
+    assert cache.image("Images/spike.png", (8, 8), alpha=True).get_size() == (8, 8)
+    pygame.display.quit()
@@ -0,0 +1,95 @@
+"""
+Tests for the display-free game rules.
+"""
+# Import and Initialize
+import random
+
+import pytest
+
+import levels
+from core import Countdown, GameCore, ManualClock
+from levelfile import from_rows
+from levels import EMPTY, WALL, EXIT, PLAYER, SPIKE
+
+ROWS = [
+    [WALL, WALL, WALL, WALL, WALL],
+    [WALL, PLAYER, EMPTY, EXIT, WALL],
+    [WALL, EMPTY, EMPTY, EMPTY, WALL],
+    [WALL, WALL, WALL, WALL, WALL],
+]
+
+
+@pytest.fixture
+def game(monkeypatch):
+    """
+    Return a game of a small level with no spike waves, on a manual clock.
+    """
+    settings = {"num_spikes": 2, "spawn_interval": 10 ** 9, "spike_duration": 2000, "time_limit": 10}
+    monkeypatch.setitem(levels.LOADED_LEVELS, "test", from_rows(ROWS, settings))
+    return GameCore("test", ManualClock(), rng=random.Random(1))
+
+
+def test_step_moves_the_player(game):
+    game.move_player("down")
+    assert game.player_position == (1, 2)
+    assert game.maze[2][1] == PLAYER and game.maze[1][1] == EMPTY
+    assert (1, 1) in game.free_cells and (1, 2) not in game.free_cells
+    assert game.moves == 1
+    assert game.outcome is None
+
+
+def test_walls_and_unknown_directions_block(game):
+    game.move_player("up")
+    game.move_player("left")
+    game.move_player("sideways")
+    assert game.player_position == (1, 1)
+    assert game.moves == 2
+
+
+def test_reaching_the_exit_wins(game):
+    game.move_player("right")
+    game.move_player("right")
+    assert game.outcome == "win"
+    assert not any(WALL in row for row in game.maze)
+    assert game.paths.distance_to_exit(0, 0) == 4
+
+
+def test_running_into_a_spike_loses(game):
+    game.place_spike(2, 1)
+    game.move_player("right")
+    assert game.outcome == "spike"
+    assert game.death_position == (2, 1)
+    assert game.player_position == (1, 1)
+
+
+def test_time_running_out_loses(game):
+    for _ in range(9):
+        game.clock.advance(1000)
+        game.update()
+    assert game.outcome is None
+    game.clock.advance(1000)
+    game.update()
+    assert game.outcome == "timeout"
+
+
+def test_spike_wave_leaves_the_exit_reachable_and_expires(game):
+    game.generate_spikes()
+    assert len(game.spikes) == 2
+    assert game.paths.reachable(*game.player_position)
+    for x, y in game.spikes:
+        assert game.maze[y][x] == SPIKE and (x, y) not in game.free_cells
+
+    game.clock.advance(game.spikes_duration)
+    game.update()
+    assert not game.spikes
+    assert not any(SPIKE in row for row in game.maze)
+
+
+def test_countdown_carries_leftover_milliseconds():
+    clock = ManualClock()
+    timer = Countdown(clock, 3)
+    clock.advance(1500)
+    timer.update()
+    clock.advance(600)
+    timer.update()
+    assert timer.time_left == 1
@@ -0,0 +1,57 @@
+"""
+Tests for the text and binary level file formats.
+"""
+# Import and Initialize
+import pytest
+
+import levels
+from levelfile import HEADER, read_binary, read_text, write_binary, write_text
+
+
+def same_level(first, second):
+    """
+    Check that two LevelData hold the same size, tiles and settings.
+    """
+    return ((first.width, first.height, bytes(first.tile_bytes()), first.settings)
+            == (second.width, second.height, bytes(second.tile_bytes()), second.settings))
+
+
+@pytest.mark.parametrize("level", [1, 2, 3])
+def test_text_and_binary_round_trip(tmp_path, level):
+    text = read_text(f"Levels/level{level}.lvl")
+    write_binary(text, str(tmp_path / "level.lvb"))
+    binary = read_binary(str(tmp_path / "level.lvb"))
+    write_text(binary, str(tmp_path / "level.lvl"))
+    assert same_level(text, binary)
+    assert same_level(text, read_text(str(tmp_path / "level.lvl")))
+    shipped = read_binary(f"Levels/level{level}.lvb")
+    assert same_level(text, shipped)
+    binary.close()
+    shipped.close()
+
+
+def test_corrupted_tile_is_rejected(tmp_path):
+    path = tmp_path / "level.lvb"
+    write_binary(read_text("Levels/level1.lvl"), str(path))
+    data = bytearray(path.read_bytes())
+    data[HEADER.size + 5] ^= 1
+    path.write_bytes(data)
+    with pytest.raises(ValueError, match="checksum mismatch"):
+        read_binary(str(path))
+
+
+def test_truncated_file_is_rejected(tmp_path):
+    path = tmp_path / "level.lvb"
+    write_binary(read_text("Levels/level1.lvl"), str(path))
+    path.write_bytes(path.read_bytes()[:-1])
+    with pytest.raises(ValueError, match="truncated"):
+        read_binary(str(path))
+
+
+def test_unload_levels_closes_mapped_files():
+    level_data = levels.load_level_data(1)
+    grid = level_data.grid()
+    levels.unload_levels()
+    assert level_data.tiles.closed
+    assert levels.load_level_data(1) is not level_data
+    assert levels.load_level_data(1).grid() == grid
@@ -0,0 +1,74 @@
+"""
+Tests for the exit distance field and its incremental repair.
+"""
+# Import and Initialize
+import random
+
+import pytest
+
+from core import GameCore, ManualClock
+from grid import BACKENDS
+from levels import EMPTY, SPIKE
+from solver import REPAIR_LIMIT, DistanceField
+
+
+def assert_matches_rebuild(field):
+    """
+    Check the field's distances against a field computed from scratch.
+    """
+    field.refresh()
+    assert field.distance == DistanceField(field.grid).distance
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_spike_waves_keep_distances_exact(backend):
+    clock = ManualClock()
+    game = GameCore(3, clock, rng=random.Random(4), backend=backend)
+    game.spikes_spawn_interval = game.spikes_duration // 2
+    for _ in range(12):
+        clock.advance(game.spikes_spawn_interval)
+        game.update()
+        assert game.spikes
+        assert game.paths.reachable(*game.player_position)
+        assert_matches_rebuild(game.paths)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("batch", [1, 5, REPAIR_LIMIT + 1])
+def test_batched_changes_match_rebuild(backend, batch):
+    clock = ManualClock()
+    game = GameCore(2, clock, backend=backend)
+    field = game.paths
+    rng = random.Random(batch)
+    cells = [position for position in game.free_cells.cells if position != game.player_position]
+    for _ in range(20):
+        for x, y in rng.sample(cells, batch):
+            game.maze[y][x] = EMPTY if game.maze[y][x] == SPIKE else SPIKE
+            field.cell_changed(x, y)
+        assert_matches_rebuild(field)
+        assert not field.pending
+
+
+def test_unchanged_tile_is_not_repaired():
+    clock = ManualClock()
+    game = GameCore(1, clock)
+    field = game.paths
+    x, y = game.free_cells.cells[0]
+    game.maze[y][x] = SPIKE
+    field.cell_changed(x, y)
+    game.maze[y][x] = EMPTY
+    field.cell_changed(x, y)
+    before = list(field.distance)
+    field.refresh()
+    assert field.distance == before
+
+
+def test_games_of_a_level_do_not_share_fields():
+    first = GameCore(1, ManualClock())
+    second = GameCore(1, ManualClock())
+    x, y = first.free_cells.cells[0]
+    first.place_spike(x, y)
+    first.remove_walls_instantly()
+    assert_matches_rebuild(first.paths)
+    assert_matches_rebuild(second.paths)
+    assert second.maze[y][x] == EMPTY
@@ -0,0 +1,30 @@
+"""
+Tests for the run statistics database.
+"""
+# Import and Initialize
+from stats import StatsStore
+
+
+def test_events_are_written_and_read_back(tmp_path):
+    store = StatsStore(str(tmp_path / "stats.db"), flush_interval=0.01)
+    store.record(1, "start")
+    store.record(1, "win", time_left=30, moves=40)
+    store.record(1, "spike", time_left=10, moves=12, position=(3, 4))
+    store.flush()
+    assert store.opened
+    assert store.summary(1)["win"] == 1
+    assert store.leaderboard(1)[0][:2] == (30, 40)
+    assert store.death_heatmap(1) == {(3, 4): 1}
+    store.close()
+
+
+def test_unopenable_database_reads_as_empty(tmp_path):
+    store = StatsStore(str(tmp_path / "missing" / "stats.db"), flush_interval=0.01)
+    store.record(1, "win", time_left=30, moves=40)
+    store.flush()
+    assert not store.opened
+    assert store.errors == 1
+    assert store.leaderboard(1) == []
+    assert store.death_heatmap(1) == {}
+    assert set(store.summary(1).values()) == {0}
+    store.close()
@@ -0,0 +1,22 @@
+"""
+Tests for the vectorized environment.
+"""
+# Import and Initialize
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from vecenv import exit_distances
+
+
+def test_exit_distances_beyond_int16():
+    # A single corridor longer than an int16 can count
+    length = 33000
+    passable = np.zeros((1, 3, length + 2), dtype=bool)
+    passable[0, 1, 1:-1] = True
+    exits = np.zeros_like(passable)
+    exits[0, 1, 1] = True
+    xs, ys = np.array([length]), np.array([1])
+
+    distance = exit_distances(passable, exits, xs, ys)
+    assert distance[0, 1, length] == length - 1